@@ -53,12 +53,12 @@ def load_tone_data():
 
 @st.cache_resource
 def load_predictor():
-    """금리 예측 모델 로드"""
+    """금리 예측 모델 로드 (학습 데이터가 같으면 저장된 아티팩트 사용, 바뀌었으면 재학습)"""
     predictor = RatePredictor()
     try:
         df = load_tone_data()
         if df is not None:
-            predictor.train(df)
+            predictor.load_or_train(df)
         return predictor
     except Exception as e:
         st.warning(f"예측 모델 로드 실패: {e}")
@@ -1,31 +1,9 @@
-import pdfplumber
-import os
+import logging
 
-pdf_files = [
-    "data/01_minutes/pdf/minutes_2026_01.pdf",
-    "data/02_decision_statements/pdf/decision_statement_2026_01.pdf",
-    "data/03_press_conferences/opening_remarks/opening_remarks_2026_01.pdf",
-    "data/05_policy_reports/reference_2026_01.pdf"
-]
+from src.crawlers.blob_store import BlobStore
+from src.crawlers.pdf_extractor import BatchExtractor
 
-def extract_text(pdf_path, txt_path):
-    print(f"Extracting {pdf_path} -> {txt_path}")
-    try:
-        if not os.path.exists(pdf_path):
-            print(f"Skipping missing file: {pdf_path}")
-            return
-            
-        with pdfplumber.open(pdf_path) as pdf:
-            text = ""
-            for page in pdf.pages:
-                text += page.extract_text() + "\n"
-        
-        os.makedirs(os.path.dirname(txt_path), exist_ok=True)
-        with open(txt_path, "w", encoding="utf-8") as f:
-            f.write(text)
-        print("Success.")
-    except Exception as e:
-        print(f"Failed to extract {pdf_path}: {e}")
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
 # Define output paths
 mappings = {
@@ -35,5 +13,9 @@ mappings = {
     "data/05_policy_reports/reference_2026_01.pdf": "data/05_policy_reports/txt/reference_2026_01.txt"
 }
 
-for pdf, txt in mappings.items():
-    extract_text(pdf, txt)
+if __name__ == "__main__":
+    extractor = BatchExtractor(overwrite=True, blob_store=BlobStore())
+    report = extractor.run(list(mappings.items()))
+    for path in report.failures:
+        print(f"Failed to extract {path}")
+    print(f"Extracted {report.extracted}/{report.files} files, {report.pages} pages ({report.pages_per_sec:.1f} pages/sec)")
@@ -0,0 +1,139 @@
+"""
+Benchmark PDF text extraction backends on the local document tree.
+
+Samples PDFs from each data/ category and runs every installed backend on them,
+each in a fresh worker process. Reports pages/sec, peak memory of the worker
+(max RSS; on Windows the peak Python heap via tracemalloc, which misses native
+allocations) and text similarity to the pdfplumber baseline, per category.
+Similarity is the difflib ratio of whitespace-stripped page texts, weighted by
+baseline page length.
+
+Usage:
+    python scripts/benchmark_pdf_backends.py [--per-category 3] [--backends pypdfium2 pdfminer]
+"""
+import argparse
+import difflib
+import multiprocessing
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.crawlers.extraction_backends import (
+    DATA_DIR,
+    DEFAULT_BACKEND,
+    available_backends,
+    category_for_path,
+    get_backend,
+)
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def _sample_pdfs(per_category):
+    samples = []
+    for category in sorted(path for path in DATA_DIR.iterdir() if path.is_dir() and path.name[:2].isdigit()):
+        pdfs = sorted(category.rglob("*.pdf"))
+        if not pdfs:
+            continue
+        step = max(1, len(pdfs) // per_category)
+        samples.extend(pdfs[::step][:per_category])
+    return samples
+
+
+def _run_backend(name, pdf_paths):
+    """Runs in a fresh process: extract every PDF, return page texts, time and memory."""
+    backend = get_backend(name)
+    if resource is None:
+        tracemalloc.start()
+    texts, seconds, errors = {}, {}, {}
+    for path in pdf_paths:
+        start = time.perf_counter()
+        try:
+            texts[path] = backend.extract_pages(Path(path))
+        except Exception as exc:
+            errors[path] = str(exc)
+        seconds[path] = time.perf_counter() - start
+    if resource is None:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    else:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+    return texts, seconds, errors, peak
+
+
+def _similarity(pages, baseline_pages):
+    total = matched = 0.0
+    for i, base in enumerate(baseline_pages):
+        base = "".join(base.split())
+        if not base:
+            continue
+        other = "".join(pages[i].split()) if i < len(pages) else ""
+        total += len(base)
+        matched += len(base) * difflib.SequenceMatcher(None, base, other, autojunk=False).ratio()
+    return matched / total if total else 1.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PDF text extraction backends")
+    parser.add_argument("--per-category", type=int, default=3, help="PDFs sampled from each data/ category")
+    parser.add_argument("--backends", nargs="*", default=None, help="Backends to compare (default: all installed)")
+    parser.add_argument("pdfs", nargs="*", type=Path, help="Explicit PDFs instead of sampling data/")
+    args = parser.parse_args()
+
+    pdf_paths = [str(path) for path in (args.pdfs or _sample_pdfs(args.per_category))]
+    names = args.backends or available_backends()
+    if DEFAULT_BACKEND not in names:
+        names.insert(0, DEFAULT_BACKEND)
+
+    results = {}
+    context = multiprocessing.get_context("spawn")
+    for name in names:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            results[name] = pool.submit(_run_backend, name, pdf_paths).result()
+
+    baseline = results[DEFAULT_BACKEND][0]
+    by_category = defaultdict(list)
+    for path in pdf_paths:
+        by_category[category_for_path(Path(path)) or "(other)"].append(path)
+
+    print("=" * 92)
+    print(f"{len(pdf_paths)} PDFs, baseline {DEFAULT_BACKEND}")
+    print(f"{'Category':<24} {'Backend':<11} {'Pages':>6} {'Seconds':>8} {'Pages/s':>8} {'Speedup':>8} {'Similarity':>10} {'Errors':>6}")
+    print("-" * 92)
+    for category, paths in sorted(by_category.items()):
+        base_seconds = sum(results[DEFAULT_BACKEND][1][path] for path in paths)
+        for name in names:
+            texts, seconds, errors, _ = results[name]
+            ok = [path for path in paths if path in texts and path in baseline]
+            pages = sum(len(texts[path]) for path in paths if path in texts)
+            elapsed = sum(seconds[path] for path in paths)
+            similarity = (
+                sum(_similarity(texts[path], baseline[path]) for path in ok) / len(ok) if ok else float("nan")
+            )
+            rate = pages / elapsed if elapsed > 0 else 0.0
+            speedup = base_seconds / elapsed if elapsed > 0 else float("inf")
+            print(
+                f"{category:<24} {name:<11} {pages:>6} {elapsed:>8.2f} {rate:>8.1f} {speedup:>7.1f}x "
+                f"{similarity:>10.4f} {sum(path in errors for path in paths):>6}"
+            )
+    print("-" * 92)
+    memory_label = "Peak RSS (MB)" if resource is not None else "Peak heap (MB)"
+    print(f"{'Backend':<11} {'Pages':>6} {'Pages/s':>8} {memory_label:>15}")
+    for name in names:
+        texts, seconds, _, peak = results[name]
+        pages = sum(len(pages) for pages in texts.values())
+        elapsed = sum(seconds.values())
+        print(f"{name:<11} {pages:>6} {pages / elapsed if elapsed > 0 else 0.0:>8.1f} {peak / 1e6:>15.1f}")
+    print("=" * 92)
+
+
+if __name__ == "__main__":
+    main()
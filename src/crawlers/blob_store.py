@@ -0,0 +1,311 @@
+"""
+내용 해시(SHA-256) 기반 PDF blob 저장소
+
+같은 PDF가 여러 카테고리 경로나 `_2` 변형 파일명으로 중복 저장되던 문제를
+해결합니다. 파일 내용은 data/blobs/<sha[:2]>/<sha>.pdf에 한 번만 저장하고,
+카테고리 경로(data/NN_*/pdf/...)는 하드 링크(불가하면 복사)로 연결합니다.
+어떤 경로/URL이 어떤 blob을 가리키는지는 SQLite 매니페스트에 기록합니다.
+
+- 스트리밍 다운로드 임시 파일(partial/) 관리 → HTTP Range 이어받기
+- URL → blob 조회로 재크롤링 시 재다운로드 생략
+- 같은 디렉토리에 동일 내용 파일이 이미 있으면 새 파일명을 만들지 않음
+- 추출 텍스트를 blob 단위로 캐시하여 동일 PDF 재추출 생략
+
+디렉토리와 매니페스트는 처음 저장(다운로드/링크/텍스트 캐시)할 때 만들어지며,
+그 전의 조회는 모두 "없음"으로 처리됩니다.
+"""
+
+import hashlib
+import logging
+import os
+import shutil
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from src.utils.cache_io import write_text
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DEFAULT_BLOB_DIR = PROJECT_ROOT / "data" / "blobs"
+
+CHUNK_SIZE = 1 << 16
+
+
+def file_sha256(path: Path) -> str:
+    """파일 SHA-256 (청크 단위 스트리밍)"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BlobStore:
+    """해시 주소 blob 저장소 + 경로/URL 매니페스트"""
+
+    def __init__(self, root: Optional[Path] = None):
+        """
+        Args:
+            root: 저장소 디렉토리 (None이면 data/blobs)
+        """
+        self.root = Path(root) if root is not None else DEFAULT_BLOB_DIR
+        self.partial_dir = self.root / "partial"
+        self.text_dir = self.root / "text"
+        self.db_path = self.root / "manifest.db"
+        self._initialized = False
+
+    def _ensure(self) -> None:
+        """저장소 디렉토리와 매니페스트 생성 (첫 저장 시)"""
+        if self._initialized:
+            return
+        for directory in (self.root, self.partial_dir, self.text_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+        self._initialize()
+        self._initialized = True
+
+    def _has_manifest(self) -> bool:
+        return self._initialized or self.db_path.exists()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _initialize(self) -> None:
+        with self._get_connection() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS blobs (
+                    sha256 TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    suffix TEXT NOT NULL,
+                    created_at TEXT NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS blob_paths (
+                    path TEXT PRIMARY KEY,
+                    sha256 TEXT NOT NULL,
+                    linked_at TEXT NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS blob_urls (
+                    url TEXT PRIMARY KEY,
+                    sha256 TEXT NOT NULL,
+                    fetched_at TEXT NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_blob_paths_sha ON blob_paths (sha256)")
+
+    # ------------------------------------------------------------------
+    # 경로
+    # ------------------------------------------------------------------
+
+    def blob_path(self, sha256: str, suffix: str = ".pdf") -> Path:
+        return self.root / sha256[:2] / f"{sha256}{suffix}"
+
+    def partial_path(self, url: str) -> Path:
+        """URL별 이어받기 임시 파일 경로 (다운로드 시작 시점이므로 저장소 생성)"""
+        self._ensure()
+        return self.partial_dir / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()[:32]}.part"
+
+    @staticmethod
+    def _key(path: Path) -> str:
+        return str(Path(path).resolve())
+
+    # ------------------------------------------------------------------
+    # 저장 / 링크
+    # ------------------------------------------------------------------
+
+    def put(self, source: Path, sha256: Optional[str] = None, suffix: str = ".pdf") -> Path:
+        """
+        파일을 blob으로 이동 (이미 있으면 원본만 삭제)
+
+        Returns:
+            blob 경로
+        """
+        self._ensure()
+        sha256 = sha256 or file_sha256(source)
+        target = self.blob_path(sha256, suffix)
+        size = source.stat().st_size
+        if target.exists() and target.stat().st_size == size:
+            source.unlink()
+        else:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(source, target)
+        with self._get_connection() as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO blobs (sha256, size, suffix, created_at) VALUES (?, ?, ?, ?)",
+                (sha256, size, suffix, datetime.now().isoformat(timespec="seconds")),
+            )
+        return target
+
+    def link(self, sha256: str, dest: Path, url: Optional[str] = None, suffix: str = ".pdf") -> Path:
+        """blob을 카테고리 경로에 하드 링크(불가하면 복사)하고 매니페스트에 기록"""
+        blob = self.blob_path(sha256, suffix)
+        dest = Path(dest)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        if not (dest.exists() and os.path.samefile(blob, dest)):
+            tmp = dest.with_name(dest.name + ".tmp")
+            if tmp.exists():
+                tmp.unlink()
+            try:
+                os.link(blob, tmp)
+            except OSError:
+                shutil.copy2(blob, tmp)
+            os.replace(tmp, dest)
+        self.record_path(dest, sha256, url)
+        return dest
+
+    def record_path(self, path: Path, sha256: str, url: Optional[str] = None) -> None:
+        """경로(및 URL) → blob 매핑 기록"""
+        self._ensure()
+        now = datetime.now().isoformat(timespec="seconds")
+        with self._get_connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO blob_paths (path, sha256, linked_at) VALUES (?, ?, ?)",
+                (self._key(path), sha256, now),
+            )
+            if url:
+                conn.execute(
+                    "INSERT OR REPLACE INTO blob_urls (url, sha256, fetched_at) VALUES (?, ?, ?)",
+                    (url, sha256, now),
+                )
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def sha_for_url(self, url: str) -> Optional[str]:
+        """이전에 받은 URL의 blob 해시 (blob 파일이 남아 있을 때만)"""
+        if not self._has_manifest():
+            return None
+        with self._get_connection() as conn:
+            row = conn.execute(
+                "SELECT b.sha256, b.suffix FROM blob_urls u JOIN blobs b ON b.sha256 = u.sha256 WHERE u.url = ?",
+                (url,),
+            ).fetchone()
+        if row is None or not self.blob_path(row[0], row[1]).exists():
+            return None
+        return row[0]
+
+    def sha_for_path(self, path: Path) -> Optional[str]:
+        """경로의 blob 해시 (매니페스트 기록이 있고 같은 inode/크기일 때)"""
+        if not self._has_manifest():
+            return None
+        path = Path(path)
+        with self._get_connection() as conn:
+            row = conn.execute(
+                "SELECT b.sha256, b.suffix, b.size FROM blob_paths p JOIN blobs b ON b.sha256 = p.sha256 WHERE p.path = ?",
+                (self._key(path),),
+            ).fetchone()
+        if row is None or not path.exists():
+            return None
+        sha256, suffix, size = row
+        blob = self.blob_path(sha256, suffix)
+        if blob.exists() and os.path.samefile(blob, path):
+            return sha256
+        # 복사본이면 크기가 같을 때만 신뢰
+        return sha256 if path.stat().st_size == size else None
+
+    def existing_path_in_dir(self, sha256: str, directory: Path) -> Optional[Path]:
+        """같은 디렉토리에 이미 연결된 동일 내용 파일"""
+        if not self._has_manifest():
+            return None
+        prefix = self._key(directory) + os.sep
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                "SELECT path FROM blob_paths WHERE sha256 = ? ORDER BY path", (sha256,)
+            ).fetchall()
+        for (path,) in rows:
+            candidate = Path(path)
+            if path.startswith(prefix) and os.sep not in path[len(prefix):] and candidate.exists():
+                return candidate
+        return None
+
+    # ------------------------------------------------------------------
+    # 추출 텍스트 캐시
+    # ------------------------------------------------------------------
+
+    def text_path(self, sha256: str, backend: str = "pdfplumber") -> Path:
+        """추출 텍스트 캐시 경로 (pdfplumber 외 백엔드는 백엔드명으로 구분)"""
+        if backend == "pdfplumber":
+            return self.text_dir / f"{sha256}.txt"
+        return self.text_dir / f"{sha256}.{backend}.txt"
+
+    def cached_text(self, sha256: str, backend: str = "pdfplumber") -> Optional[Path]:
+        path = self.text_path(sha256, backend)
+        return path if path.exists() and path.stat().st_size > 0 else None
+
+    def save_text(self, sha256: str, text: str, backend: str = "pdfplumber") -> Path:
+        self._ensure()
+        path = self.text_path(sha256, backend)
+        write_text(path, text)
+        return path
+
+    # ------------------------------------------------------------------
+    # 기존 파일 이관
+    # ------------------------------------------------------------------
+
+    def ingest_tree(self, directories: Iterable[Path], pattern: str = "*.pdf", dry_run: bool = False) -> Dict[str, int]:
+        """
+        기존 PDF들을 blob으로 이관하고 원래 경로를 하드 링크로 교체
+
+        Returns:
+            {"files", "unique", "duplicate_bytes"} 통계
+        """
+        seen: Dict[str, Path] = {}
+        stats = {"files": 0, "unique": 0, "duplicate_bytes": 0}
+        files: List[Path] = sorted(
+            path for directory in directories for path in Path(directory).rglob(pattern)
+            if self.root not in path.parents
+        )
+        for path in files:
+            sha256 = file_sha256(path)
+            stats["files"] += 1
+            if sha256 in seen or self.blob_path(sha256).exists():
+                stats["duplicate_bytes"] += path.stat().st_size
+            else:
+                stats["unique"] += 1
+            seen.setdefault(sha256, path)
+            if dry_run:
+                continue
+            self._ensure()
+            if not self.blob_path(sha256).exists():
+                target = self.blob_path(sha256)
+                target.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(path, target)
+                with self._get_connection() as conn:
+                    conn.execute(
+                        "INSERT OR IGNORE INTO blobs (sha256, size, suffix, created_at) VALUES (?, ?, ?, ?)",
+                        (sha256, target.stat().st_size, ".pdf", datetime.now().isoformat(timespec="seconds")),
+                    )
+            self.link(sha256, path)
+        return stats
+
+
+def main():
+    """data/ 아래 기존 PDF 중복 현황 (--apply 시 blob 이관)"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="PDF blob 저장소 이관")
+    parser.add_argument("--apply", action="store_true", help="blob으로 이관하고 하드 링크로 교체")
+    args = parser.parse_args()
+
+    store = BlobStore()
+    data_dir = PROJECT_ROOT / "data"
+    directories = [path for path in data_dir.iterdir() if path.is_dir() and path != store.root]
+    stats = store.ingest_tree(directories, dry_run=not args.apply)
+    print(f"PDF 파일: {stats['files']}개, 고유 내용: {stats['unique']}개")
+    print(f"중복 용량: {stats['duplicate_bytes'] / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,11 +4,15 @@ Unified Bank of Korea publication crawler.
 This crawler reads publication definitions from bok_publications.yaml,
 collects article lists from the BOK AJAX endpoint, finds PDF links on detail pages,
 downloads PDFs, and extracts text with pdfplumber through PDFDownloader.
+
+With ``--async`` the stages run as an asyncio pipeline with per-host
+concurrency and rate limits instead of sleeping after every request.
 """
 
 from __future__ import annotations
 
 import argparse
+import asyncio
 import logging
 import re
 import time
@@ -22,11 +26,26 @@ import yaml
 from bs4 import BeautifulSoup
 
 from src.crawlers.pdf_downloader import PDFDownloader
+from src.crawlers.rate_limit import HostLimiter
+from src.crawlers.seen_index import SeenArticleIndex
 
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+STAT_KEYS = (
+    "pages_crawled",
+    "articles_found",
+    "articles_processed",
+    "pdf_links_found",
+    "downloaded",
+    "text_extracted",
+    "skipped_existing",
+    "skipped_seen",
+    "failed",
+)
+QUEUE_SIZE = 100
+
 
 @dataclass
 class ArticleItem:
@@ -41,7 +60,7 @@ class BOKPublicationCrawler:
     BASE_URL = "https://www.bok.or.kr"
     LIST_CONT_URL = "https://www.bok.or.kr/portal/singl/newsData/listCont.do"
 
-    def __init__(self, config_path: Optional[Path] = None):
+    def __init__(self, config_path: Optional[Path] = None, seen_index_dir: Optional[Path] = None):
         self.project_root = Path(__file__).parent.parent.parent
         default_config = Path(__file__).with_name("bok_publications.yaml")
         self.config_path = Path(config_path) if config_path else default_config
@@ -49,8 +68,14 @@ class BOKPublicationCrawler:
         self.config = self._load_config(self.config_path)
         self.publications = self.config.get("publications", {})
 
-        self.session = requests.Session()
-        self.session.headers.update(
+        self.session = self._new_session()
+        self.pdf_downloader = PDFDownloader()
+        self.seen_index_dir = seen_index_dir
+
+    @staticmethod
+    def _new_session() -> requests.Session:
+        session = requests.Session()
+        session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
                 "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
@@ -58,7 +83,7 @@ class BOKPublicationCrawler:
                 "Referer": "https://www.bok.or.kr/",
             }
         )
-        self.pdf_downloader = PDFDownloader()
+        return session
 
     @staticmethod
     def _load_config(config_path: Path) -> Dict:
@@ -106,11 +131,17 @@ class BOKPublicationCrawler:
         ntt_id_values = query.get("nttId", [])
         return ntt_id_values[0] if ntt_id_values else ""
 
-    def fetch_article_list(self, menu_no: str, page_index: int = 1, page_unit: int = 10) -> str:
+    def fetch_article_list(
+        self,
+        menu_no: str,
+        page_index: int = 1,
+        page_unit: int = 10,
+        session: Optional[requests.Session] = None,
+    ) -> str:
         params = {"menuNo": menu_no, "pageIndex": page_index, "pageUnit": page_unit}
         try:
             logger.info("Request list menuNo=%s page=%s", menu_no, page_index)
-            response = self.session.get(self.LIST_CONT_URL, params=params, timeout=30)
+            response = (session or self.session).get(self.LIST_CONT_URL, params=params, timeout=30)
             response.raise_for_status()
             response.encoding = "utf-8"
             return response.text
@@ -200,9 +231,9 @@ class BOKPublicationCrawler:
 
         return urls
 
-    def fetch_article_detail(self, url: str) -> List[str]:
+    def fetch_article_detail(self, url: str, session: Optional[requests.Session] = None) -> List[str]:
         try:
-            response = self.session.get(url, timeout=30)
+            response = (session or self.session).get(url, timeout=30)
             response.raise_for_status()
             response.encoding = "utf-8"
         except requests.RequestException as exc:
@@ -258,37 +289,60 @@ class BOKPublicationCrawler:
 
         return self._sanitize_filename(base)
 
-    def _find_available_filename(self, base_name: str, pdf_dir: Path) -> str:
+    def _find_available_filename(self, base_name: str, pdf_dir: Path, reserved: Optional[Set[Path]] = None) -> str:
+        def taken(name: str) -> bool:
+            path = pdf_dir / f"{name}.pdf"
+            if reserved is not None and path in reserved:
+                return True
+            return path.exists() and path.stat().st_size > 0
+
         candidate = base_name
         index = 2
-        while (pdf_dir / f"{candidate}.pdf").exists() and (pdf_dir / f"{candidate}.pdf").stat().st_size > 0:
+        while taken(candidate):
             candidate = f"{base_name}_{index}"
             index += 1
         return candidate
 
+    @staticmethod
+    def _new_stats(publication_name: str, menu_no: str) -> Dict:
+        stats: Dict = {"publication": publication_name, "menu_no": menu_no}
+        stats.update({metric: 0 for metric in STAT_KEYS})
+        return stats
+
+    @staticmethod
+    def _log_publication_done(pub_key: str, stats: Dict) -> None:
+        logger.info(
+            "Done %s: pages=%s articles=%s pdf_links=%s downloaded=%s extracted=%s skipped=%s failed=%s",
+            pub_key,
+            stats["pages_crawled"],
+            stats["articles_found"],
+            stats["pdf_links_found"],
+            stats["downloaded"],
+            stats["text_extracted"],
+            stats["skipped_existing"],
+            stats["failed"],
+        )
+
     def crawl_publication(
         self,
         pub_key: str,
         pub_config: Dict,
         max_pages: int = 5,
         delay: float = 1.0,
+        incremental: bool = False,
     ) -> Dict:
+        """
+        Crawl one publication serially.
+
+        Processed articles are always recorded in the publication's seen index.
+        With ``incremental`` the crawl skips detail fetches for known articles
+        and stops paging at the first page where every article is known.
+        """
         menu_no = str(pub_config.get("menu_no", "")).strip()
         publication_name = pub_config.get("name", pub_key)
         dirs = self._build_output_dirs(pub_config)
 
-        stats = {
-            "publication": publication_name,
-            "menu_no": menu_no,
-            "pages_crawled": 0,
-            "articles_found": 0,
-            "articles_processed": 0,
-            "pdf_links_found": 0,
-            "downloaded": 0,
-            "text_extracted": 0,
-            "skipped_existing": 0,
-            "failed": 0,
-        }
+        stats = self._new_stats(publication_name, menu_no)
 
         if not menu_no:
             logger.warning("Skip %s: menu_no is empty", pub_key)
@@ -296,7 +350,28 @@ class BOKPublicationCrawler:
 
         logger.info("Start publication=%s (%s)", pub_key, publication_name)
         processed_ntt_ids: Set[str] = set()
+        seen = SeenArticleIndex(pub_key, self.seen_index_dir)
+
+        try:
+            self._crawl_pages(pub_key, menu_no, dirs, stats, seen, processed_ntt_ids, max_pages, delay, incremental)
+        finally:
+            seen.save()
 
+        self._log_publication_done(pub_key, stats)
+        return stats
+
+    def _crawl_pages(
+        self,
+        pub_key: str,
+        menu_no: str,
+        dirs: Dict[str, Path],
+        stats: Dict,
+        seen: SeenArticleIndex,
+        processed_ntt_ids: Set[str],
+        max_pages: int,
+        delay: float,
+        incremental: bool,
+    ) -> None:
         for page_index in range(1, max_pages + 1):
             html = self.fetch_article_list(menu_no=menu_no, page_index=page_index, page_unit=10)
             if not html:
@@ -311,20 +386,26 @@ class BOKPublicationCrawler:
             stats["pages_crawled"] += 1
             stats["articles_found"] += len(articles)
             logger.info("%s page=%s article_count=%s", pub_key, page_index, len(articles))
+            page_seen = incremental and seen.all_seen(articles)
 
             for article in articles:
                 if article.ntt_id in processed_ntt_ids:
                     continue
                 processed_ntt_ids.add(article.ntt_id)
+                if incremental and seen.is_seen(article):
+                    stats["skipped_seen"] += 1
+                    continue
                 stats["articles_processed"] += 1
 
                 pdf_urls = self.fetch_article_detail(article.url)
                 stats["pdf_links_found"] += len(pdf_urls)
                 if not pdf_urls:
                     logger.info("No PDF links: %s (%s)", article.title, article.url)
+                    seen.mark(article, [], [])
                     time.sleep(delay)
                     continue
 
+                files: List[str] = []
                 for idx, pdf_url in enumerate(pdf_urls, 1):
                     base_name = self._build_filename(pub_key, article)
                     if len(pdf_urls) > 1:
@@ -342,74 +423,242 @@ class BOKPublicationCrawler:
                             continue
                         stats["downloaded"] += 1
                         pdf_path = result.file_path
+                    files.append(pdf_path.name)
 
-                    txt_path = self.pdf_downloader.extract_text_to_dir(pdf_path, dirs["txt"], filename)
+                    txt_path = self.pdf_downloader.extract_text_to_dir(pdf_path, dirs["txt"], pdf_path.stem)
                     if txt_path:
                         stats["text_extracted"] += 1
 
                     time.sleep(delay)
 
+                # Only fully downloaded articles are remembered; failures are retried next run
+                if len(files) == len(pdf_urls):
+                    seen.mark(article, pdf_urls, files)
                 time.sleep(delay)
 
+            if page_seen:
+                logger.info("All articles seen for %s at page=%s, stop pagination", pub_key, page_index)
+                break
+
             time.sleep(delay)
 
-        logger.info(
-            "Done %s: pages=%s articles=%s pdf_links=%s downloaded=%s extracted=%s skipped=%s failed=%s",
-            pub_key,
-            stats["pages_crawled"],
-            stats["articles_found"],
-            stats["pdf_links_found"],
-            stats["downloaded"],
-            stats["text_extracted"],
-            stats["skipped_existing"],
-            stats["failed"],
-        )
-        return stats
+    async def crawl_publications_async(
+        self,
+        publications: Dict[str, Dict],
+        max_pages: int = 5,
+        max_per_host: int = 4,
+        rate_per_host: float = 2.0,
+        workers: int = 4,
+        extract_workers: int = 2,
+        incremental: bool = False,
+    ) -> Dict[str, Dict]:
+        """
+        Crawl several publications concurrently as a pipelined asyncio job.
+
+        Stages (list -> detail -> download -> extract) are connected by bounded
+        queues. Blocking requests/pdfplumber calls run in worker threads, each
+        stage worker owning its own session. Every request to a host goes
+        through a HostLimiter (at most ``max_per_host`` in flight, paced at
+        ``rate_per_host`` requests per second). ``incremental`` has the same
+        meaning as in crawl_publication. Returns the same per-publication stats
+        dictionaries as crawl_publication.
+        """
+        limiter = HostLimiter(max_per_host=max_per_host, rate_per_host=rate_per_host)
+        detail_queue: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        download_queue: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        extract_queue: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        reserved: Set[Path] = set()
+        all_stats: Dict[str, Dict] = {}
+        indexes: Dict[str, SeenArticleIndex] = {}
+
+        def finish_pdf(tracker: Dict, idx: int, file_name: Optional[str]) -> None:
+            """Record one PDF outcome; mark the article seen once all its PDFs succeeded."""
+            tracker["files"][idx] = file_name
+            tracker["pending"] -= 1
+            if tracker["pending"] == 0 and all(tracker["files"]):
+                tracker["seen"].mark(tracker["article"], tracker["pdf_urls"], tracker["files"])
+
+        async def list_stage(pub_key: str, pub_config: Dict) -> None:
+            menu_no = str(pub_config.get("menu_no", "")).strip()
+            stats = self._new_stats(pub_config.get("name", pub_key), menu_no)
+            all_stats[pub_key] = stats
+            if not menu_no:
+                logger.warning("Skip %s: menu_no is empty", pub_key)
+                return
+
+            dirs = self._build_output_dirs(pub_config)
+            session = self._new_session()
+            processed_ntt_ids: Set[str] = set()
+            seen = indexes.setdefault(pub_key, SeenArticleIndex(pub_key, self.seen_index_dir))
+            logger.info("Start publication=%s (%s)", pub_key, stats["publication"])
+
+            for page_index in range(1, max_pages + 1):
+                async with limiter.slot(self.LIST_CONT_URL):
+                    html = await asyncio.to_thread(self.fetch_article_list, menu_no, page_index, 10, session)
+                if not html:
+                    continue
+
+                articles = self.parse_article_list(html)
+                if not articles:
+                    logger.info("No articles for %s at page=%s, stop pagination", pub_key, page_index)
+                    break
+
+                stats["pages_crawled"] += 1
+                stats["articles_found"] += len(articles)
+                logger.info("%s page=%s article_count=%s", pub_key, page_index, len(articles))
+
+                for article in articles:
+                    if article.ntt_id in processed_ntt_ids:
+                        continue
+                    processed_ntt_ids.add(article.ntt_id)
+                    if incremental and seen.is_seen(article):
+                        stats["skipped_seen"] += 1
+                        continue
+                    stats["articles_processed"] += 1
+                    await detail_queue.put((pub_key, article, stats, dirs, seen))
+
+                if incremental and seen.all_seen(articles):
+                    logger.info("All articles seen for %s at page=%s, stop pagination", pub_key, page_index)
+                    break
+
+        async def detail_worker() -> None:
+            session = self._new_session()
+            while True:
+                pub_key, article, stats, dirs, seen = await detail_queue.get()
+                try:
+                    async with limiter.slot(article.url):
+                        pdf_urls = await asyncio.to_thread(self.fetch_article_detail, article.url, session)
+                    stats["pdf_links_found"] += len(pdf_urls)
+                    if not pdf_urls:
+                        logger.info("No PDF links: %s (%s)", article.title, article.url)
+                        seen.mark(article, [], [])
+                    tracker = {
+                        "article": article,
+                        "seen": seen,
+                        "pdf_urls": pdf_urls,
+                        "files": [None] * len(pdf_urls),
+                        "pending": len(pdf_urls),
+                    }
+                    for idx, pdf_url in enumerate(pdf_urls, 1):
+                        base_name = self._build_filename(pub_key, article)
+                        if len(pdf_urls) > 1:
+                            base_name = f"{base_name}_{idx}"
+                        # Reserve the name so concurrent articles cannot pick the same file
+                        filename = self._find_available_filename(base_name, dirs["pdf"], reserved)
+                        reserved.add(dirs["pdf"] / f"{filename}.pdf")
+                        await download_queue.put((pdf_url, filename, stats, dirs, tracker, idx - 1))
+                except Exception as exc:
+                    logger.error("Detail stage failed %s: %s", article.url, exc)
+                    stats["failed"] += 1
+                finally:
+                    detail_queue.task_done()
+
+        async def download_worker() -> None:
+            downloader = PDFDownloader(blob_store=self.pdf_downloader.blob_store)
+            while True:
+                pdf_url, filename, stats, dirs, tracker, idx = await download_queue.get()
+                pdf_path = None
+                try:
+                    existing_pdf = dirs["pdf"] / f"{filename}.pdf"
+                    if existing_pdf.exists() and existing_pdf.stat().st_size > 0:
+                        stats["skipped_existing"] += 1
+                        pdf_path = existing_pdf
+                    else:
+                        async with limiter.slot(pdf_url):
+                            result = await asyncio.to_thread(downloader.download_pdf, pdf_url, filename, dirs["pdf"])
+                        if not result.success or not result.file_path:
+                            stats["failed"] += 1
+                            continue
+                        stats["downloaded"] += 1
+                        pdf_path = result.file_path
+                    await extract_queue.put((pdf_path, filename, stats, dirs))
+                except Exception as exc:
+                    logger.error("Download stage failed %s: %s", pdf_url, exc)
+                    stats["failed"] += 1
+                finally:
+                    finish_pdf(tracker, idx, pdf_path.name if pdf_path else None)
+                    download_queue.task_done()
+
+        async def extract_worker() -> None:
+            while True:
+                pdf_path, filename, stats, dirs = await extract_queue.get()
+                try:
+                    txt_path = await asyncio.to_thread(self.pdf_downloader.extract_text_to_dir, pdf_path, dirs["txt"], pdf_path.stem)
+                    if txt_path:
+                        stats["text_extracted"] += 1
+                except Exception as exc:
+                    logger.error("Extract stage failed %s: %s", pdf_path, exc)
+                    stats["failed"] += 1
+                finally:
+                    extract_queue.task_done()
+
+        tasks = [asyncio.create_task(detail_worker()) for _ in range(workers)]
+        tasks += [asyncio.create_task(download_worker()) for _ in range(workers)]
+        tasks += [asyncio.create_task(extract_worker()) for _ in range(extract_workers)]
+        try:
+            await asyncio.gather(*(list_stage(key, config) for key, config in publications.items()))
+            await detail_queue.join()
+            await download_queue.join()
+            await extract_queue.join()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            for seen in indexes.values():
+                seen.save()
+
+        for pub_key, stats in all_stats.items():
+            self._log_publication_done(pub_key, stats)
+        return {key: all_stats[key] for key in publications}
 
     def crawl_all(
         self,
         max_pages_per_pub: int = 5,
         delay: float = 1.0,
         publication_keys: Optional[List[str]] = None,
+        async_mode: bool = False,
+        max_per_host: int = 4,
+        rate_per_host: float = 2.0,
+        workers: int = 4,
+        incremental: bool = False,
     ) -> Dict:
         all_stats: Dict[str, Dict] = {}
-        totals = {
-            "publications": 0,
-            "pages_crawled": 0,
-            "articles_found": 0,
-            "articles_processed": 0,
-            "pdf_links_found": 0,
-            "downloaded": 0,
-            "text_extracted": 0,
-            "skipped_existing": 0,
-            "failed": 0,
-        }
+        totals = {"publications": 0}
+        totals.update({metric: 0 for metric in STAT_KEYS})
 
+        selected: Dict[str, Dict] = {}
         keys = publication_keys or list(self.publications.keys())
         for pub_key in keys:
             pub_config = self.publications.get(pub_key)
             if not pub_config:
                 logger.warning("Unknown publication key: %s", pub_key)
                 continue
-
-            stats = self.crawl_publication(
-                pub_key=pub_key,
-                pub_config=pub_config,
-                max_pages=max_pages_per_pub,
-                delay=delay,
+            selected[pub_key] = pub_config
+
+        if async_mode:
+            all_stats = asyncio.run(
+                self.crawl_publications_async(
+                    selected,
+                    max_pages=max_pages_per_pub,
+                    max_per_host=max_per_host,
+                    rate_per_host=rate_per_host,
+                    workers=workers,
+                    incremental=incremental,
+                )
             )
-            all_stats[pub_key] = stats
+        else:
+            for pub_key, pub_config in selected.items():
+                all_stats[pub_key] = self.crawl_publication(
+                    pub_key=pub_key,
+                    pub_config=pub_config,
+                    max_pages=max_pages_per_pub,
+                    delay=delay,
+                    incremental=incremental,
+                )
+
+        for stats in all_stats.values():
             totals["publications"] += 1
-            for metric in [
-                "pages_crawled",
-                "articles_found",
-                "articles_processed",
-                "pdf_links_found",
-                "downloaded",
-                "text_extracted",
-                "skipped_existing",
-                "failed",
-            ]:
+            for metric in STAT_KEYS:
                 totals[metric] += stats.get(metric, 0)
 
         return {"totals": totals, "publications": all_stats}
@@ -468,6 +717,15 @@ def main() -> None:
     parser.add_argument("--max-pages", type=int, default=5)
     parser.add_argument("--delay", type=float, default=1.0)
     parser.add_argument("--config-path", type=str, default=None)
+    parser.add_argument("--async", dest="async_mode", action="store_true", help="Pipelined asyncio crawl")
+    parser.add_argument("--max-per-host", type=int, default=4, help="Concurrent requests per host (async)")
+    parser.add_argument("--rate", type=float, default=2.0, help="Requests per second per host (async)")
+    parser.add_argument("--workers", type=int, default=4, help="Detail/download workers (async)")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Skip known articles and stop at the first fully-seen page",
+    )
     args = parser.parse_args()
 
     crawler = BOKPublicationCrawler(config_path=Path(args.config_path) if args.config_path else None)
@@ -475,6 +733,11 @@ def main() -> None:
         max_pages_per_pub=args.max_pages,
         delay=args.delay,
         publication_keys=args.publications,
+        async_mode=args.async_mode,
+        max_per_host=args.max_per_host,
+        rate_per_host=args.rate,
+        workers=args.workers,
+        incremental=args.incremental,
     )
     _log_summary_table(results)
 
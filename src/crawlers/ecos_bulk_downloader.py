@@ -12,6 +12,7 @@ import pandas as pd
 import yaml
 
 from src.data.ecos_api import EcosAPI
+from src.data.vintage_store import VintageStore
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
@@ -31,11 +32,14 @@ class ECOSBulkDownloader:
         output_dir: Optional[Path] = None,
         manifest_path: Optional[Path] = None,
         request_delay: float = 1.0,
+        vintage_store: Optional[VintageStore] = None,
     ):
         self.config_path = config_path or DEFAULT_CONFIG_PATH
         self.output_dir = output_dir or DEFAULT_OUTPUT_DIR
         self.manifest_path = manifest_path or DEFAULT_MANIFEST_PATH
         self.request_delay = request_delay
+        # 다운로드마다 관측치를 as-of 시각과 함께 이력으로 보관 (사후 수정 추적)
+        self.vintage_store = vintage_store or VintageStore()
 
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
@@ -133,6 +137,20 @@ class ECOSBulkDownloader:
         self.manifest["updated_at"] = datetime.now().isoformat()
         self._save_manifest()
 
+    def _record_vintage(self, indicator_name: str, config: dict, df: pd.DataFrame, timestamp: str, csv_path: Path) -> None:
+        try:
+            self.vintage_store.record_snapshot(
+                indicator_name,
+                df,
+                as_of=timestamp,
+                period_type=config["period_type"],
+                stat_code=config["stat_code"],
+                item_code1=config["item_code1"],
+                source_path=str(csv_path),
+            )
+        except Exception as exc:
+            logger.warning(f"[WARN] {indicator_name} 빈티지 기록 실패: {exc}")
+
     def download_indicator(self, indicator_name: str, config: dict, start_date: str, end_date: Optional[str]) -> dict:
         category = config["category"]
         category_dir = self.output_dir / category
@@ -176,11 +194,13 @@ class ECOSBulkDownloader:
             rows = int(len(df))
             logger.info(f"[OK] {indicator_name}: {rows}건 저장 -> {csv_path}")
             result = {"status": "downloaded", "path": str(csv_path), "rows": rows}
+            timestamp = datetime.now().isoformat()
+            self._record_vintage(indicator_name, config, df, timestamp, csv_path)
             self._update_manifest(
                 indicator_name,
                 {
                     **result,
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": timestamp,
                     "start_date": normalized_start,
                     "end_date": normalized_end,
                     "stat_code": config["stat_code"],
@@ -0,0 +1,214 @@
+"""
+PDF 텍스트 추출 백엔드
+
+추출 엔진을 교체할 수 있도록 공통 인터페이스(ExtractionBackend)를 둡니다.
+
+- pdfplumber: 기존 기준 엔진 (레이아웃 분석 포함, 느림)
+- pypdfium2: PDFium 네이티브 텍스트 레이어 (빠름, 선택 설치)
+- pdfminer: pdfminer.six 레이아웃 분석 없이 문자 순서대로 출력
+
+문서 카테고리(data/ 바로 아래 디렉토리명, 예: 01_minutes)별 백엔드는
+config.yaml의 pdf_extraction 항목에서 지정합니다.
+
+    pdf_extraction:
+      default_backend: "pdfplumber"
+      backends:
+        04_stability_reports: "pypdfium2"
+"""
+
+import io
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import pdfplumber
+
+try:
+    import pypdfium2
+except ImportError:
+    pypdfium2 = None
+
+try:
+    from pdfminer.converter import TextConverter
+    from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+    from pdfminer.pdfpage import PDFPage
+except ImportError:
+    PDFPage = None
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DATA_DIR = PROJECT_ROOT / "data"
+
+DEFAULT_BACKEND = "pdfplumber"
+
+
+class ExtractionBackend:
+    """페이지 단위 텍스트 추출 인터페이스"""
+
+    name = ""
+
+    @classmethod
+    def available(cls) -> bool:
+        return True
+
+    def page_count(self, pdf_path: Path) -> int:
+        raise NotImplementedError
+
+    def extract_pages(self, pdf_path: Path, pages: Optional[Sequence[int]] = None) -> List[str]:
+        """
+        페이지 텍스트 추출
+
+        Args:
+            pdf_path: PDF 경로
+            pages: 0부터 시작하는 페이지 번호 목록 (None이면 전체)
+
+        Returns:
+            페이지 순서대로의 텍스트 (텍스트 없는 페이지는 빈 문자열)
+        """
+        raise NotImplementedError
+
+
+class PdfplumberBackend(ExtractionBackend):
+    name = "pdfplumber"
+
+    def page_count(self, pdf_path: Path) -> int:
+        with pdfplumber.open(pdf_path) as pdf:
+            return len(pdf.pages)
+
+    def extract_pages(self, pdf_path: Path, pages: Optional[Sequence[int]] = None) -> List[str]:
+        with pdfplumber.open(pdf_path) as pdf:
+            indices = range(len(pdf.pages)) if pages is None else pages
+            return [pdf.pages[i].extract_text() or "" for i in indices]
+
+
+class PypdfiumBackend(ExtractionBackend):
+    name = "pypdfium2"
+
+    @classmethod
+    def available(cls) -> bool:
+        return pypdfium2 is not None
+
+    def page_count(self, pdf_path: Path) -> int:
+        doc = pypdfium2.PdfDocument(str(pdf_path))
+        try:
+            return len(doc)
+        finally:
+            doc.close()
+
+    def extract_pages(self, pdf_path: Path, pages: Optional[Sequence[int]] = None) -> List[str]:
+        doc = pypdfium2.PdfDocument(str(pdf_path))
+        try:
+            indices = range(len(doc)) if pages is None else pages
+            texts = []
+            for i in indices:
+                page = doc[i]
+                textpage = page.get_textpage()
+                try:
+                    text = textpage.get_text_range()
+                finally:
+                    textpage.close()
+                    page.close()
+                texts.append(text.replace("\r\n", "\n").replace("\r", "\n").strip())
+            return texts
+        finally:
+            doc.close()
+
+
+class PdfminerBackend(ExtractionBackend):
+    name = "pdfminer"
+
+    @classmethod
+    def available(cls) -> bool:
+        return PDFPage is not None
+
+    def page_count(self, pdf_path: Path) -> int:
+        with open(pdf_path, "rb") as fp:
+            return sum(1 for _ in PDFPage.get_pages(fp))
+
+    def extract_pages(self, pdf_path: Path, pages: Optional[Sequence[int]] = None) -> List[str]:
+        wanted = None if pages is None else set(pages)
+        texts: Dict[int, str] = {}
+        buffer = io.StringIO()
+        manager = PDFResourceManager()
+        # laparams=None: 레이아웃 분석 없이 콘텐츠 스트림 순서대로 출력
+        device = TextConverter(manager, buffer, laparams=None)
+        interpreter = PDFPageInterpreter(manager, device)
+        try:
+            with open(pdf_path, "rb") as fp:
+                for i, page in enumerate(PDFPage.get_pages(fp)):
+                    if wanted is not None and i not in wanted:
+                        continue
+                    interpreter.process_page(page)
+                    texts[i] = buffer.getvalue().strip()
+                    buffer.seek(0)
+                    buffer.truncate()
+        finally:
+            device.close()
+        indices = sorted(texts) if pages is None else pages
+        return [texts.get(i, "") for i in indices]
+
+
+BACKENDS = {backend.name: backend for backend in (PdfplumberBackend, PypdfiumBackend, PdfminerBackend)}
+
+
+def available_backends() -> List[str]:
+    return [name for name, backend in BACKENDS.items() if backend.available()]
+
+
+def get_backend(name: Optional[str] = None) -> ExtractionBackend:
+    """이름으로 백엔드 생성 (미설치 백엔드는 ValueError)"""
+    name = name or DEFAULT_BACKEND
+    backend = BACKENDS.get(name)
+    if backend is None:
+        raise ValueError(f"알 수 없는 추출 백엔드: {name} (지원: {', '.join(BACKENDS)})")
+    if not backend.available():
+        raise ValueError(f"추출 백엔드 미설치: {name}")
+    return backend()
+
+
+def _backend_config() -> Dict:
+    try:
+        from src.config import get_config
+
+        return get_config().get("pdf_extraction") or {}
+    except Exception as exc:
+        logger.warning(f"pdf_extraction 설정을 읽을 수 없어 기본 백엔드 사용: {exc}")
+        return {}
+
+
+def category_for_path(pdf_path: Path) -> Optional[str]:
+    """data/ 바로 아래 디렉토리명 (data/ 밖의 파일이면 None)"""
+    try:
+        return Path(pdf_path).resolve().relative_to(DATA_DIR.resolve()).parts[0]
+    except (ValueError, IndexError):
+        return None
+
+
+def backend_name_for_path(pdf_path: Path) -> str:
+    """문서 카테고리 설정에 따른 백엔드 이름 (미설치면 기본 백엔드)"""
+    config = _backend_config()
+    default = config.get("default_backend") or DEFAULT_BACKEND
+    name = (config.get("backends") or {}).get(category_for_path(pdf_path), default)
+    if name not in BACKENDS or not BACKENDS[name].available():
+        logger.warning(f"추출 백엔드 '{name}' 사용 불가, {DEFAULT_BACKEND} 사용")
+        return DEFAULT_BACKEND
+    return name
+
+
+def is_hwp_fallback_error(exc: Exception, pdf_path: Path) -> bool:
+    """PDF 파싱 실패가 HWP 문서(확장자만 .pdf) 때문인지 판단"""
+    if "No /Root object" in str(exc):
+        return True
+    try:
+        with open(pdf_path, "rb") as f:
+            return f.read(8) == bytes.fromhex("D0CF11E0A1B11AE1")
+    except OSError:
+        return False
+
+
+def format_pages(page_texts: Sequence[str]) -> str:
+    """페이지 텍스트를 저장 형식("--- 페이지 N ---")으로 병합"""
+    return "\n\n".join(
+        f"--- 페이지 {i} ---\n{text}" for i, text in enumerate(page_texts, 1) if text
+    )
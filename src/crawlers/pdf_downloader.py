@@ -2,21 +2,34 @@
 한국은행 금융통화위원회 문서 PDF 다운로드 및 텍스트 추출
 
 수집된 회의 목록(JSON)에서 PDF 파일을 다운로드하고,
-pdfplumber를 사용하여 텍스트를 추출합니다.
+추출 백엔드(기본 pdfplumber, extraction_backends 참고)로 텍스트를 추출합니다.
 """
 
+import hashlib
+import io
 import json
 import logging
 import re
+import shutil
+import struct
 import time
 import zlib
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import BinaryIO, Dict, Iterator, Optional, Tuple
 
-import pdfplumber
+import numpy as np
 import requests
 
+from src.crawlers.blob_store import CHUNK_SIZE, BlobStore
+from src.crawlers.extraction_backends import (
+    backend_name_for_path,
+    format_pages,
+    get_backend,
+    is_hwp_fallback_error,
+)
+from src.utils.cache_io import read_json, write_json
+
 try:
     import olefile
 except ImportError:
@@ -41,6 +54,16 @@ PRESS_TEXT_DIR = DATA_DIR / "03_press_conferences" / "opening_remarks" / "txt"
 ISSUE_PDF_DIR = DATA_DIR / "05_policy_reports" / "pdf"
 ISSUE_TEXT_DIR = DATA_DIR / "05_policy_reports" / "txt"
 
+# HWP 5.0 (OLE 복합 문서) 본문 레코드
+OLE_SIGNATURE = bytes.fromhex("D0CF11E0A1B11AE1")
+HWPTAG_PARA_TEXT = 67
+# 문자 제어 (1 WCHAR). 그 외 0x00~0x1F는 인라인/확장 제어 (8 WCHAR)
+HWP_CHAR_CONTROLS = frozenset({0, 10, 13, 24, 25, 26, 27, 28, 29, 30, 31})
+HWP_CONTROL_WIDTH = 8
+HWP_CONTROL_TEXT = {9: "\t", 10: "\n", 24: "-", 30: " ", 31: " "}
+HWP_CONTROL = re.compile("[\x00-\x1f]")
+HWP_WIDE_CONTROL = re.compile("[" + "".join(chr(c) for c in range(0x20) if c not in HWP_CHAR_CONTROLS) + "]")
+
 
 @dataclass
 class DownloadResult:
@@ -49,12 +72,15 @@ class DownloadResult:
     success: bool
     file_path: Optional[Path] = None
     error: Optional[str] = None
+    sha256: Optional[str] = None
+    reused: bool = False  # 다운로드 없이 blob 저장소의 기존 내용 사용
 
 
 class PDFDownloader:
     """PDF 다운로드 및 텍스트 추출기"""
 
-    def __init__(self):
+    def __init__(self, blob_store: Optional[BlobStore] = None):
+        self.blob_store = blob_store or BlobStore()
         self.session = requests.Session()
         self.session.headers.update(
             {
@@ -89,8 +115,21 @@ class PDFDownloader:
         except (AttributeError, ValueError):
             return "unknown", "00", "00"
 
-    def download_pdf(self, url: str, filename: str, output_dir: Optional[Path] = None) -> DownloadResult:
-        """PDF 파일을 다운로드합니다."""
+    def download_pdf(
+        self,
+        url: str,
+        filename: str,
+        output_dir: Optional[Path] = None,
+        retries: int = 2,
+    ) -> DownloadResult:
+        """
+        PDF 파일을 다운로드합니다.
+
+        임시 파일로 스트리밍하며 SHA-256을 계산하고, 연결이 끊기면 HTTP Range로
+        이어받습니다 (If-Range로 원본이 같은 버전일 때만). 내용은 blob 저장소에 한 번만 저장하고 대상 경로에는 링크합니다.
+        이전에 받은 URL이거나 같은 디렉토리에 동일 내용 파일이 있으면 새로 받거나
+        새 파일을 만들지 않습니다.
+        """
         if not url:
             return DownloadResult(success=False, error="URL이 비어있습니다")
 
@@ -102,108 +141,299 @@ class PDFDownloader:
             logger.info(f"이미 존재: {file_path}")
             return DownloadResult(success=True, file_path=file_path)
 
-        try:
-            logger.info(f"다운로드 중: {file_path}")
-            response = self.session.get(url, timeout=60, stream=True)
-            response.raise_for_status()
-
-            content_type = response.headers.get("Content-Type", "")
-            if "pdf" not in content_type.lower() and "octet-stream" not in content_type.lower():
-                logger.warning(f"예상치 못한 Content-Type: {content_type}")
-
-            with open(file_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+        known_sha = self.blob_store.sha_for_url(url)
+        if known_sha:
+            return self._place_blob(known_sha, file_path, url, reused=True)
 
-            if file_path.stat().st_size < 1000:
-                if file_path.exists():
-                    file_path.unlink()
-                return DownloadResult(success=False, error="파일이 너무 작음 (손상된 파일)")
+        error = None
+        for attempt in range(retries + 1):
+            try:
+                logger.info(f"다운로드 중: {file_path}" + (f" (재시도 {attempt})" if attempt else ""))
+                part_path, sha256 = self._stream_to_partial(url)
+                break
+            except (requests.RequestException, ValueError) as e:
+                error = str(e)
+                logger.warning(f"다운로드 중단 ({filename}): {e}")
+        else:
+            logger.error(f"다운로드 실패 ({filename}): {error}")
+            return DownloadResult(success=False, error=error)
+
+        if part_path.stat().st_size < 1000:
+            part_path.unlink()
+            return DownloadResult(success=False, error="파일이 너무 작음 (손상된 파일)")
+
+        self.blob_store.put(part_path, sha256)
+        result = self._place_blob(sha256, file_path, url)
+        logger.info(f"다운로드 완료: {result.file_path} ({result.file_path.stat().st_size:,} bytes)")
+        return result
 
-            logger.info(f"다운로드 완료: {file_path} ({file_path.stat().st_size:,} bytes)")
-            return DownloadResult(success=True, file_path=file_path)
+    @staticmethod
+    def _validator_path(part_path: Path) -> Path:
+        """임시 파일을 받을 때의 원본 검증자(ETag/Last-Modified) 저장 경로"""
+        return part_path.with_name(part_path.name + ".json")
 
-        except requests.RequestException as e:
-            logger.error(f"다운로드 실패 ({filename}): {e}")
-            return DownloadResult(success=False, error=str(e))
+    @staticmethod
+    def _response_validator(response: requests.Response) -> Dict[str, str]:
+        """If-Range에 쓸 수 있는 검증자 (약한 ETag는 If-Range에 사용할 수 없어 제외)"""
+        validator = {}
+        etag = response.headers.get("ETag")
+        if etag and not etag.startswith("W/"):
+            validator["etag"] = etag
+        if response.headers.get("Last-Modified"):
+            validator["last_modified"] = response.headers["Last-Modified"]
+        return validator
+
+    def _discard_partial(self, part_path: Path) -> None:
+        part_path.unlink(missing_ok=True)
+        self._validator_path(part_path).unlink(missing_ok=True)
+
+    def _stream_to_partial(self, url: str) -> Tuple[Path, str]:
+        """
+        URL을 임시 파일로 스트리밍 (기존 임시 파일이 있으면 Range로 이어받기)
+
+        이어받기는 처음 받을 때 저장한 ETag/Last-Modified를 If-Range로 보내 같은 버전일
+        때만 206으로 이어붙이고, 서버가 200으로 전체를 보내거나 검증자가 바뀌었으면
+        임시 파일을 버리고 처음부터 받습니다. 검증자가 없는 임시 파일은 이어붙이지 않습니다.
+
+        Returns:
+            (임시 파일 경로, SHA-256)
+        """
+        part_path = self.blob_store.partial_path(url)
+        validator_path = self._validator_path(part_path)
+        offset = part_path.stat().st_size if part_path.exists() else 0
+        saved = (read_json(validator_path) or {}) if offset else {}
+        if_range = saved.get("etag") or saved.get("last_modified")
+        if offset and not if_range:
+            logger.info("이어받기 검증자 없음: 처음부터 다시 받기")
+            self._discard_partial(part_path)
+            offset = 0
+        headers = {"Range": f"bytes={offset}-", "If-Range": if_range} if offset else {}
+
+        response = self.session.get(url, timeout=60, stream=True, headers=headers)
+        if response.status_code == 416:
+            # 서버가 범위를 거부: 처음부터 다시 받기
+            response.close()
+            self._discard_partial(part_path)
+            offset = 0
+            response = self.session.get(url, timeout=60, stream=True)
+        response.raise_for_status()
+
+        validator = self._response_validator(response)
+        if offset:
+            changed = any(key in validator and validator[key] != value for key, value in saved.items())
+            if response.status_code != 206 or changed:
+                logger.info(f"원본이 바뀌었거나 이어받기 불가 (HTTP {response.status_code}): 처음부터 다시 받기")
+                self._discard_partial(part_path)
+                offset = 0
+                if response.status_code == 206:
+                    # If-Range를 무시하고 바뀐 원본의 일부를 보낸 경우
+                    response.close()
+                    response = self.session.get(url, timeout=60, stream=True)
+                    response.raise_for_status()
+                    validator = self._response_validator(response)
+        if not offset:
+            if validator:
+                write_json(validator_path, validator)
+            else:
+                validator_path.unlink(missing_ok=True)
+
+        content_type = response.headers.get("Content-Type", "")
+        if "pdf" not in content_type.lower() and "octet-stream" not in content_type.lower():
+            logger.warning(f"예상치 못한 Content-Type: {content_type}")
+
+        digest = hashlib.sha256()
+        expected_size = None
+        if offset and response.status_code == 206:
+            # Content-Range: bytes <start>-<end>/<total>
+            match = re.match(r"bytes (\d+)-\d+/(\d+|\*)", response.headers.get("Content-Range", ""))
+            if not match or int(match.group(1)) != offset:
+                raise ValueError(f"예상치 못한 Content-Range: {response.headers.get('Content-Range')}")
+            if match.group(2) != "*":
+                expected_size = int(match.group(2))
+            with open(part_path, "rb") as f:
+                for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                    digest.update(chunk)
+            mode = "ab"
+            logger.info(f"이어받기: {offset:,} bytes부터")
+        else:
+            mode = "wb"
+            if response.headers.get("Content-Length") and not response.headers.get("Content-Encoding"):
+                expected_size = int(response.headers["Content-Length"])
+
+        with open(part_path, mode) as f:
+            for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                if chunk:
+                    f.write(chunk)
+                    digest.update(chunk)
+
+        size = part_path.stat().st_size
+        if expected_size is not None and size != expected_size:
+            if size > expected_size:
+                self._discard_partial(part_path)
+            raise ValueError(f"크기 불일치: {size:,} != {expected_size:,} bytes")
+        validator_path.unlink(missing_ok=True)
+        return part_path, digest.hexdigest()
+
+    def _place_blob(self, sha256: str, file_path: Path, url: str, reused: bool = False) -> DownloadResult:
+        """blob을 대상 경로에 연결 (같은 디렉토리의 동일 내용 파일이 있으면 그 경로 반환)"""
+        existing = self.blob_store.existing_path_in_dir(sha256, file_path.parent)
+        if existing is not None and existing != file_path:
+            logger.info(f"동일 내용 파일 존재: {existing.name} (새 파일 생략: {file_path.name})")
+            self.blob_store.record_path(existing, sha256, url)
+            return DownloadResult(success=True, file_path=existing, sha256=sha256, reused=True)
+
+        self.blob_store.link(sha256, file_path, url)
+        if reused:
+            logger.info(f"기존 blob 재사용: {file_path}")
+        return DownloadResult(success=True, file_path=file_path, sha256=sha256, reused=reused)
 
     @staticmethod
     def _is_hwp_compound(path: Path) -> bool:
         try:
-            return path.read_bytes()[:8] == bytes.fromhex("D0CF11E0A1B11AE1")
+            with open(path, "rb") as f:
+                return f.read(8) == OLE_SIGNATURE
         except OSError:
             return False
 
     @staticmethod
-    def _decode_hwp_section(section_data: bytes) -> str:
-        payload = section_data
-        try:
-            payload = zlib.decompress(section_data, -15)
-        except zlib.error:
-            payload = section_data
-
-        texts = []
-        pos = 0
-        size = len(payload)
-
-        while pos + 4 <= size:
-            header = int.from_bytes(payload[pos : pos + 4], "little")
-            tag_id = header & 0x3FF
-            rec_size = (header >> 20) & 0xFFF
-            pos += 4
-
-            if rec_size == 0xFFF:
-                if pos + 4 > size:
+    def _iter_hwp_records(
+        stream: BinaryIO,
+        tag_id: Optional[int] = None,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> Iterator[Tuple[int, memoryview]]:
+        """
+        BodyText 섹션 스트림의 (태그, 레코드 데이터) 순회 (tag_id 지정 시 해당 태그만)
+
+        압축 섹션은 chunk 단위로 풀면서 완성된 레코드만 내보내므로 섹션 전체를
+        메모리에 올리지 않습니다. 레코드 데이터는 버퍼의 memoryview로,
+        다음 레코드로 넘어가기 전에 사용해야 합니다.
+        """
+        decompressor = zlib.decompressobj(-15)
+        compressed = True
+        first = True
+        buffer = bytearray()
+
+        while True:
+            chunk = stream.read(chunk_size)
+            if compressed and chunk:
+                try:
+                    data = decompressor.decompress(chunk)
+                except zlib.error:
+                    if not first:
+                        logger.warning("HWP 섹션 압축 해제 실패, 이후 레코드를 건너뜁니다")
+                        return
+                    compressed = False  # 비압축 문서 (FileHeader 압축 플래그 off)
+                    data = chunk
+            elif compressed:
+                data = decompressor.flush()
+            else:
+                data = chunk
+            first = False
+            buffer += data
+
+            pos = 0
+            size = len(buffer)
+            view = memoryview(buffer)
+            while pos + 4 <= size:
+                (header,) = struct.unpack_from("<I", buffer, pos)
+                start = pos + 4
+                rec_size = (header >> 20) & 0xFFF
+                if rec_size == 0xFFF:
+                    if start + 4 > size:
+                        break
+                    (rec_size,) = struct.unpack_from("<I", buffer, start)
+                    start += 4
+                if start + rec_size > size:
                     break
-                rec_size = int.from_bytes(payload[pos : pos + 4], "little")
-                pos += 4
-
-            if pos + rec_size > size:
-                break
+                if tag_id is None or header & 0x3FF == tag_id:
+                    yield header & 0x3FF, view[start : start + rec_size]
+                pos = start + rec_size
 
-            record_data = payload[pos : pos + rec_size]
-            pos += rec_size
+            # 내보낸 view가 남아 있을 수 있으므로 제자리 삭제 대신 남은 부분만 새 버퍼로
+            buffer = buffer[pos:]
+            if not chunk:
+                return
 
-            if tag_id != 67 or not record_data:
+    @staticmethod
+    def _decode_para_text(record: memoryview) -> str:
+        """
+        PARA_TEXT 레코드(UTF-16LE) 디코딩
+
+        문자 제어(1 WCHAR)는 줄바꿈/하이픈/공백으로 바꾸거나 버리고,
+        인라인/확장 제어(8 WCHAR: 제어 코드 + 부가 정보)는 통째로 건너뜁니다.
+        """
+        n_units = len(record) // 2
+        text = str(record[: n_units * 2], "utf-16-le", "ignore")
+        if text.endswith("\r"):  # 문단 끝
+            text = text[:-1]
+        control = HWP_CONTROL.search(text)
+        if control is None:
+            return text
+        if not HWP_WIDE_CONTROL.search(text, control.start()):
+            # 문자 제어만 있으면 제어 코드와 WCHAR 위치가 어긋나지 않으므로 바로 치환
+            return HWP_CONTROL.sub(lambda m: HWP_CONTROL_TEXT.get(ord(m.group()), ""), text)
+
+        units = np.frombuffer(record, dtype="<u2", count=n_units)
+        controls = np.flatnonzero(units < 0x20)
+        parts = []
+        start = 0
+        for idx in controls.tolist():
+            if idx < start:  # 앞선 인라인/확장 제어의 부가 정보
                 continue
+            if idx > start:
+                parts.append(str(record[start * 2 : idx * 2], "utf-16-le", "ignore"))
+            code = int(units[idx])
+            parts.append(HWP_CONTROL_TEXT.get(code, ""))
+            start = idx + (1 if code in HWP_CHAR_CONTROLS else HWP_CONTROL_WIDTH)
+        if start < n_units:
+            parts.append(str(record[start * 2 : n_units * 2], "utf-16-le", "ignore"))
+        return "".join(parts)
 
-            text = record_data.decode("utf-16le", errors="ignore")
-            cleaned = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f]", "", text).strip()
+    @staticmethod
+    def _decode_hwp_stream(stream: BinaryIO) -> str:
+        texts = []
+        for _, record in PDFDownloader._iter_hwp_records(stream, HWPTAG_PARA_TEXT):
+            cleaned = PDFDownloader._decode_para_text(record).strip()
             if cleaned:
                 texts.append(cleaned)
-
         return "\n".join(texts)
 
-    def _extract_hwp_text(self, file_path: Path) -> Optional[str]:
+    @staticmethod
+    def _decode_hwp_section(section_data: bytes) -> str:
+        return PDFDownloader._decode_hwp_stream(io.BytesIO(section_data))
+
+    @staticmethod
+    def _iter_hwp_sections(file_path: Path) -> Iterator[str]:
+        """BodyText/SectionN 순서대로 섹션 텍스트 (한 번에 한 섹션만 메모리에 유지)"""
+        with olefile.OleFileIO(str(file_path)) as ole:
+            section_streams = [
+                "/".join(entry)
+                for entry in ole.listdir(streams=True, storages=False)
+                if len(entry) == 2 and entry[0] == "BodyText" and entry[1].startswith("Section")
+            ]
+
+            section_streams.sort(key=lambda name: int(name.split("Section")[-1]))
+
+            for stream_name in section_streams:
+                section_text = PDFDownloader._decode_hwp_stream(ole.openstream(stream_name))
+                if section_text:
+                    yield section_text
+
+    @staticmethod
+    def _extract_hwp_text(file_path: Path) -> Optional[str]:
         if olefile is None:
             logger.warning("olefile 미설치로 HWP 추출을 건너뜁니다")
             return None
 
-        if not self._is_hwp_compound(file_path):
+        if not PDFDownloader._is_hwp_compound(file_path):
             return None
 
         try:
-            with olefile.OleFileIO(str(file_path)) as ole:
-                section_streams = [
-                    "/".join(entry)
-                    for entry in ole.listdir(streams=True, storages=False)
-                    if len(entry) == 2 and entry[0] == "BodyText" and entry[1].startswith("Section")
-                ]
-
-                section_streams.sort(key=lambda name: int(name.split("Section")[-1]))
-
-                extracted_parts = []
-                for stream_name in section_streams:
-                    section_data = ole.openstream(stream_name).read()
-                    section_text = self._decode_hwp_section(section_data)
-                    if section_text:
-                        extracted_parts.append(section_text)
-
-                if not extracted_parts:
-                    return None
+            extracted_parts = list(PDFDownloader._iter_hwp_sections(file_path))
+            if not extracted_parts:
+                return None
 
-                return "\n\n".join(extracted_parts)
+            return "\n\n".join(extracted_parts)
 
         except Exception as exc:
             logger.error(f"HWP 텍스트 추출 실패 ({file_path.name}): {exc}")
@@ -222,29 +452,33 @@ class PDFDownloader:
             logger.info(f"이미 추출됨: {text_path}")
             return text_path
 
-        try:
-            logger.info(f"텍스트 추출 중: {pdf_path.name}")
-            all_text = []
+        # 동일 내용 PDF를 이미 추출했으면 캐시된 텍스트 재사용
+        backend_name = backend_name_for_path(pdf_path)
+        sha256 = self.blob_store.sha_for_path(pdf_path)
+        cached = self.blob_store.cached_text(sha256, backend_name) if sha256 else None
+        if cached is not None:
+            shutil.copyfile(cached, text_path)
+            logger.info(f"추출 텍스트 재사용: {text_path}")
+            return text_path
 
-            with pdfplumber.open(pdf_path) as pdf:
-                for i, page in enumerate(pdf.pages, 1):
-                    text = page.extract_text()
-                    if text:
-                        all_text.append(f"--- 페이지 {i} ---\n{text}")
+        try:
+            logger.info(f"텍스트 추출 중 ({backend_name}): {pdf_path.name}")
+            full_text = format_pages(get_backend(backend_name).extract_pages(pdf_path))
 
-            if not all_text:
+            if not full_text:
                 logger.warning(f"텍스트를 추출할 수 없음: {pdf_path.name}")
                 return None
 
-            full_text = "\n\n".join(all_text)
             with open(text_path, "w", encoding="utf-8") as f:
                 f.write(full_text)
+            if sha256:
+                self.blob_store.save_text(sha256, full_text, backend_name)
 
             logger.info(f"텍스트 추출 완료: {text_path} ({len(full_text):,} chars)")
             return text_path
 
         except Exception as e:
-            if "No /Root object" not in str(e):
+            if not is_hwp_fallback_error(e, pdf_path):
                 logger.error(f"텍스트 추출 실패 ({pdf_path.name}): {e}")
                 return None
 
@@ -256,6 +490,8 @@ class PDFDownloader:
 
             with open(text_path, "w", encoding="utf-8") as f:
                 f.write(hwp_text)
+            if sha256:
+                self.blob_store.save_text(sha256, hwp_text, backend_name)
 
             logger.info(f"HWP fallback 텍스트 추출 완료: {text_path} ({len(hwp_text):,} chars)")
             return text_path
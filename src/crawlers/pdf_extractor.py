@@ -0,0 +1,329 @@
+"""
+프로세스 풀 기반 PDF 텍스트 일괄 추출
+
+PDFDownloader.extract_text_to_dir는 한 파일씩 단일 스레드로 추출합니다.
+이 모듈은 여러 PDF를 프로세스 풀에 나누어 처리하며, 큰 보고서는 페이지 구간
+단위로 쪼개 여러 프로세스가 동시에 추출합니다.
+
+- 페이지별 결과를 임시 디렉토리(.pages/<파일명>/)에 원자적으로 기록
+  → 중단 후 재실행 시 끝난 페이지는 건너뜀
+- 모든 페이지가 끝나면 extract_text_to_dir와 같은 형식으로 병합
+- 추출 백엔드는 문서 카테고리 설정(extraction_backends)을 따르거나 직접 지정
+- PDF 파싱이 실패하면(HWP 문서) 기존 HWP fallback 경로로 추출
+- 선택 시 인용 검색용 페이지 캐시(src.utils.pdf_page_cache)도 함께 생성
+- 처리 페이지 수와 pages/sec 보고
+"""
+
+import argparse
+import logging
+import os
+import shutil
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.crawlers.blob_store import BlobStore
+from src.crawlers.extraction_backends import (
+    BACKENDS,
+    backend_name_for_path,
+    format_pages,
+    get_backend,
+    is_hwp_fallback_error,
+)
+from src.utils.cache_io import write_text
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DATA_DIR = PROJECT_ROOT / "data"
+
+PAGE_DIR_NAME = ".pages"
+PAGES_PER_TASK = 8
+
+
+@dataclass
+class ExtractionReport:
+    """일괄 추출 결과"""
+
+    files: int = 0
+    extracted: int = 0
+    skipped: int = 0
+    failed: int = 0
+    hwp_fallback: int = 0
+    page_caches: int = 0
+    pages: int = 0
+    seconds: float = 0.0
+    failures: List[str] = field(default_factory=list)
+
+    @property
+    def pages_per_sec(self) -> float:
+        return self.pages / self.seconds if self.seconds > 0 else 0.0
+
+
+def text_path_for(pdf_path: Path) -> Path:
+    """데이터 트리 규칙에 따른 텍스트 출력 경로 (.../pdf/x.pdf → .../txt/x.txt)"""
+    pdf_path = Path(pdf_path)
+    parent = pdf_path.parent
+    if parent.name == "pdf":
+        text_dir = parent.parent / "txt"
+    elif parent.name == "pdfs":
+        text_dir = parent.parent / "texts"
+    else:
+        text_dir = parent / "txt"
+    return text_dir / f"{pdf_path.stem}.txt"
+
+
+def _page_dir(text_path: Path) -> Path:
+    return text_path.parent / PAGE_DIR_NAME / text_path.stem
+
+
+# ----------------------------------------------------------------------
+# 프로세스 풀 작업 (모듈 수준 함수여야 spawn 환경에서 pickle 가능)
+# ----------------------------------------------------------------------
+
+
+def _count_pages(pdf_path: str, backend: str) -> Tuple[str, int]:
+    """("pdf", 페이지 수) 또는 PDF 파싱 실패 시 ("hwp", 0)"""
+    try:
+        return "pdf", get_backend(backend).page_count(Path(pdf_path))
+    except Exception as exc:
+        if is_hwp_fallback_error(exc, Path(pdf_path)):
+            return "hwp", 0
+        raise
+
+
+def _extract_pages(pdf_path: str, backend: str, page_dir: str, start: int, end: int) -> int:
+    """[start, end) 페이지를 페이지별 파일로 기록, 새로 추출한 페이지 수 반환"""
+    out_dir = Path(page_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    todo = [i for i in range(start, end) if not (out_dir / f"{i + 1:05d}.txt").exists()]
+    if not todo:
+        return 0
+    for i, text in zip(todo, get_backend(backend).extract_pages(Path(pdf_path), todo)):
+        write_text(out_dir / f"{i + 1:05d}.txt", text)
+    return len(todo)
+
+
+def _build_page_cache(pdf_path: str) -> str:
+    """인용 검색용 페이지 텍스트/단어 좌표 캐시 생성"""
+    from src.utils.pdf_page_cache import ensure_page_cache
+
+    return str(ensure_page_cache(Path(pdf_path)))
+
+
+def _extract_hwp(pdf_path: str) -> Optional[str]:
+    """HWP fallback (PDFDownloader와 같은 디코더 사용)"""
+    from src.crawlers.pdf_downloader import PDFDownloader
+
+    return PDFDownloader._extract_hwp_text(Path(pdf_path))
+
+
+def _merge_pages(page_dir: Path, n_pages: int) -> str:
+    """페이지 파일을 extract_text_to_dir와 같은 형식으로 병합"""
+    return format_pages(
+        [(page_dir / f"{i:05d}.txt").read_text(encoding="utf-8") for i in range(1, n_pages + 1)]
+    )
+
+
+class BatchExtractor:
+    """PDF 여러 개를 프로세스 풀에서 페이지 구간 단위로 추출"""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        pages_per_task: int = PAGES_PER_TASK,
+        overwrite: bool = False,
+        blob_store: Optional[BlobStore] = None,
+        backend: Optional[str] = None,
+        page_cache: bool = False,
+    ):
+        """
+        Args:
+            max_workers: 프로세스 수 (None이면 CPU 수)
+            pages_per_task: 작업 하나가 맡는 최대 페이지 수
+            overwrite: 기존 텍스트 파일이 있어도 다시 추출
+            blob_store: 추출 텍스트를 blob 단위로 캐시할 저장소 (None이면 캐시 안 함)
+            backend: 추출 백엔드 이름 (None이면 문서 카테고리 설정을 따름)
+            page_cache: PDFTextLocator용 페이지 캐시도 생성 (텍스트가 이미 있는 PDF 포함)
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.pages_per_task = max(1, pages_per_task)
+        self.overwrite = overwrite
+        self.blob_store = blob_store
+        if backend is not None:
+            get_backend(backend)  # 잘못된 이름/미설치는 시작 전에 오류
+        self.backend = backend
+        self.page_cache = page_cache
+
+    def _finish(
+        self, pdf_path: Path, text_path: Path, text: Optional[str], backend: str, report: ExtractionReport
+    ) -> None:
+        if not text:
+            logger.warning(f"텍스트를 추출할 수 없음: {pdf_path.name}")
+            report.failed += 1
+            report.failures.append(str(pdf_path))
+            return
+        text_path.parent.mkdir(parents=True, exist_ok=True)
+        write_text(text_path, text)
+        report.extracted += 1
+        if self.blob_store is not None:
+            sha256 = self.blob_store.sha_for_path(pdf_path)
+            if sha256:
+                self.blob_store.save_text(sha256, text, backend)
+
+    def run(self, jobs: Sequence[Tuple[Path, Path]]) -> ExtractionReport:
+        """
+        일괄 추출
+
+        Args:
+            jobs: (PDF 경로, 텍스트 출력 경로) 목록
+
+        Returns:
+            ExtractionReport
+        """
+        report = ExtractionReport(files=len(jobs))
+        started = time.perf_counter()
+
+        pending_jobs, cache_jobs = [], []
+        for pdf_path, text_path in jobs:
+            pdf_path, text_path = Path(pdf_path), Path(text_path)
+            if self.page_cache and pdf_path.exists():
+                cache_jobs.append((pdf_path, text_path))
+            if not pdf_path.exists():
+                logger.error(f"PDF 파일이 존재하지 않음: {pdf_path}")
+                report.failed += 1
+                report.failures.append(str(pdf_path))
+            elif not self.overwrite and text_path.exists() and text_path.stat().st_size > 0:
+                report.skipped += 1
+            else:
+                pending_jobs.append((pdf_path, text_path))
+
+        with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+            futures: Dict[Future, Tuple[str, Path, Path]] = {}
+            backends: Dict[Path, str] = {}
+            remaining: Dict[Path, int] = {}
+            page_counts: Dict[Path, int] = {}
+
+            for pdf_path, text_path in pending_jobs:
+                backends[pdf_path] = self.backend or backend_name_for_path(pdf_path)
+                task = pool.submit(_count_pages, str(pdf_path), backends[pdf_path])
+                futures[task] = ("count", pdf_path, text_path)
+            for pdf_path, text_path in cache_jobs:
+                futures[pool.submit(_build_page_cache, str(pdf_path))] = ("cache", pdf_path, text_path)
+
+            while futures:
+                done, _ = wait(list(futures), return_when=FIRST_COMPLETED)
+                for future in done:
+                    kind, pdf_path, text_path = futures.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as exc:
+                        if kind == "cache":
+                            logger.warning(f"페이지 캐시 생성 실패 ({pdf_path.name}): {exc}")
+                            continue
+                        if kind == "pages" and pdf_path not in remaining:
+                            continue  # 같은 파일의 다른 구간 실패로 이미 집계
+                        logger.error(f"텍스트 추출 실패 ({pdf_path.name}): {exc}")
+                        report.failed += 1
+                        report.failures.append(str(pdf_path))
+                        remaining.pop(pdf_path, None)
+                        continue
+
+                    if kind == "count":
+                        doc_type, n_pages = result
+                        if doc_type == "hwp":
+                            logger.warning(f"PDF 파싱 실패, HWP fallback 시도: {pdf_path.name}")
+                            futures[pool.submit(_extract_hwp, str(pdf_path))] = ("hwp", pdf_path, text_path)
+                            continue
+                        if n_pages == 0:
+                            self._finish(pdf_path, text_path, None, backends[pdf_path], report)
+                            continue
+                        page_dir = _page_dir(text_path)
+                        if self.overwrite and page_dir.exists():
+                            shutil.rmtree(page_dir)
+                        page_counts[pdf_path] = n_pages
+                        starts = range(0, n_pages, self.pages_per_task)
+                        remaining[pdf_path] = len(starts)
+                        for start in starts:
+                            end = min(start + self.pages_per_task, n_pages)
+                            task = pool.submit(
+                                _extract_pages, str(pdf_path), backends[pdf_path], str(page_dir), start, end
+                            )
+                            futures[task] = ("pages", pdf_path, text_path)
+
+                    elif kind == "pages":
+                        report.pages += result
+                        if pdf_path not in remaining:
+                            continue  # 같은 파일의 다른 구간이 이미 실패
+                        remaining[pdf_path] -= 1
+                        if remaining[pdf_path] == 0:
+                            del remaining[pdf_path]
+                            page_dir = _page_dir(text_path)
+                            text = _merge_pages(page_dir, page_counts[pdf_path])
+                            self._finish(pdf_path, text_path, text, backends[pdf_path], report)
+                            shutil.rmtree(page_dir, ignore_errors=True)
+                            try:
+                                page_dir.parent.rmdir()
+                            except OSError:
+                                pass  # 다른 파일 작업이 남아 있음
+
+                    elif kind == "cache":
+                        report.page_caches += 1
+
+                    elif kind == "hwp":
+                        if result:
+                            report.hwp_fallback += 1
+                        self._finish(pdf_path, text_path, result, backends[pdf_path], report)
+
+        report.seconds = time.perf_counter() - started
+        logger.info(
+            f"일괄 추출 완료: {report.extracted}개 추출, {report.skipped}개 스킵, {report.failed}개 실패, "
+            f"{report.pages}페이지 / {report.seconds:.1f}s ({report.pages_per_sec:.1f} pages/sec)"
+        )
+        return report
+
+
+def collect_jobs(paths: Sequence[Path]) -> List[Tuple[Path, Path]]:
+    """파일/디렉토리 목록에서 (PDF, 텍스트 경로) 작업 수집 (blob 저장소 제외)"""
+    jobs = []
+    for path in paths:
+        path = Path(path)
+        candidates = [path] if path.is_file() else sorted(path.rglob("*.pdf"))
+        for pdf_path in candidates:
+            if "blobs" in pdf_path.relative_to(path.parent if path.is_file() else path).parts:
+                continue
+            jobs.append((pdf_path, text_path_for(pdf_path)))
+    return jobs
+
+
+def main():
+    """데이터 트리 PDF 일괄 추출"""
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    parser = argparse.ArgumentParser(description="PDF 텍스트 일괄 추출 (프로세스 풀)")
+    parser.add_argument("paths", nargs="*", type=Path, default=[DATA_DIR], help="PDF 파일 또는 디렉토리")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--pages-per-task", type=int, default=PAGES_PER_TASK)
+    parser.add_argument("--overwrite", action="store_true", help="기존 텍스트도 다시 추출")
+    parser.add_argument("--page-cache", action="store_true", help="인용 검색용 페이지 캐시도 생성")
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default=None, help="추출 백엔드 (기본: 카테고리 설정)")
+    args = parser.parse_args()
+
+    extractor = BatchExtractor(
+        max_workers=args.workers,
+        pages_per_task=args.pages_per_task,
+        overwrite=args.overwrite,
+        blob_store=BlobStore(),
+        backend=args.backend,
+        page_cache=args.page_cache,
+    )
+    report = extractor.run(collect_jobs(args.paths))
+    print(f"PDF: {report.files}개 (추출 {report.extracted}, 스킵 {report.skipped}, 실패 {report.failed}, HWP {report.hwp_fallback})")
+    if args.page_cache:
+        print(f"페이지 캐시: {report.page_caches}개")
+    print(f"페이지: {report.pages}개, {report.seconds:.1f}s, {report.pages_per_sec:.1f} pages/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Asyncio politeness primitives for the BOK crawlers.
+
+TokenBucket paces requests to a steady rate with a small burst allowance,
+and HostLimiter combines a per-host token bucket with a per-host semaphore
+so that at most ``max_per_host`` requests are in flight to any one host.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """Token bucket refilled at ``rate`` tokens per second, holding up to ``capacity`` tokens."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until one token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) / self.rate)
+
+
+class HostLimiter:
+    """Per-host concurrency cap plus per-host token-bucket rate."""
+
+    def __init__(self, max_per_host: int = 4, rate_per_host: float = 2.0, burst: Optional[float] = None) -> None:
+        self.max_per_host = max(1, int(max_per_host))
+        self.rate_per_host = rate_per_host
+        self.burst = burst
+        self._hosts: Dict[str, Tuple[asyncio.Semaphore, TokenBucket]] = {}
+
+    def _for_host(self, host: str) -> Tuple[asyncio.Semaphore, TokenBucket]:
+        if host not in self._hosts:
+            self._hosts[host] = (
+                asyncio.Semaphore(self.max_per_host),
+                TokenBucket(self.rate_per_host, self.burst),
+            )
+        return self._hosts[host]
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        """Hold a concurrency slot for the URL's host after taking a rate token."""
+        semaphore, bucket = self._for_host(urlparse(url).netloc)
+        async with semaphore:
+            await bucket.acquire()
+            yield
@@ -0,0 +1,83 @@
+"""
+Persisted per-publication index of already-crawled BOK articles.
+
+Each publication keeps a JSON file mapping ``ntt_id`` to a hash of the
+article's list entry (title, date, URL, department) plus the PDF URLs and
+files it produced. An incremental crawl skips the detail fetch for articles
+whose hash is unchanged and stops paging at the first page on which every
+article is already known. Articles whose downloads failed are not recorded,
+so they are retried on the next run.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from src.utils.cache_io import read_json, write_json
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DEFAULT_INDEX_DIR = PROJECT_ROOT / "data" / "manifests" / "seen_articles"
+INDEX_VERSION = 1
+
+
+def article_hash(article) -> str:
+    """SHA-256 of the list-page fields that identify an article version."""
+    payload = "\x1f".join(
+        str(getattr(article, field, "") or "") for field in ("ntt_id", "title", "date", "url", "department")
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SeenArticleIndex:
+    """JSON-backed set of processed articles for one publication."""
+
+    def __init__(self, pub_key: str, index_dir: Optional[Path] = None) -> None:
+        self.pub_key = pub_key
+        self.index_dir = Path(index_dir) if index_dir is not None else DEFAULT_INDEX_DIR
+        self.path = self.index_dir / f"{pub_key}.json"
+        self._entries: Dict[str, Dict] = self._load()
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Dict]:
+        data = read_json(self.path)
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return {}
+        return data.get("articles", {})
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, ntt_id: str) -> bool:
+        return ntt_id in self._entries
+
+    def is_seen(self, article) -> bool:
+        """True if the article was processed before and its list entry is unchanged."""
+        entry = self._entries.get(article.ntt_id)
+        return entry is not None and entry.get("hash") == article_hash(article)
+
+    def all_seen(self, articles: Iterable) -> bool:
+        articles = list(articles)
+        return bool(articles) and all(self.is_seen(article) for article in articles)
+
+    def mark(self, article, pdf_urls: List[str], files: List[str]) -> None:
+        """Record a fully processed article."""
+        self._entries[article.ntt_id] = {
+            "hash": article_hash(article),
+            "title": article.title,
+            "date": article.date,
+            "url": article.url,
+            "pdf_urls": list(pdf_urls),
+            "files": list(files),
+            "seen_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        self._dirty = True
+
+    def save(self) -> None:
+        """Atomically write the index if it changed."""
+        if not self._dirty:
+            return
+        write_json(self.path, {"version": INDEX_VERSION, "publication": self.pub_key, "articles": self._entries})
+        self._dirty = False
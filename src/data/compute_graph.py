@@ -0,0 +1,214 @@
+# pyright: basic, reportArgumentType=false, reportCallIssue=false, reportAttributeAccessIssue=false, reportReturnType=false
+"""
+Memoized computation graph for shared market series.
+
+Named nodes ("base_rate.daily", "ktb_3y.monthly_last", "yield_spread",
+"implied_policy_rate", ...) are computed once per data version and shared
+by the Taylor rule, term premium and expectation divergence analyzers.
+A node's version is the (mtime, size) signature of the CSVs it reads plus
+the versions of its dependencies, so editing one CSV only invalidates the
+nodes downstream of it. Independent nodes can be evaluated concurrently.
+"""
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from src.utils.cache_io import stat_signature
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+DAILY_SERIES = {
+    "base_rate": ("08_ecos/base_rate/base_rate.csv", "Base_Rate"),
+    "ktb_3y": ("08_ecos/bond_yields/ktb_3y.csv", "KTB_3Y"),
+    "ktb_10y": ("08_ecos/bond_yields/ktb_10y.csv", "KTB_10Y"),
+}
+
+
+@dataclass
+class GraphNode:
+    name: str
+    func: Callable[..., Any]
+    deps: Tuple[str, ...] = ()
+    files: Tuple[str, ...] = ()
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class ComputationGraph:
+    """Registry of named, memoized computations keyed by data version."""
+
+    def __init__(self, data_dir: Optional[Path] = None) -> None:
+        self.data_dir = Path(data_dir) if data_dir is not None else PROJECT_ROOT / "data"
+        self._nodes: Dict[str, GraphNode] = {}
+        self._memo: Dict[str, Tuple[Tuple, Any]] = {}
+
+    def register(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        deps: Sequence[str] = (),
+        files: Sequence[str] = (),
+    ) -> None:
+        """Register a node. ``func`` receives the dependency values positionally."""
+        missing = [dep for dep in deps if dep not in self._nodes]
+        if missing:
+            raise ValueError(f"Unknown dependencies for {name}: {missing}")
+        self._nodes[name] = GraphNode(name=name, func=func, deps=tuple(deps), files=tuple(files))
+        self._memo.pop(name, None)
+
+    @property
+    def nodes(self) -> List[str]:
+        return list(self._nodes)
+
+    def _node(self, name: str) -> GraphNode:
+        if name not in self._nodes:
+            raise KeyError(f"Unknown graph node: {name}")
+        return self._nodes[name]
+
+    def version(self, name: str) -> Tuple:
+        """Data version of a node: its file signatures plus dependency versions."""
+        node = self._node(name)
+        signature = []
+        for relative_path in node.files:
+            path = self.data_dir / relative_path
+            if not path.exists():
+                raise FileNotFoundError(f"CSV file not found: {path}")
+            signature.append((relative_path, *stat_signature(path)))
+        return tuple(signature) + tuple(self.version(dep) for dep in node.deps)
+
+    def get(self, name: str) -> Any:
+        """Node value, computed at most once per data version. DataFrames are returned as copies."""
+        node = self._node(name)
+        version = self.version(name)
+        with node.lock:
+            cached = self._memo.get(name)
+            if cached is None or cached[0] != version:
+                args = [self.get(dep) for dep in node.deps]
+                cached = (version, node.func(*args))
+                self._memo[name] = cached
+        value = cached[1]
+        return value.copy() if isinstance(value, pd.DataFrame) else value
+
+    def _levels(self, names: Iterable[str]) -> List[List[str]]:
+        """Group the requested nodes and their ancestors into dependency levels."""
+        depth: Dict[str, int] = {}
+
+        def visit(name: str) -> int:
+            if name not in depth:
+                node = self._node(name)
+                depth[name] = 1 + max((visit(dep) for dep in node.deps), default=-1)
+            return depth[name]
+
+        for name in names:
+            visit(name)
+        levels: List[List[str]] = [[] for _ in range(max(depth.values(), default=-1) + 1)]
+        for name, level in depth.items():
+            levels[level].append(name)
+        return levels
+
+    def evaluate(self, names: Sequence[str], max_workers: int = 4) -> Dict[str, Any]:
+        """Evaluate several nodes, running independent nodes of each level concurrently."""
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for level in self._levels(names):
+                list(pool.map(self.get, level))
+        return {name: self.get(name) for name in names}
+
+    def clear(self) -> None:
+        self._memo.clear()
+
+
+def _load_daily_series(data_dir: Path, relative_csv: str, value_name: str) -> pd.DataFrame:
+    df = pd.read_csv(data_dir / relative_csv, usecols=["TIME", "DATA_VALUE"])
+    df["Date"] = pd.to_datetime(df["TIME"].astype(str), format="%Y%m%d", errors="coerce")
+    df[value_name] = pd.to_numeric(df["DATA_VALUE"], errors="coerce")
+    out = df[["Date", value_name]].dropna().sort_values("Date")
+    return out.groupby("Date", as_index=False).last()
+
+
+def _to_monthly_last(df: pd.DataFrame) -> pd.DataFrame:
+    out = df.copy()
+    out["Date"] = out["Date"].dt.to_period("M").dt.to_timestamp("M")
+    return out.groupby("Date", as_index=False).last()
+
+
+def _yield_spread(y3: pd.DataFrame, y10: pd.DataFrame) -> pd.DataFrame:
+    df = y3.merge(y10, on="Date", how="inner")
+    df["Yield_Spread"] = df["KTB_10Y"] - df["KTB_3Y"]
+    return df
+
+
+def _implied_policy_rate(spread: pd.DataFrame, base: pd.DataFrame) -> pd.DataFrame:
+    df = spread.merge(base, on="Date", how="left")
+    df["Base_Rate"] = df["Base_Rate"].ffill()
+    df["Implied_Policy_Rate"] = df["KTB_3Y"] - (0.25 * df["Yield_Spread"])
+    df["Implied_Policy_Rate_Smoothed"] = df["Implied_Policy_Rate"].rolling(window=20, min_periods=1).mean()
+    return df[
+        [
+            "Date",
+            "Base_Rate",
+            "KTB_3Y",
+            "KTB_10Y",
+            "Yield_Spread",
+            "Implied_Policy_Rate",
+            "Implied_Policy_Rate_Smoothed",
+        ]
+    ]
+
+
+def _rates_monthly(y3: pd.DataFrame, y10: pd.DataFrame, base: pd.DataFrame) -> pd.DataFrame:
+    merged = y3.merge(y10, on="Date", how="inner")
+    merged = merged.merge(base, on="Date", how="inner")
+    return merged.sort_values("Date").reset_index(drop=True)
+
+
+def _tone_meetings(data_dir: Path) -> pd.DataFrame:
+    tone = pd.read_csv(data_dir / "analysis/tone_index_results.csv")
+    tone["Date"] = pd.to_datetime(tone["meeting_date"], errors="coerce")
+    tone["tone_index"] = pd.to_numeric(tone["tone_index"], errors="coerce")
+    return tone[["Date", "meeting_date_str", "tone_index"]].dropna().sort_values("Date")
+
+
+def build_market_graph(data_dir: Optional[Path] = None) -> ComputationGraph:
+    """Graph with the standard market-series nodes used across analyzers."""
+    graph = ComputationGraph(data_dir)
+    root = graph.data_dir
+
+    for series, (relative_csv, value_name) in DAILY_SERIES.items():
+        graph.register(
+            f"{series}.daily",
+            lambda path=relative_csv, col=value_name: _load_daily_series(root, path, col),
+            files=[relative_csv],
+        )
+        graph.register(f"{series}.monthly_last", _to_monthly_last, deps=[f"{series}.daily"])
+
+    graph.register("yield_spread", _yield_spread, deps=["ktb_3y.daily", "ktb_10y.daily"])
+    graph.register("implied_policy_rate", _implied_policy_rate, deps=["yield_spread", "base_rate.daily"])
+    graph.register(
+        "rates.monthly",
+        _rates_monthly,
+        deps=["ktb_3y.monthly_last", "ktb_10y.monthly_last", "base_rate.monthly_last"],
+    )
+    graph.register(
+        "tone.meetings",
+        lambda: _tone_meetings(root),
+        files=["analysis/tone_index_results.csv"],
+    )
+    return graph
+
+
+_DEFAULT_GRAPHS: Dict[str, ComputationGraph] = {}
+_DEFAULT_GRAPHS_LOCK = threading.Lock()
+
+
+def get_market_graph(data_dir: Optional[Path] = None) -> ComputationGraph:
+    """Process-wide shared market graph for a data directory."""
+    key = str(Path(data_dir).resolve() if data_dir is not None else (PROJECT_ROOT / "data").resolve())
+    with _DEFAULT_GRAPHS_LOCK:
+        if key not in _DEFAULT_GRAPHS:
+            _DEFAULT_GRAPHS[key] = build_market_graph(Path(key))
+        return _DEFAULT_GRAPHS[key]
@@ -513,6 +513,27 @@ class DatabaseManager:
         conn.close()
         return comments
 
+    def get_all_expert_comments(self) -> List[Dict]:
+        """
+        전체 전문가 주석 조회 (인용 일괄 검증용)
+
+        Returns:
+            주석 리스트 (id, meeting_date 포함)
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute("""
+        SELECT id, meeting_date, quote, comment, expert_name, created_at
+        FROM expert_comments
+        ORDER BY meeting_date, id
+        """)
+
+        comments = [dict(row) for row in cursor.fetchall()]
+
+        conn.close()
+        return comments
+
     def save_model_parameter(self, name: str, value: float, description: str = ""):
         """
         모델 파라미터 저장 (α, β, γ 등)
@@ -20,6 +20,8 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from src.data.ecos_api import EcosAPI, StatCode
 from src.data.database import DatabaseManager
+from src.data.event_study import REACTION_WEIGHTS, EventStudy
+from src.data.panel_store import WidePanel
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -273,6 +275,36 @@ class EcosConnector:
 
         return market_reaction
 
+    def calculate_market_reaction_batch(
+        self,
+        meeting_dates: List[str],
+        days_before: int = 5,
+        days_after: int = 10,
+        weights: Optional[Dict[str, float]] = None
+    ) -> pd.Series:
+        """
+        여러 회의의 시장 반응 점수 일괄 계산
+
+        calculate_market_reaction과 같은 정의이지만, 지표별 시계열을 한 번만
+        조회하고 모든 회의의 윈도우를 벡터화해 계산합니다.
+
+        Args:
+            meeting_dates: 회의 날짜 목록 (YYYY-MM-DD)
+            days_before: 기준일 (T-n)
+            days_after: 측정일 (T+m)
+            weights: 지표별 가중치 (None이면 기본값 사용)
+
+        Returns:
+            회의 날짜 인덱스의 시장 반응 점수 Series
+        """
+        weights = weights or REACTION_WEIGHTS
+        study = EventStudy.from_database(self.db, weights.keys())
+        scores = study.market_reaction(meeting_dates, days_before, days_after, weights)
+
+        logger.info(f"시장 반응 일괄 계산 완료: {len(scores)}개 회의")
+
+        return scores
+
     def get_indicator_for_date_range(
         self,
         indicator_name: str,
@@ -295,7 +327,8 @@ class EcosConnector:
     def get_correlation_matrix(
         self,
         tone_df: pd.DataFrame,
-        indicators: Optional[List[str]] = None
+        indicators: Optional[List[str]] = None,
+        panel: Optional[WidePanel] = None
     ) -> pd.DataFrame:
         """
         톤 지수와 여러 지표 간 상관관계 행렬
@@ -303,6 +336,7 @@ class EcosConnector:
         Args:
             tone_df: 톤 지수 DataFrame
             indicators: 지표 리스트 (None이면 주요 지표 사용)
+            panel: 정렬 지표 패널 (주어지면 DB 조회/merge_asof 대신 패널에서 조회)
 
         Returns:
             상관관계 행렬 DataFrame
@@ -314,7 +348,17 @@ class EcosConnector:
         all_data = tone_df[['meeting_date', 'tone_index']].copy()
         all_data['meeting_date'] = pd.to_datetime(all_data['meeting_date'])
 
-        for indicator in indicators:
+        if panel is not None:
+            # 패널에 있는 지표는 회의일 기준 가장 가까운 관측치를 한 번에 조회
+            in_panel = [indicator for indicator in indicators if indicator in panel]
+            looked_up = panel.lookup(all_data['meeting_date'], in_panel, direction='nearest')
+            for indicator in in_panel:
+                all_data[indicator] = looked_up[indicator].values
+            indicators_from_db = [indicator for indicator in indicators if indicator not in panel]
+        else:
+            indicators_from_db = indicators
+
+        for indicator in indicators_from_db:
             df_indicator = self.db.get_market_data(indicator)
 
             if df_indicator.empty:
@@ -0,0 +1,260 @@
+"""
+금통위 전후 시장 반응 이벤트 스터디 엔진
+
+지표별 시계열을 한 번만 로드해 정렬된 날짜 배열로 보관하고, 모든 회의일과
+여러 이벤트 윈도우([-1,+1], [-5,+10], ...)에 대해 searchsorted로 윈도우 경계를
+한 번에 찾습니다. 회의 × 지표 × 윈도우마다 DB를 조회하던 방식을 대체합니다.
+
+- 윈도우 전/후 수준, 변화량, 변화율
+- 추정 구간의 평균 일간 변화를 제거한 누적 비정상 변화(CAR)
+- EcosConnector.calculate_market_reaction과 같은 정의의 시장 반응 점수
+"""
+
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+ECOS_DIR = PROJECT_ROOT / "data" / "08_ecos"
+
+DEFAULT_WINDOWS: Tuple[Tuple[int, int], ...] = ((-1, 1), (-5, 10))
+
+# 시장 반응 점수 기본 가중치 (EcosConnector.calculate_market_reaction과 동일)
+REACTION_WEIGHTS = {
+    'usd_krw': 0.25,     # 환율
+    'ktb_3y': 0.35,      # 금리 (국고채 3년)
+    'kospi': 0.20,       # 주가
+    'term_spread': 0.20  # 신용 스프레드
+}
+# 주가 상승 = 완화 신호 = 비둘기파 (-)
+REACTION_SIGNS = {'kospi': -1.0}
+
+CSV_SERIES = {
+    'base_rate': "base_rate/base_rate.csv",
+    'ktb_3y': "bond_yields/ktb_3y.csv",
+    'ktb_10y': "bond_yields/ktb_10y.csv",
+    'usd_krw': "exchange_rates/usd_krw.csv",
+    'kospi': "stock_indices/kospi.csv",
+}
+
+
+def _to_days(values) -> np.ndarray:
+    return pd.to_datetime(pd.Series(values), format="mixed").to_numpy(dtype="datetime64[D]")
+
+
+class EventStudy:
+    """정렬된 일별 시계열 위에서 동작하는 벡터화 이벤트 스터디"""
+
+    def __init__(self, series: Dict[str, pd.DataFrame]):
+        """
+        Args:
+            series: {지표명: DataFrame(date, value)}
+        """
+        self._dates: Dict[str, np.ndarray] = {}
+        self._values: Dict[str, np.ndarray] = {}
+        for name, df in series.items():
+            if df is None or df.empty:
+                continue
+            clean = df[['date', 'value']].copy()
+            clean['date'] = pd.to_datetime(clean['date']).dt.normalize()
+            clean['value'] = pd.to_numeric(clean['value'], errors='coerce')
+            clean = clean.dropna().sort_values('date').drop_duplicates('date', keep='last')
+            self._dates[name] = clean['date'].to_numpy(dtype="datetime64[D]")
+            self._values[name] = clean['value'].to_numpy(dtype=float)
+
+    @property
+    def indicators(self):
+        return list(self._dates)
+
+    @classmethod
+    def from_database(cls, db, indicators: Iterable[str]) -> "EventStudy":
+        """DatabaseManager market_indicators에서 지표별로 한 번씩 로드"""
+        series = {}
+        for name in indicators:
+            df = db.get_market_data(name)
+            if df.empty:
+                continue
+            series[name] = df.rename(columns={'indicator_date': 'date'})[['date', 'value']]
+        return cls(series)
+
+    @classmethod
+    def from_csv(cls, ecos_dir: Optional[Path] = None) -> "EventStudy":
+        """ECOS CSV(data/08_ecos)에서 로드, term_spread = 10년 - 3년"""
+        ecos_dir = Path(ecos_dir) if ecos_dir is not None else ECOS_DIR
+        series = {}
+        for name, relative_path in CSV_SERIES.items():
+            path = ecos_dir / relative_path
+            if not path.exists():
+                continue
+            raw = pd.read_csv(path, usecols=['TIME', 'DATA_VALUE'], dtype={'TIME': str}, encoding='utf-8-sig')
+            series[name] = pd.DataFrame({
+                'date': pd.to_datetime(raw['TIME'], format='%Y%m%d', errors='coerce'),
+                'value': pd.to_numeric(raw['DATA_VALUE'], errors='coerce'),
+            }).dropna()
+
+        if 'ktb_3y' in series and 'ktb_10y' in series:
+            spread = series['ktb_10y'].merge(series['ktb_3y'], on='date', suffixes=('_10y', '_3y'))
+            series['term_spread'] = pd.DataFrame({
+                'date': spread['date'],
+                'value': spread['value_10y'] - spread['value_3y'],
+            })
+        return cls(series)
+
+    def _bounds(
+        self,
+        name: str,
+        events: np.ndarray,
+        start: int,
+        end: int,
+        unit: str,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """이벤트별 윈도우 시작/끝 관측치 인덱스와 유효 여부"""
+        dates = self._dates[name]
+        n = len(dates)
+        if unit == "calendar":
+            # [event + start, event + end] 구간의 첫/마지막 관측치
+            pre = np.searchsorted(dates, events + np.timedelta64(start, 'D'), side='left')
+            post = np.searchsorted(dates, events + np.timedelta64(end, 'D'), side='right') - 1
+        elif unit == "trading":
+            # 이벤트일(또는 직후 첫 거래일)을 0으로 한 관측치 오프셋
+            anchor = np.searchsorted(dates, events, side='left')
+            pre = anchor + start
+            post = anchor + end
+        else:
+            raise ValueError(f"Unknown window unit: {unit}")
+        valid = (pre >= 0) & (post < n) & (post > pre)
+        return np.clip(pre, 0, max(n - 1, 0)), np.clip(post, 0, max(n - 1, 0)), valid
+
+    def compute(
+        self,
+        event_dates: Sequence,
+        windows: Sequence[Tuple[int, int]] = DEFAULT_WINDOWS,
+        indicators: Optional[Sequence[str]] = None,
+        unit: str = "calendar",
+        estimation: Tuple[int, int] = (-120, -11),
+    ) -> pd.DataFrame:
+        """
+        모든 이벤트 × 지표 × 윈도우의 반응을 한 번에 계산
+
+        Args:
+            event_dates: 회의일 목록 (YYYY-MM-DD, YYYY_MM_DD, datetime)
+            windows: (시작, 끝) 오프셋 목록
+            indicators: 대상 지표 (None이면 로드된 전체)
+            unit: "calendar"(달력일, 구간 내 첫/마지막 관측치) 또는 "trading"(관측치 오프셋)
+            estimation: 정상 변화 추정 구간 (관측치 오프셋, 이벤트일 기준)
+
+        Returns:
+            long DataFrame (event_date, indicator, window, pre_date, post_date,
+            pre_value, post_value, change, pct_change, abnormal_change, abnormal_return)
+        """
+        labels = [str(d).replace('_', '-') for d in event_dates]
+        events = _to_days(labels)
+        frames = []
+
+        for name in indicators or self.indicators:
+            if name not in self._dates:
+                logger.warning(f"이벤트 스터디 지표 없음: {name}")
+                continue
+            dates = self._dates[name]
+            values = self._values[name]
+            positive = bool(len(values)) and bool(np.all(values > 0))
+            log_values = np.log(values) if positive else None
+
+            # 추정 구간: 이벤트 기준 관측치 오프셋 [e0, e1], 평균 일간 변화는 양 끝값 차이로 계산
+            anchor = np.searchsorted(dates, events, side='left')
+            e0 = anchor + estimation[0]
+            e1 = anchor + estimation[1]
+            est_valid = (e0 >= 0) & (e1 < len(dates)) & (e1 > e0)
+            e0c = np.clip(e0, 0, len(dates) - 1)
+            e1c = np.clip(e1, 0, len(dates) - 1)
+            steps = np.where(est_valid, e1 - e0, 1)
+            drift = np.where(est_valid, (values[e1c] - values[e0c]) / steps, np.nan)
+            log_drift = (
+                np.where(est_valid, (log_values[e1c] - log_values[e0c]) / steps, np.nan)
+                if positive else np.full(len(events), np.nan)
+            )
+
+            for start, end in windows:
+                pre, post, valid = self._bounds(name, events, start, end, unit)
+                pre_value = np.where(valid, values[pre], np.nan)
+                post_value = np.where(valid, values[post], np.nan)
+                change = post_value - pre_value
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    pct_change = np.where(valid & (pre_value != 0), change / pre_value, np.where(valid, 0.0, np.nan))
+                n_steps = (post - pre).astype(float)
+                abnormal_change = change - drift * n_steps
+                if positive:
+                    abnormal_return = (log_values[post] - log_values[pre]) - log_drift * n_steps
+                    abnormal_return = np.where(valid, abnormal_return, np.nan)
+                else:
+                    abnormal_return = np.full(len(events), np.nan)
+
+                frames.append(pd.DataFrame({
+                    'event_date': labels,
+                    'indicator': name,
+                    'window': f"[{start:+d},{end:+d}]",
+                    'pre_date': np.where(valid, dates[pre], np.datetime64('NaT')),
+                    'post_date': np.where(valid, dates[post], np.datetime64('NaT')),
+                    'pre_value': pre_value,
+                    'post_value': post_value,
+                    'change': change,
+                    'pct_change': pct_change,
+                    'abnormal_change': abnormal_change,
+                    'abnormal_return': abnormal_return,
+                }))
+
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
+
+    def market_reaction(
+        self,
+        event_dates: Sequence,
+        days_before: int = 5,
+        days_after: int = 10,
+        weights: Optional[Dict[str, float]] = None,
+    ) -> pd.Series:
+        """
+        회의별 시장 반응 점수 (-1 ~ +1)
+
+        EcosConnector.calculate_market_reaction과 같은 정의:
+        [T-n, T+m] 달력일 구간의 첫/마지막 관측치 변화율에 방향과 가중치를 곱해 합산한 뒤
+        tanh(10x)로 정규화. 관측치가 2개 미만인 지표는 변화율 0.
+
+        Returns:
+            회의일 인덱스의 점수 Series
+        """
+        weights = weights or REACTION_WEIGHTS
+        labels = [str(d).replace('_', '-') for d in event_dates]
+        events = _to_days(labels)
+        total = np.zeros(len(events))
+
+        for name, weight in weights.items():
+            if name not in self._dates:
+                continue
+            values = self._values[name]
+            pre, post, valid = self._bounds(name, events, -days_before, days_after, "calendar")
+            before = values[pre]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                pct = np.where(valid & (before != 0), (values[post] - before) / before, 0.0)
+            total += weight * REACTION_SIGNS.get(name, 1.0) * pct
+
+        return pd.Series(np.tanh(total * 10), index=labels, name='market_reaction')
+
+
+if __name__ == "__main__":
+    import time
+
+    tone = pd.read_csv(PROJECT_ROOT / "data" / "analysis" / "tone_index_results.csv")
+    study = EventStudy.from_csv()
+    t0 = time.perf_counter()
+    table = study.compute(tone['meeting_date'], windows=[(-1, 1), (-5, 10), (-10, 20)])
+    scores = study.market_reaction(tone['meeting_date'])
+    print(f"{len(table)} event rows in {time.perf_counter() - t0:.3f}s")
+    print(table.groupby(['indicator', 'window'])['abnormal_change'].mean().round(4).to_string())
+    print(scores.tail().round(3).to_string())
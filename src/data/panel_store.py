@@ -0,0 +1,407 @@
+"""
+달력 정렬 지표 패널 저장소
+
+상관관계 행렬(merge_asof), FSI 빌더, 분석 화면이 매번 CSV를 읽고 날짜를
+맞추던 작업을 빌드 단계 한 번으로 옮깁니다. 모든 지표를 하나의 날짜 인덱스
+위에 열(column)로 정렬한 일별/월별 패널을 만들고, 메모리 매핑 가능한 2차원
+배열(.npy)과 열 메타데이터(JSON)로 저장합니다.
+
+- 일별 패널: 달력일 인덱스, 월별 패널: 월말 인덱스
+- 열마다 원자료 주기와 forward-fill 규칙(최대 경과일)을 메타데이터로 기록
+- 실제 관측 여부 마스크를 함께 저장하여 채워진 값과 구분
+- 원본 CSV의 (mtime, size) 서명이 바뀌면 다시 빌드
+- 새 지표 추가 = PANEL_COLUMNS에 한 줄 추가
+"""
+
+import json
+import logging
+import threading
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.utils.cache_io import atomic_write, file_signature, read_json, write_json
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DEFAULT_DATA_DIR = PROJECT_ROOT / "data"
+DEFAULT_PANEL_DIR = PROJECT_ROOT / "data" / "panel"
+
+PANEL_VERSION = 1
+PANEL_FREQUENCIES = ("daily", "monthly")
+YOY_PERIODS = {"M": 12, "Q": 4}
+
+
+@dataclass(frozen=True)
+class PanelColumn:
+    """패널 열 정의"""
+
+    name: str
+    source: str = ""                  # data/ 기준 CSV 상대경로
+    freq: str = "D"                   # 원자료 주기: "D" | "M" | "Q"
+    fill: str = "ffill"               # "ffill" | "none"
+    max_age_days: Optional[int] = None  # 마지막 관측 후 채울 최대 일수 (None이면 무제한)
+    transform: Optional[str] = None   # "yoy": 원자료 주기 기준 전년동기비(%)
+    spread: Tuple[str, ...] = ()      # (a, b): 두 열의 공통 관측일 기준 a - b
+
+
+PANEL_COLUMNS: Tuple[PanelColumn, ...] = (
+    PanelColumn("base_rate", "08_ecos/base_rate/base_rate.csv", "D"),
+    PanelColumn("ktb_3y", "08_ecos/bond_yields/ktb_3y.csv", "D", max_age_days=7),
+    PanelColumn("ktb_10y", "08_ecos/bond_yields/ktb_10y.csv", "D", max_age_days=7),
+    PanelColumn("term_spread", freq="D", max_age_days=7, spread=("ktb_10y", "ktb_3y")),
+    PanelColumn("usd_krw", "08_ecos/exchange_rates/usd_krw.csv", "D", max_age_days=7),
+    PanelColumn("kospi", "08_ecos/stock_indices/kospi.csv", "D", max_age_days=7),
+    PanelColumn("cpi", "08_ecos/cpi/cpi_total.csv", "M", max_age_days=62),
+    PanelColumn("cpi_yoy", "08_ecos/cpi/cpi_total.csv", "M", max_age_days=62, transform="yoy"),
+    PanelColumn("lending_rate", "08_ecos/lending_rates/lending_rate.csv", "M", max_age_days=62),
+    PanelColumn("m2", "08_ecos/money_supply/m2.csv", "M", max_age_days=62),
+    PanelColumn("gdp_real", "08_ecos/gdp/gdp_real.csv", "Q", max_age_days=123),
+    PanelColumn("gdp_yoy", "08_ecos/gdp/gdp_real.csv", "Q", max_age_days=123, transform="yoy"),
+    PanelColumn("household_credit", "08_ecos/household_debt/household_credit.csv", "Q", max_age_days=123),
+)
+
+
+def _parse_period(time: pd.Series, freq: str) -> pd.Series:
+    """ECOS TIME 코드를 기간 말일로 변환 (일별은 해당 일자)"""
+    text = time.astype(str).str.strip()
+    if freq == "D":
+        return pd.to_datetime(text, format="%Y%m%d", errors="coerce")
+    if freq == "M":
+        return pd.to_datetime(text, format="%Y%m", errors="coerce") + pd.offsets.MonthEnd(0)
+    if freq == "Q":
+        return pd.Series(pd.PeriodIndex(text, freq="Q").to_timestamp(how="end").normalize(), index=time.index)
+    raise ValueError(f"Unsupported frequency: {freq}")
+
+
+def _forward_fill(
+    dates: np.ndarray,
+    values: np.ndarray,
+    observed: np.ndarray,
+    max_age_days: Optional[int],
+) -> np.ndarray:
+    """관측 마스크 기준 forward-fill (마지막 관측 후 max_age_days 이내만)"""
+    positions = np.where(observed, np.arange(len(values)), -1)
+    last = np.maximum.accumulate(positions)
+    has_last = last >= 0
+    safe_last = np.where(has_last, last, 0)
+    filled = np.where(has_last, values[safe_last], np.nan)
+    if max_age_days is not None:
+        age = (dates - dates[safe_last]).astype("timedelta64[D]").astype(np.int64)
+        filled = np.where(age <= max_age_days, filled, np.nan)
+    return filled
+
+
+@dataclass
+class WidePanel:
+    """날짜 인덱스 하나와 지표별 float 열로 구성된 정렬 패널"""
+
+    freq: str
+    dates: np.ndarray       # datetime64[D], 정렬됨
+    values: np.ndarray      # (n_dates, n_columns) float64, 보통 읽기 전용 memmap
+    observed: np.ndarray    # (n_dates, n_columns) bool, 실제 관측 여부
+    columns: List[str]
+    meta: Dict[str, Dict]
+
+    def __post_init__(self):
+        self._positions = {name: i for i, name in enumerate(self.columns)}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._positions
+
+    def index(self, name: str) -> int:
+        if name not in self._positions:
+            raise KeyError(f"Unknown panel column: {name}")
+        return self._positions[name]
+
+    def column(self, name: str) -> np.ndarray:
+        """열 뷰 (복사 없음)"""
+        return self.values[:, self.index(name)]
+
+    def rows(self, start=None, end=None) -> slice:
+        """[start, end] 날짜 구간의 행 슬라이스"""
+        lo = 0 if start is None else int(np.searchsorted(self.dates, np.datetime64(pd.Timestamp(start), "D"), side="left"))
+        hi = len(self.dates) if end is None else int(np.searchsorted(self.dates, np.datetime64(pd.Timestamp(end), "D"), side="right"))
+        return slice(lo, hi)
+
+    def frame(self, columns: Optional[Sequence[str]] = None, start=None, end=None) -> pd.DataFrame:
+        """Date 컬럼 + 선택 열의 DataFrame (복사본)"""
+        names = list(columns) if columns is not None else list(self.columns)
+        rows = self.rows(start, end)
+        block = np.asarray(self.values[rows][:, [self.index(name) for name in names]])
+        out = pd.DataFrame(block, columns=names)
+        out.insert(0, "Date", pd.to_datetime(self.dates[rows]))
+        return out
+
+    def lookup(
+        self,
+        dates: Sequence,
+        columns: Optional[Sequence[str]] = None,
+        direction: str = "backward",
+    ) -> pd.DataFrame:
+        """
+        임의 날짜들의 지표 값 (merge_asof 대체)
+
+        Args:
+            dates: 조회 날짜 목록
+            columns: 대상 열 (None이면 전체)
+            direction: "backward" (해당일 이전 마지막 행, fill 규칙 적용)
+                       "nearest" (가장 가까운 실제 관측치)
+        """
+        names = list(columns) if columns is not None else list(self.columns)
+        targets = pd.to_datetime(pd.Series(list(dates)), format="mixed").to_numpy(dtype="datetime64[D]")
+        out = pd.DataFrame(index=range(len(targets)))
+
+        if direction == "backward":
+            row = np.searchsorted(self.dates, targets, side="right") - 1
+            valid = row >= 0
+            safe_row = np.where(valid, row, 0)
+            for name in names:
+                out[name] = np.where(valid, self.column(name)[safe_row], np.nan)
+            return out
+
+        if direction != "nearest":
+            raise ValueError(f"Unknown lookup direction: {direction}")
+        for name in names:
+            obs_rows = np.flatnonzero(self.observed[:, self.index(name)])
+            if len(obs_rows) == 0:
+                out[name] = np.nan
+                continue
+            obs_dates = self.dates[obs_rows]
+            right = np.clip(np.searchsorted(obs_dates, targets, side="left"), 0, len(obs_rows) - 1)
+            left = np.clip(right - 1, 0, len(obs_rows) - 1)
+            pick_left = np.abs(targets - obs_dates[left]) <= np.abs(obs_dates[right] - targets)
+            out[name] = self.column(name)[obs_rows[np.where(pick_left, left, right)]]
+        return out
+
+    def latest(self, name: str, n: int = 1) -> np.ndarray:
+        """열의 마지막 n개 실제 관측치 (오래된 것부터)"""
+        obs_rows = np.flatnonzero(self.observed[:, self.index(name)])
+        return np.asarray(self.column(name)[obs_rows[-n:]])
+
+
+class PanelStore:
+    """일별/월별 정렬 패널 빌드 및 memmap 로드"""
+
+    def __init__(
+        self,
+        panel_dir: Optional[Path] = None,
+        data_dir: Optional[Path] = None,
+        columns: Sequence[PanelColumn] = PANEL_COLUMNS,
+    ):
+        """
+        Args:
+            panel_dir: 패널 파일 디렉토리 (None이면 data/panel)
+            data_dir: 원본 데이터 디렉토리 (None이면 data)
+            columns: 패널 열 정의
+        """
+        self.panel_dir = Path(panel_dir) if panel_dir is not None else DEFAULT_PANEL_DIR
+        self.data_dir = Path(data_dir) if data_dir is not None else DEFAULT_DATA_DIR
+        self.columns = tuple(columns)
+        self.meta_path = self.panel_dir / "panel_meta.json"
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # 원본 서명
+    # ------------------------------------------------------------------
+
+    def source_signature(self) -> Dict[str, List[int]]:
+        """원본 CSV별 [mtime_ns, size]"""
+        sources = dict.fromkeys(spec.source for spec in self.columns if spec.source)
+        return file_signature((self.data_dir / source for source in sources), self.data_dir)
+
+    def _spec_json(self) -> List[Dict]:
+        """열 정의의 JSON 표현 (메타데이터 비교용)"""
+        return json.loads(json.dumps([asdict(spec) for spec in self.columns]))
+
+    def is_stale(self) -> bool:
+        """패널이 없거나 정의/원본이 바뀌었으면 True"""
+        meta = read_json(self.meta_path)
+        if meta is None or meta.get("version") != PANEL_VERSION:
+            return True
+        if meta.get("sources") != self.source_signature():
+            return True
+        if meta.get("spec") != self._spec_json():
+            return True
+        return any(not self._array_path(freq, "values").exists() for freq in PANEL_FREQUENCIES)
+
+    # ------------------------------------------------------------------
+    # 빌드
+    # ------------------------------------------------------------------
+
+    def _load_native(self) -> Dict[str, pd.Series]:
+        """열별 원자료 주기 시계열 (기간 말일 인덱스)"""
+        raw_cache: Dict[Tuple[str, str], pd.Series] = {}
+        native: Dict[str, pd.Series] = {}
+
+        for spec in self.columns:
+            if spec.spread:
+                a, b = spec.spread
+                if a in native and b in native:
+                    left, right = native[a].align(native[b], join="inner")
+                    native[spec.name] = left - right
+                else:
+                    logger.warning(f"패널 파생 열 원본 없음: {spec.name} <- {spec.spread}")
+                continue
+
+            key = (spec.source, spec.freq)
+            if key not in raw_cache:
+                path = self.data_dir / spec.source
+                if not path.exists():
+                    logger.warning(f"패널 원본 CSV 없음: {path}")
+                    continue
+                df = pd.read_csv(path, usecols=["TIME", "DATA_VALUE"], dtype={"TIME": str}, encoding="utf-8-sig")
+                df["Date"] = _parse_period(df["TIME"], spec.freq)
+                df["Value"] = pd.to_numeric(df["DATA_VALUE"], errors="coerce")
+                df = df.dropna(subset=["Date", "Value"]).sort_values("Date")
+                raw_cache[key] = df.groupby("Date")["Value"].last()
+
+            series = raw_cache[key]
+            if spec.transform == "yoy":
+                series = (series.pct_change(YOY_PERIODS[spec.freq]) * 100).dropna()
+            elif spec.transform is not None:
+                raise ValueError(f"Unknown panel transform: {spec.transform}")
+            native[spec.name] = series
+
+        return native
+
+    def _assemble(self, freq: str, native: Dict[str, pd.Series]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[Dict]]:
+        """열별 시계열을 하나의 달력 인덱스에 정렬하고 fill 규칙 적용"""
+        present = [spec for spec in self.columns if spec.name in native and len(native[spec.name])]
+        start = min(native[spec.name].index.min() for spec in present)
+        end = max(native[spec.name].index.max() for spec in present)
+        if freq == "daily":
+            index = pd.date_range(start.normalize(), end.normalize(), freq="D")
+        else:
+            index = pd.date_range(start + pd.offsets.MonthEnd(0), end + pd.offsets.MonthEnd(0), freq="ME")
+        dates = index.to_numpy(dtype="datetime64[D]")
+
+        values = np.full((len(dates), len(present)), np.nan)
+        observed = np.zeros((len(dates), len(present)), dtype=bool)
+        column_meta = []
+
+        for j, spec in enumerate(present):
+            series = native[spec.name]
+            if freq == "monthly":
+                # 월 내 마지막 관측치
+                series = series.groupby(series.index + pd.offsets.MonthEnd(0)).last()
+            rows = np.searchsorted(dates, series.index.to_numpy(dtype="datetime64[D]"))
+            raw = np.full(len(dates), np.nan)
+            raw[rows] = series.to_numpy(dtype=float)
+            observed[rows, j] = True
+            values[:, j] = _forward_fill(dates, raw, observed[:, j], spec.max_age_days) if spec.fill == "ffill" else raw
+
+            column_meta.append({
+                **asdict(spec),
+                "n_observed": int(observed[:, j].sum()),
+                "first_observed": str(series.index.min().date()),
+                "last_observed": str(series.index.max().date()),
+            })
+
+        return dates, values, observed, column_meta
+
+    def _array_path(self, freq: str, kind: str) -> Path:
+        return self.panel_dir / f"{freq}_{kind}.npy"
+
+    def _write_array(self, freq: str, kind: str, array: np.ndarray) -> None:
+        with atomic_write(self._array_path(freq, kind)) as f:
+            np.save(f, array)
+
+    def build(self) -> Dict:
+        """모든 주기의 패널을 빌드하고 저장, 메타데이터 반환"""
+        with self._lock:
+            self.panel_dir.mkdir(parents=True, exist_ok=True)
+            sources = self.source_signature()
+            native = self._load_native()
+            if not native:
+                raise FileNotFoundError(f"패널 원본 CSV 없음: {self.data_dir}")
+
+            panels = {}
+            for freq in PANEL_FREQUENCIES:
+                dates, values, observed, column_meta = self._assemble(freq, native)
+                self._write_array(freq, "dates", dates)
+                self._write_array(freq, "values", values)
+                self._write_array(freq, "observed", observed)
+                panels[freq] = {
+                    "n_dates": len(dates),
+                    "start": str(dates[0]),
+                    "end": str(dates[-1]),
+                    "columns": column_meta,
+                }
+
+            meta = {
+                "version": PANEL_VERSION,
+                "built_at": datetime.now().isoformat(timespec="seconds"),
+                "sources": sources,
+                "spec": self._spec_json(),
+                "panels": panels,
+            }
+            write_json(self.meta_path, meta)
+
+        logger.info(
+            f"패널 빌드 완료: {len(native)}개 지표, "
+            + ", ".join(f"{freq} {info['n_dates']}행" for freq, info in panels.items())
+        )
+        return meta
+
+    # ------------------------------------------------------------------
+    # 로드
+    # ------------------------------------------------------------------
+
+    def load(self, freq: str = "daily", rebuild_if_stale: bool = True) -> WidePanel:
+        """
+        패널 로드 (값/관측 배열은 읽기 전용 memmap)
+
+        Args:
+            freq: "daily" 또는 "monthly"
+            rebuild_if_stale: 원본이 바뀌었거나 패널이 없으면 다시 빌드
+        """
+        if freq not in PANEL_FREQUENCIES:
+            raise ValueError(f"Unsupported panel frequency: {freq}")
+
+        meta = read_json(self.meta_path)
+        if rebuild_if_stale and self.is_stale():
+            meta = self.build()
+        if meta is None:
+            raise FileNotFoundError(f"패널 없음: {self.meta_path}")
+
+        info = meta["panels"][freq]
+        values = np.load(self._array_path(freq, "values"), mmap_mode="r")
+        if values.shape != (info["n_dates"], len(info["columns"])):
+            raise ValueError(f"패널 배열과 메타데이터 불일치: {freq} {values.shape}")
+
+        return WidePanel(
+            freq=freq,
+            dates=np.load(self._array_path(freq, "dates")),
+            values=values,
+            observed=np.load(self._array_path(freq, "observed"), mmap_mode="r"),
+            columns=[column["name"] for column in info["columns"]],
+            meta={column["name"]: column for column in info["columns"]},
+        )
+
+
+def main():
+    """패널 빌드 및 요약 출력"""
+    store = PanelStore()
+    meta = store.build()
+    print("=" * 60)
+    print("Indicator Panel Build")
+    print("=" * 60)
+    for freq, info in meta["panels"].items():
+        print(f"[{freq}] {info['start']} ~ {info['end']} ({info['n_dates']} rows)")
+        for column in info["columns"]:
+            age = column["max_age_days"] if column["max_age_days"] is not None else "-"
+            print(
+                f"  {column['name']:18s} {column['freq']}  fill={column['fill']:5s} "
+                f"max_age={age!s:>4s}  observed={column['n_observed']}"
+            )
+    print(f"Dir: {store.panel_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,402 @@
+"""
+ECOS 시계열 빈티지(as-of) 저장소
+
+GDP, 가계신용 등은 발표 이후 수정되므로 최신 CSV만으로 백테스트하면
+사후 수정치가 과거 시점에 섞여 들어갑니다(look-ahead). 이 모듈은 벌크
+다운로더가 내려받은 관측치를 다운로드 시각(as-of)과 함께 이력으로 보관하는
+이중 시점(bitemporal) 저장소입니다.
+
+- 관측 기간(period)과 인지 시점(as_of) 두 축으로 저장
+- 직전 빈티지와 값이 같은 관측치는 저장하지 않음 (변경분만 기록)
+- (series, period, as_of) 인덱스로 "D 시점에 알려진 X의 P 기간 값" 조회
+- 여러 인지 시점의 빈티지 패널을 한 번의 조회 + 벡터 연산으로 구성
+"""
+
+import json
+import logging
+import sqlite3
+from datetime import date, datetime
+from pathlib import Path, PureWindowsPath
+from typing import Iterable, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DEFAULT_DB_PATH = PROJECT_ROOT / "data" / "db" / "bok_analyzer.db"
+DEFAULT_MANIFEST_PATH = PROJECT_ROOT / "data" / "08_ecos" / "download_manifest.json"
+
+AS_OF_FORMAT = "%Y-%m-%dT%H:%M:%S.%f"
+
+DateLike = Union[str, date, datetime, pd.Timestamp]
+
+
+def _as_of_key(value: DateLike) -> str:
+    """
+    인지 시점을 정렬 가능한 문자열로 변환
+
+    시각이 없는 날짜("2024-05-31", date 객체)는 그 날의 마지막 시각으로 해석하여
+    당일 다운로드분까지 포함합니다.
+    """
+    ts = pd.Timestamp(value)
+    date_only = (isinstance(value, str) and len(value.strip()) <= 10) or (
+        isinstance(value, date) and not isinstance(value, datetime)
+    )
+    if date_only:
+        ts = ts.normalize() + pd.Timedelta(days=1) - pd.Timedelta(microseconds=1)
+    return ts.strftime(AS_OF_FORMAT)
+
+
+def period_to_date(period: str) -> pd.Timestamp:
+    """ECOS TIME 코드(20240131, 202401, 2024Q1, 2024)를 기간 시작일로 변환"""
+    code = str(period).strip()
+    if "Q" in code:
+        return pd.Period(code, freq="Q").start_time
+    if len(code) == 8:
+        return pd.to_datetime(code, format="%Y%m%d")
+    if len(code) == 6:
+        return pd.to_datetime(code, format="%Y%m")
+    if len(code) == 4:
+        return pd.to_datetime(code, format="%Y")
+    raise ValueError(f"알 수 없는 ECOS 기간 형식: {period}")
+
+
+class VintageStore:
+    """SQLite 기반 ECOS 시계열 빈티지 저장소"""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        Args:
+            db_path: 데이터베이스 파일 경로 (None이면 기본 분석 DB 사용)
+        """
+        self.db_path = Path(db_path) if db_path is not None else DEFAULT_DB_PATH
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._initialize()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path)
+
+    def _initialize(self):
+        """빈티지 테이블 및 인덱스 생성"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        # 관측치 이력: 값이 바뀐 시점에만 행이 추가됨
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS series_vintages (
+            series TEXT NOT NULL,
+            period TEXT NOT NULL,       -- ECOS TIME 코드
+            period_date DATE NOT NULL,  -- 기간 시작일 (YYYY-MM-DD)
+            as_of TEXT NOT NULL,        -- 다운로드 시각 (ISO, 마이크로초 포함)
+            value REAL,
+            PRIMARY KEY (series, period, as_of)
+        )
+        """)
+        cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_series_vintages_asof
+        ON series_vintages (series, as_of)
+        """)
+
+        # 다운로드(빈티지) 실행 기록
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS vintage_runs (
+            series TEXT NOT NULL,
+            as_of TEXT NOT NULL,
+            period_type TEXT,
+            stat_code TEXT,
+            item_code1 TEXT,
+            rows INTEGER,
+            changed_rows INTEGER,
+            source_path TEXT,
+            PRIMARY KEY (series, as_of)
+        )
+        """)
+
+        conn.commit()
+        conn.close()
+
+    def record_snapshot(
+        self,
+        series: str,
+        df: pd.DataFrame,
+        as_of: DateLike,
+        period_type: Optional[str] = None,
+        stat_code: Optional[str] = None,
+        item_code1: Optional[str] = None,
+        source_path: Optional[str] = None,
+    ) -> int:
+        """
+        다운로드한 ECOS 데이터(TIME, DATA_VALUE)를 하나의 빈티지로 기록
+
+        Args:
+            series: 지표 이름 (예: 'gdp_real')
+            df: ECOS 응답/CSV DataFrame (TIME, DATA_VALUE 컬럼)
+            as_of: 다운로드 시각
+            period_type, stat_code, item_code1, source_path: 실행 메타데이터
+
+        Returns:
+            새로 기록된(신규 또는 수정된) 관측치 수. 이미 기록된 빈티지면 0.
+        """
+        as_of_key = _as_of_key(as_of)
+        snapshot = pd.DataFrame(
+            {
+                "period": df["TIME"].astype(str).str.strip(),
+                "value": pd.to_numeric(df["DATA_VALUE"], errors="coerce"),
+            }
+        ).drop_duplicates(subset="period", keep="last")
+
+        conn = self._get_connection()
+        try:
+            exists = conn.execute(
+                "SELECT 1 FROM vintage_runs WHERE series = ? AND as_of = ?", (series, as_of_key)
+            ).fetchone()
+            if exists:
+                return 0
+
+            known = pd.read_sql_query(
+                "SELECT period, as_of, value FROM series_vintages WHERE series = ? AND as_of < ?",
+                conn,
+                params=(series, as_of_key),
+            )
+            latest = known.sort_values("as_of").groupby("period")["value"].last()
+
+            prev = latest.reindex(snapshot["period"]).to_numpy(dtype=float)
+            curr = snapshot["value"].to_numpy(dtype=float)
+            is_new = ~snapshot["period"].isin(latest.index).to_numpy()
+            both_nan = np.isnan(prev) & np.isnan(curr)
+            changed = is_new | ((prev != curr) & ~both_nan)
+
+            rows = snapshot[changed]
+            period_dates = [period_to_date(p).strftime("%Y-%m-%d") for p in rows["period"]]
+            conn.executemany(
+                """
+                INSERT INTO series_vintages (series, period, period_date, as_of, value)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                [
+                    (series, period, period_date, as_of_key, None if np.isnan(value) else float(value))
+                    for period, period_date, value in zip(rows["period"], period_dates, rows["value"])
+                ],
+            )
+            conn.execute(
+                """
+                INSERT INTO vintage_runs
+                (series, as_of, period_type, stat_code, item_code1, rows, changed_rows, source_path)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (series, as_of_key, period_type, stat_code, item_code1, len(snapshot), len(rows), source_path),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+        logger.info(f"빈티지 기록: {series} @ {as_of_key} ({len(rows)}/{len(snapshot)}건 변경)")
+        return len(rows)
+
+    def ingest_manifest(
+        self,
+        manifest_path: Optional[Path] = None,
+        data_dir: Optional[Path] = None,
+    ) -> dict:
+        """
+        벌크 다운로더 manifest에 기록된 CSV들을 빈티지로 적재
+
+        'downloaded' 항목은 manifest 타임스탬프를, 'skipped_recent' 항목은
+        CSV 파일 수정 시각을 인지 시점으로 사용합니다. 같은 빈티지는 중복 적재되지 않습니다.
+
+        Returns:
+            {지표 이름: 기록된 관측치 수}
+        """
+        manifest_path = Path(manifest_path) if manifest_path is not None else DEFAULT_MANIFEST_PATH
+        data_dir = Path(data_dir) if data_dir is not None else manifest_path.parent
+
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+
+        results = {}
+        for series, entry in manifest.get("downloads", {}).items():
+            if entry.get("status") not in ("downloaded", "skipped_recent"):
+                continue
+            csv_path = self._resolve_csv(entry.get("path", ""), data_dir)
+            if csv_path is None:
+                logger.warning(f"빈티지 적재 건너뜀 (CSV 없음): {series}")
+                continue
+
+            if entry.get("status") == "downloaded" and entry.get("timestamp"):
+                as_of = entry["timestamp"]
+            else:
+                as_of = datetime.fromtimestamp(csv_path.stat().st_mtime)
+
+            df = pd.read_csv(csv_path, usecols=["TIME", "DATA_VALUE"], dtype={"TIME": str}, encoding="utf-8-sig")
+            results[series] = self.record_snapshot(
+                series,
+                df,
+                as_of=as_of,
+                period_type=entry.get("period_type"),
+                stat_code=entry.get("stat_code"),
+                item_code1=entry.get("item_code1"),
+                source_path=str(csv_path),
+            )
+        return results
+
+    @staticmethod
+    def _resolve_csv(recorded_path: str, data_dir: Path) -> Optional[Path]:
+        """manifest 경로(다른 OS의 절대경로일 수 있음)를 현재 데이터 디렉토리 기준으로 해석"""
+        if not recorded_path:
+            return None
+        path = Path(recorded_path)
+        if path.exists():
+            return path
+        parts = PureWindowsPath(recorded_path).parts if "\\" in recorded_path else path.parts
+        candidate = data_dir.joinpath(*parts[-2:])
+        return candidate if candidate.exists() else None
+
+    def _load_history(
+        self,
+        series: str,
+        as_of_max: Optional[str] = None,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+    ) -> pd.DataFrame:
+        query = "SELECT period, period_date, as_of, value FROM series_vintages WHERE series = ?"
+        params: list = [series]
+        if as_of_max is not None:
+            query += " AND as_of <= ?"
+            params.append(as_of_max)
+        if start is not None:
+            query += " AND period_date >= ?"
+            params.append(pd.Timestamp(start).strftime("%Y-%m-%d"))
+        if end is not None:
+            query += " AND period_date <= ?"
+            params.append(pd.Timestamp(end).strftime("%Y-%m-%d"))
+
+        conn = self._get_connection()
+        try:
+            history = pd.read_sql_query(query, conn, params=params)
+        finally:
+            conn.close()
+        history["period_date"] = pd.to_datetime(history["period_date"])
+        return history
+
+    def value_as_of(self, series: str, period: str, as_of: DateLike) -> Optional[float]:
+        """
+        as_of 시점에 알려진 series의 period 값 (미발표면 None)
+
+        Args:
+            series: 지표 이름
+            period: ECOS TIME 코드 (예: '2024Q1', '202403')
+            as_of: 인지 시점
+        """
+        conn = self._get_connection()
+        try:
+            row = conn.execute(
+                """
+                SELECT value FROM series_vintages
+                WHERE series = ? AND period = ? AND as_of <= ?
+                ORDER BY as_of DESC
+                LIMIT 1
+                """,
+                (series, str(period), _as_of_key(as_of)),
+            ).fetchone()
+        finally:
+            conn.close()
+        return None if row is None or row[0] is None else float(row[0])
+
+    def series_as_of(
+        self,
+        series: str,
+        as_of: DateLike,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+    ) -> pd.DataFrame:
+        """
+        as_of 시점에 알려진 시계열 전체 (실시간 데이터)
+
+        Returns:
+            DataFrame (TIME, DATA_VALUE, Date) - ECOS CSV와 같은 컬럼 구성
+        """
+        history = self._load_history(series, _as_of_key(as_of), start, end)
+        latest = history.sort_values("as_of").groupby("period", as_index=False).last()
+        latest = latest.sort_values("period_date").reset_index(drop=True)
+        return pd.DataFrame(
+            {"TIME": latest["period"], "DATA_VALUE": latest["value"], "Date": latest["period_date"]}
+        )
+
+    def vintage_panel(
+        self,
+        series: str,
+        as_of_dates: Optional[Iterable[DateLike]] = None,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+    ) -> pd.DataFrame:
+        """
+        빈티지 패널: 행 = 인지 시점, 열 = 관측 기간 시작일, 값 = 그 시점에 알려진 값
+
+        Args:
+            series: 지표 이름
+            as_of_dates: 조회할 인지 시점 목록 (None이면 기록된 모든 빈티지)
+            start, end: 관측 기간 범위 (기간 시작일 기준)
+        """
+        history = self._load_history(series, start=start, end=end)
+        if history.empty:
+            return pd.DataFrame()
+
+        # 변경분만 저장되어 있으므로 각 빈티지의 값 = 그 시점까지 마지막으로 기록된 값
+        wide = history.pivot(index="as_of", columns="period_date", values="value").sort_index()
+        recorded = history.assign(flag=True).pivot(index="as_of", columns="period_date", values="flag")
+        recorded = recorded.reindex(index=wide.index, columns=wide.columns).notna().to_numpy()
+        rows = np.arange(len(wide))[:, np.newaxis]
+        last_row = np.maximum.accumulate(np.where(recorded, rows, -1), axis=0)
+
+        if as_of_dates is None:
+            index = wide.index
+            state = last_row
+        else:
+            index = pd.Index([_as_of_key(d) for d in as_of_dates])
+            pos = np.searchsorted(wide.index.to_numpy(dtype=object), index.to_numpy(dtype=object), side="right") - 1
+            state = np.where(pos[:, np.newaxis] >= 0, last_row[np.maximum(pos, 0)], -1)
+
+        values = wide.to_numpy(dtype=float)
+        cols = np.broadcast_to(np.arange(wide.shape[1]), state.shape)
+        panel_values = np.where(state >= 0, values[np.maximum(state, 0), cols], np.nan)
+        panel = pd.DataFrame(
+            panel_values,
+            index=pd.to_datetime(index, format=AS_OF_FORMAT),
+            columns=wide.columns,
+        )
+        panel.index.name = "as_of"
+        panel.columns.name = "period_date"
+        return panel
+
+    def list_vintages(self, series: Optional[str] = None) -> pd.DataFrame:
+        """기록된 빈티지 실행 목록"""
+        query = "SELECT * FROM vintage_runs"
+        params: list = []
+        if series:
+            query += " WHERE series = ?"
+            params.append(series)
+        query += " ORDER BY series, as_of"
+
+        conn = self._get_connection()
+        try:
+            return pd.read_sql_query(query, conn, params=params)
+        finally:
+            conn.close()
+
+
+def main():
+    """현재 manifest의 CSV들을 빈티지로 적재"""
+    store = VintageStore()
+    results = store.ingest_manifest()
+    print("=" * 60)
+    print("ECOS Vintage Ingest")
+    print("=" * 60)
+    for series, changed in results.items():
+        print(f"{series:24s} {changed:6d} rows recorded")
+    print(f"DB: {store.db_path}")
+
+
+if __name__ == "__main__":
+    main()
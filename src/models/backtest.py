@@ -3,23 +3,123 @@ Enhanced Backtesting Framework.
 
 Tests Taylor Rule variants against historical BOK decisions.
 Calculates: accuracy, RMSE, directional accuracy, Granger causality.
+Includes a walk-forward (rolling-origin) out-of-sample backtest.
 """
 
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
 from statsmodels.tsa.stattools import grangercausalitytests
 
-from src.taylor_rule import ExtendedTaylorRule
+from src.models.metric_bootstrap import MetricBootstrap, from_backtest, from_predictions
+from src.taylor_rule import (
+    CORE_INPUT_FILES,
+    FSI_INPUT_FILES,
+    FSI_RAW_COLUMNS,
+    TONE_INPUT_FILES,
+    ExtendedTaylorRule,
+    TaylorRuleInputs,
+)
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 
+RESULT_COLUMNS = [
+    "Date",
+    "meeting_date_str",
+    "Base_Rate",
+    "Taylor_Rate",
+    "Taylor_Gap",
+    "Expected_Direction",
+    "Actual_Direction",
+    "Direction_Match",
+    "Abs_Error",
+    "Squared_Error",
+]
+
+# Out-of-sample fold predictions keyed by (model, params, hp_method, origin, test_end, data version).
+_FOLD_CACHE = {}
+_FOLD_CACHE_LOCK = threading.Lock()
+
+
+def _calc_direction(series):
+    diff = series.diff().fillna(0.0)
+    return pd.Series(np.sign(diff), index=series.index)
+
+
+def _granger_pvalue(results, maxlag=2, min_observations=12):
+    """SSR F-test p-value that Taylor_Rate Granger-causes Base_Rate at maxlag (NaN if too short)."""
+    gc_input = results.sort_values("Date").drop_duplicates(subset=["Date"], keep="last")
+    gc_input = gc_input[["Base_Rate", "Taylor_Rate"]].astype(float).dropna()
+    if len(gc_input) < min_observations:
+        return np.nan
+    try:
+        gc_res = grangercausalitytests(gc_input, maxlag=maxlag)
+    except (ValueError, np.linalg.LinAlgError):
+        # constant series / singular design matrix
+        return np.nan
+    return float(gc_res[maxlag][0]["ssr_ftest"][1])
+
+
+def _evaluate_meetings(model_df, meetings):
+    """Align a Taylor path to meeting dates and score direction/level errors."""
+    model_df = model_df.set_index("Date").sort_index().reset_index()
+    meetings = meetings.set_index("Date").sort_index().reset_index()
+    merged = pd.merge_asof(
+        meetings,
+        model_df,
+        on="Date",
+        direction="backward",
+    )
+
+    merged["Taylor_Gap"] = merged["Taylor_Rate"] - merged["Base_Rate"]
+    merged["Taylor_Recommended_Rate"] = merged["Taylor_Rate"]
+    merged["Actual_Direction"] = _calc_direction(merged["Base_Rate"])
+
+    prev_actual = merged["Base_Rate"].shift(1).fillna(merged["Base_Rate"])
+    merged["Expected_Direction"] = np.sign(merged["Taylor_Recommended_Rate"] - prev_actual)
+    merged["Direction_Match"] = merged["Expected_Direction"] == merged["Actual_Direction"]
+
+    merged["Squared_Error"] = (merged["Taylor_Rate"] - merged["Base_Rate"]) ** 2
+    merged["Abs_Error"] = (merged["Taylor_Rate"] - merged["Base_Rate"]).abs()
+    return merged[RESULT_COLUMNS].copy()
+
+
+def _run_fold(task):
+    """Fit one walk-forward fold on data up to its origin and score the test meetings."""
+    params, model_type, shared, origin, test_end = task
+    engine = ExtendedTaylorRule(**params)
+
+    core = shared["core"][shared["core"]["Date"] <= test_end]
+    fsi_raw = shared["fsi_raw"][shared["fsi_raw"]["Date"] <= test_end]
+    tone = shared["tone"][shared["tone"]["Date"] <= test_end]
+
+    # FSI normalization scales use only data available at the fold origin
+    train_raw = fsi_raw[fsi_raw["Date"] <= origin]
+    scales = {col: float(train_raw[col].std(ddof=0)) for col in FSI_RAW_COLUMNS.values()}
+    inputs = TaylorRuleInputs(
+        core=core,
+        fsi=engine._fsi_from_raw(fsi_raw, scales),
+        tone=tone,
+        fit_until=origin,
+    )
+    model_df = engine.calculate(model_type, inputs=inputs).df
+
+    meetings = shared["meetings"][shared["meetings"]["Date"] <= test_end]
+    scored = _evaluate_meetings(model_df, meetings)
+    scored = scored[scored["Date"] > origin].reset_index(drop=True)
+    scored.insert(0, "origin", origin)
+    scored.insert(0, "model_type", model_type)
+    return scored
+
 
 class TaylorRuleBacktester:
-    def __init__(self, model_type="extended"):
+    def __init__(self, model_type="extended", engine=None):
         self.model_type = model_type
-        self.engine = ExtendedTaylorRule()
+        self.engine = engine or ExtendedTaylorRule()
         self.data_dir = PROJECT_ROOT / "data"
 
     def _load_meeting_dates(self):
@@ -33,51 +133,17 @@ class TaylorRuleBacktester:
         return tone
 
     def _calc_direction(self, series):
-        diff = series.diff().fillna(0.0)
-        return pd.Series(np.sign(diff), index=series.index)
+        return _calc_direction(series)
 
     def run_backtest(self, start_date="2015-01-01"):
         model_df = self.engine.calculate(self.model_type).df.copy()
-        model_df = model_df.set_index("Date").sort_index().reset_index()
 
         meetings = self._load_meeting_dates()
         meetings = meetings[meetings["Date"] >= pd.to_datetime(start_date)].copy()
         if meetings.empty:
             return pd.DataFrame()
 
-        meetings = meetings.set_index("Date").sort_index().reset_index()
-        merged = pd.merge_asof(
-            meetings,
-            model_df,
-            on="Date",
-            direction="backward",
-        )
-
-        merged["Taylor_Gap"] = merged["Taylor_Rate"] - merged["Base_Rate"]
-        merged["Taylor_Recommended_Rate"] = merged["Taylor_Rate"]
-        merged["Actual_Direction"] = self._calc_direction(merged["Base_Rate"])
-
-        prev_actual = merged["Base_Rate"].shift(1).fillna(merged["Base_Rate"])
-        merged["Expected_Direction"] = np.sign(merged["Taylor_Recommended_Rate"] - prev_actual)
-        merged["Direction_Match"] = merged["Expected_Direction"] == merged["Actual_Direction"]
-
-        merged["Squared_Error"] = (merged["Taylor_Rate"] - merged["Base_Rate"]) ** 2
-        merged["Abs_Error"] = (merged["Taylor_Rate"] - merged["Base_Rate"]).abs()
-
-        return merged[
-            [
-                "Date",
-                "meeting_date_str",
-                "Base_Rate",
-                "Taylor_Rate",
-                "Taylor_Gap",
-                "Expected_Direction",
-                "Actual_Direction",
-                "Direction_Match",
-                "Abs_Error",
-                "Squared_Error",
-            ]
-        ].copy()
+        return _evaluate_meetings(model_df, meetings)
 
     def calculate_metrics(self, results):
         if results.empty:
@@ -108,15 +174,6 @@ class TaylorRuleBacktester:
         hit_ratio = by_year.groupby("Year")["Direction_Match"].mean().to_dict()
         hit_ratio = {str(k): float(v) for k, v in hit_ratio.items()}
 
-        granger_pvalue = np.nan
-        try:
-            gc_input = results[["Base_Rate", "Taylor_Rate"]].dropna()
-            if len(gc_input) >= 12:
-                gc_res = grangercausalitytests(gc_input, maxlag=2, verbose=False)
-                granger_pvalue = float(gc_res[2][0]["ssr_ftest"][1])
-        except Exception:
-            granger_pvalue = np.nan
-
         return {
             "observations": int(len(results)),
             "directional_accuracy": directional_accuracy,
@@ -124,13 +181,13 @@ class TaylorRuleBacktester:
             "mae": mae,
             "r_squared": float(r_squared),
             "hit_ratio_by_year": hit_ratio,
-            "granger_pvalue_lag2": granger_pvalue,
+            "granger_pvalue_lag2": _granger_pvalue(results),
         }
 
     def compare_models(self, start_date="2015-01-01"):
         rows = []
         for model_type in ["standard", "extended", "augmented"]:
-            tester = TaylorRuleBacktester(model_type=model_type)
+            tester = TaylorRuleBacktester(model_type=model_type, engine=self.engine)
             result = tester.run_backtest(start_date=start_date)
             metrics = tester.calculate_metrics(result)
             rows.append(
@@ -147,6 +204,183 @@ class TaylorRuleBacktester:
 
         return pd.DataFrame(rows).sort_values(by="rmse").reset_index(drop=True)
 
+    def bootstrap_comparison(
+        self,
+        start_date="2015-01-01",
+        predictor=None,
+        n_resamples=5000,
+        block_size=4,
+        confidence=0.90,
+        seed=42,
+    ):
+        """
+        Block-bootstrap intervals and pairwise beat probabilities for the three
+        Taylor variants (and optionally a fitted RatePredictor) on shared meetings.
+        """
+        frames = {}
+        for model_type in ["standard", "extended", "augmented"]:
+            tester = TaylorRuleBacktester(model_type=model_type, engine=self.engine)
+            frames[model_type] = from_backtest(tester.run_backtest(start_date=start_date))
+        if predictor is not None:
+            evaluation = predictor.evaluate_historical()
+            evaluation = evaluation[
+                pd.to_datetime(evaluation["meeting_date"], format="%Y_%m_%d") >= pd.to_datetime(start_date)
+            ]
+            frames["rate_predictor"] = from_predictions(evaluation)
+
+        bootstrap = MetricBootstrap(
+            n_resamples=n_resamples,
+            block_size=block_size,
+            confidence=confidence,
+            seed=seed,
+        )
+        return bootstrap.run(frames)
+
+
+class WalkForwardBacktester(TaylorRuleBacktester):
+    """Rolling-origin out-of-sample backtest.
+
+    Each fold uses only data up to its origin to estimate the FSI
+    normalization scales and the tone sensitivity, then scores the meetings
+    in (origin, origin + horizon]. The output gap and credit gap come from
+    one-sided HP filters, so their values at any date already use only
+    observations up to that date. Input frames are loaded once and shared by
+    all folds and models; folds run on a process pool and their predictions
+    are cached per data version.
+    """
+
+    def _shared_inputs(self):
+        return {
+            "core": self.engine.load_core_inputs(),
+            "fsi_raw": self.engine.load_fsi_raw_inputs(),
+            "tone": self.engine.load_tone_inputs(),
+            "meetings": self._load_meeting_dates(),
+        }
+
+    def _fold_origins(self, shared, start_date, step_months, horizon_months):
+        """Month-end fold origins with training data before them and meetings after them."""
+        first_origin = pd.Timestamp(start_date) - pd.offsets.MonthEnd(1)
+        candidates = pd.date_range(first_origin, shared["core"]["Date"].max(), freq=f"{step_months}ME")
+        meeting_dates = shared["meetings"]["Date"]
+        origins = []
+        for origin in candidates:
+            test_end = origin + pd.offsets.MonthEnd(horizon_months)
+            has_train = (shared["core"]["Date"] <= origin).any()
+            has_test = ((meeting_dates > origin) & (meeting_dates <= test_end)).any()
+            if has_train and has_test:
+                origins.append(origin)
+        return origins
+
+    def _params(self):
+        engine = self.engine
+        return {
+            "alpha": engine.alpha,
+            "beta": engine.beta,
+            "r_star": engine.r_star,
+            "pi_star": engine.pi_star,
+            "gamma": engine.gamma,
+            "delta": engine.delta,
+            "rho": engine.rho,
+            "hp_method": engine.hp_method,
+        }
+
+    def run_walk_forward(
+        self,
+        start_date="2015-01-01",
+        step_months=12,
+        horizon_months=12,
+        models=None,
+        n_jobs=None,
+    ):
+        """
+        Run the walk-forward backtest.
+
+        Returns a dict with:
+            predictions: out-of-sample meeting rows (model_type, origin, ...)
+            folds: per-fold metrics (no Granger test: a fold holds too few meetings)
+            summary: aggregate metrics per model over all out-of-sample rows
+        With horizon_months > step_months folds overlap and a meeting can be
+        scored by more than one fold.
+        """
+        models = list(models or [self.model_type])
+        shared = self._shared_inputs()
+        origins = self._fold_origins(shared, start_date, step_months, horizon_months)
+        params = self._params()
+        version = self.engine._data_version(CORE_INPUT_FILES + FSI_INPUT_FILES + TONE_INPUT_FILES)
+        param_key = tuple(sorted(params.items()))
+
+        tasks, keys, fold_results = [], [], {}
+        for model_type in models:
+            for origin in origins:
+                test_end = origin + pd.offsets.MonthEnd(horizon_months)
+                key = (model_type, param_key, origin, test_end, version)
+                with _FOLD_CACHE_LOCK:
+                    cached = _FOLD_CACHE.get(key)
+                if cached is not None:
+                    fold_results[key] = cached
+                else:
+                    tasks.append((params, model_type, shared, origin, test_end))
+                    keys.append(key)
+
+        workers = max(1, min(n_jobs or (os.cpu_count() or 1), len(tasks)))
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                computed = list(pool.map(_run_fold, tasks))
+        else:
+            computed = [_run_fold(task) for task in tasks]
+
+        with _FOLD_CACHE_LOCK:
+            for key, scored in zip(keys, computed):
+                _FOLD_CACHE[key] = scored
+                fold_results[key] = scored
+
+        fold_rows, frames = [], []
+        for model_type in models:
+            for fold_id, origin in enumerate(origins):
+                test_end = origin + pd.offsets.MonthEnd(horizon_months)
+                scored = fold_results[(model_type, param_key, origin, test_end, version)]
+                if scored.empty:
+                    continue
+                scored = scored.assign(fold=fold_id)
+                frames.append(scored)
+                metrics = self.calculate_metrics(scored)
+                fold_rows.append(
+                    {
+                        "model_type": model_type,
+                        "fold": fold_id,
+                        "origin": origin,
+                        "test_end": test_end,
+                        "observations": metrics["observations"],
+                        "directional_accuracy": metrics["directional_accuracy"],
+                        "rmse": metrics["rmse"],
+                        "mae": metrics["mae"],
+                    }
+                )
+
+        predictions = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+        summary_rows = []
+        for model_type in models:
+            subset = predictions[predictions["model_type"] == model_type] if not predictions.empty else predictions
+            metrics = self.calculate_metrics(subset.sort_values("Date") if not subset.empty else subset)
+            summary_rows.append(
+                {
+                    "model_type": model_type,
+                    "folds": int(subset["fold"].nunique()) if not subset.empty else 0,
+                    "observations": metrics["observations"],
+                    "directional_accuracy": metrics["directional_accuracy"],
+                    "rmse": metrics["rmse"],
+                    "mae": metrics["mae"],
+                    "r_squared": metrics["r_squared"],
+                    "granger_pvalue_lag2": metrics["granger_pvalue_lag2"],
+                }
+            )
+
+        return {
+            "predictions": predictions,
+            "folds": pd.DataFrame(fold_rows),
+            "summary": pd.DataFrame(summary_rows).sort_values(by="rmse").reset_index(drop=True),
+        }
+
 
 class Backtester(TaylorRuleBacktester):
     """Backward-compatible alias for existing imports."""
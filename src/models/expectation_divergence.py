@@ -9,61 +9,31 @@ diverge from actual BOK policy decisions over time.
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Optional
 
 import numpy as np
 import pandas as pd
 
+from src.data.compute_graph import ComputationGraph, get_market_graph
+
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 
 
 class ExpectationDivergenceAnalyzer:
-    def __init__(self) -> None:
+    def __init__(self, graph: Optional[ComputationGraph] = None) -> None:
         self.data_dir = PROJECT_ROOT / "data"
-
-    def _load_daily_series(self, relative_csv: str, value_name: str) -> pd.DataFrame:
-        path = self.data_dir / relative_csv
-        df = pd.read_csv(path, usecols=["TIME", "DATA_VALUE"])
-        df["Date"] = pd.to_datetime(df["TIME"].astype(str), format="%Y%m%d", errors="coerce")
-        df[value_name] = pd.to_numeric(df["DATA_VALUE"], errors="coerce")
-        out = df[["Date", value_name]].dropna().sort_values("Date")
-        return out.groupby("Date", as_index=False).last()
+        self.graph = graph or get_market_graph(self.data_dir)
 
     def _load_tone(self) -> pd.DataFrame:
-        path = self.data_dir / "analysis/tone_index_results.csv"
-        tone = pd.read_csv(path)
-        tone["Date"] = pd.to_datetime(tone["meeting_date"], errors="coerce")
-        tone["tone_index"] = pd.to_numeric(tone["tone_index"], errors="coerce")
-        out = tone[["Date", "meeting_date_str", "tone_index"]].dropna().sort_values("Date")
-        return out
+        return self.graph.get("tone.meetings")
 
     def calculate_implied_expectation(self) -> pd.DataFrame:
-        """Estimate market rate expectations from yield curve."""
-        y3 = self._load_daily_series("08_ecos/bond_yields/ktb_3y.csv", "KTB_3Y")
-        y10 = self._load_daily_series("08_ecos/bond_yields/ktb_10y.csv", "KTB_10Y")
-        base = self._load_daily_series("08_ecos/base_rate/base_rate.csv", "Base_Rate")
-
-        df = y3.merge(y10, on="Date", how="inner")
-        df = df.merge(base, on="Date", how="left")
-        df["Base_Rate"] = df["Base_Rate"].ffill()
-
-        df["Yield_Spread"] = df["KTB_10Y"] - df["KTB_3Y"]
-        df["Implied_Policy_Rate"] = df["KTB_3Y"] - (0.25 * df["Yield_Spread"])
-        df["Implied_Policy_Rate_Smoothed"] = df["Implied_Policy_Rate"].rolling(
-            window=20,
-            min_periods=1,
-        ).mean()
-
-        return df[
-            [
-                "Date",
-                "Base_Rate",
-                "KTB_3Y",
-                "KTB_10Y",
-                "Yield_Spread",
-                "Implied_Policy_Rate",
-                "Implied_Policy_Rate_Smoothed",
-            ]
-        ].copy()
+        """Estimate market rate expectations from yield curve.
+
+        Implied policy rate = KTB_3Y - 0.25 * (KTB_10Y - KTB_3Y), smoothed over
+        20 trading days; computed once per data version by the shared graph.
+        """
+        return self.graph.get("implied_policy_rate")
 
     def calculate_divergence(self) -> pd.DataFrame:
         """Calculate cumulative divergence between expected and actual decisions."""
@@ -10,13 +10,18 @@ BOK Tone Index를 기반으로 다음 금통위의 금리 결정(인상/동결/
 import pandas as pd
 import numpy as np
 import logging
-from typing import Dict, List, Optional, Tuple
+import hashlib
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 import json
 from datetime import datetime, timedelta
 
 from src.data.ecos_data_loader import EcosDataLoader
+from src.utils.cache_io import atomic_write
 
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -24,6 +29,7 @@ logger = logging.getLogger(__name__)
 
 # sklearn을 선택사항으로 변경 (Python 3.14에서 빌드 문제 해결)
 try:
+    import sklearn
     from sklearn.linear_model import LogisticRegression
     from sklearn.preprocessing import StandardScaler
     from sklearn.model_selection import cross_val_score, TimeSeriesSplit
@@ -45,6 +51,11 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
 MODEL_DIR = DATA_DIR / "models"
 
+# 모델 아티팩트 형식 버전 (pickle 구조가 바뀌면 올림)
+ARTIFACT_VERSION = 1
+ARTIFACT_PREFIX = "rate_predictor"
+MAX_ARTIFACTS = 5
+
 
 @dataclass
 class PredictionResult:
@@ -58,14 +69,58 @@ class PredictionResult:
     tone_index: float      # 현재 톤 지수
 
 
+@dataclass
+class WalkForwardResult:
+    """Walk-forward 검증 결과"""
+    predictions: pd.DataFrame  # 회의별 표본외 예측 확률
+    metrics: Dict[str, float]  # accuracy, log_loss, brier_score 등
+
+
+def _walk_forward_fold(X_train: np.ndarray, y_train: np.ndarray, x_test: np.ndarray) -> Optional[np.ndarray]:
+    """
+    직전 회의까지의 데이터로 재학습한 뒤 다음 회의의 [인하, 동결, 인상] 확률 반환
+
+    학습 구간에 클래스가 하나뿐이면 None (룰 기반으로 대체)
+    """
+    if len(np.unique(y_train)) < 2:
+        return None
+
+    scaler = StandardScaler()
+    model = LogisticRegression(solver='lbfgs', max_iter=1000)
+    model.fit(scaler.fit_transform(X_train), y_train)
+    probs = model.predict_proba(scaler.transform(x_test.reshape(1, -1)))[0]
+
+    out = np.zeros(3)
+    for label, prob in zip(model.classes_, probs):
+        out[int(label) + 1] = prob
+    return out
+
+
+def _walk_forward_chunk(tasks: List[Tuple[np.ndarray, np.ndarray, np.ndarray]]) -> List[Optional[np.ndarray]]:
+    return [_walk_forward_fold(*task) for task in tasks]
+
+
 class RatePredictor:
     """금리 결정 확률 예측기"""
 
     ACTION_MAP = {"hike": 1, "hold": 0, "cut": -1}
     ACTION_LABELS = {1: "인상", 0: "동결", -1: "인하"}
+    FEATURE_COLUMNS = [
+        'tone_index',
+        'hawkish_score',
+        'dovish_score',
+        'hawkish_terms_count',
+        'dovish_terms_count',
+    ]
+    PROB_COLUMNS = {1: 'prob_hike', 0: 'prob_hold', -1: 'prob_cut'}
+
+    def __init__(self, model_dir: Optional[Path] = None):
+        """
+        예측기 초기화
 
-    def __init__(self):
-        """예측기 초기화"""
+        Args:
+            model_dir: 모델 아티팩트 저장 디렉토리 (None이면 data/models)
+        """
         self.model = None
         if SKLEARN_AVAILABLE:
             self.scaler = StandardScaler()
@@ -74,9 +129,11 @@ class RatePredictor:
         self.is_fitted = False
         self._data_loader = None
         self._rate_history = None
+        self.model_dir = Path(model_dir) if model_dir is not None else MODEL_DIR
+        self.artifact_info: Optional[Dict[str, Any]] = None
 
         # 디렉토리 생성
-        MODEL_DIR.mkdir(parents=True, exist_ok=True)
+        self.model_dir.mkdir(parents=True, exist_ok=True)
 
 
     @property
@@ -103,6 +160,32 @@ class RatePredictor:
         df = pd.read_csv(tone_path)
         return df
 
+    def build_features(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        톤 분석 결과와 금리 이력을 컬럼 연산으로 결합한 특성 테이블 생성
+
+        금리 이력에 없는 회의는 제외됩니다.
+
+        Args:
+            df: 톤 분석 결과 DataFrame
+
+        Returns:
+            DataFrame (meeting_date_str, FEATURE_COLUMNS..., actual_rate, action, label)
+        """
+        history = self.RATE_HISTORY
+        known = df[df['meeting_date_str'].isin(list(history.keys()))]
+        features = known[['meeting_date_str'] + self.FEATURE_COLUMNS].reset_index(drop=True)
+
+        outcomes = pd.DataFrame(
+            [history[key] for key in features['meeting_date_str']],
+            columns=['actual_rate', 'action'],
+            dtype=object,
+        )
+        features['actual_rate'] = outcomes['actual_rate'].astype(float)
+        features['action'] = outcomes['action']
+        features['label'] = features['action'].map(self.ACTION_MAP).astype(int)
+        return features
+
     def prepare_training_data(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
         """
         학습 데이터 준비
@@ -113,39 +196,144 @@ class RatePredictor:
         Returns:
             (X, y) 튜플
         """
-        X_list = []
-        y_list = []
+        features = self.build_features(df)
+        X = features[self.FEATURE_COLUMNS].to_numpy(dtype=float)
+        y = features['label'].to_numpy()
+        return X, y
+
+    def _feature_matrix(self, df: pd.DataFrame) -> np.ndarray:
+        """예측용 특성 행렬 (없는 컬럼은 0)"""
+        columns = [
+            df[col].to_numpy(dtype=float) if col in df.columns else np.zeros(len(df))
+            for col in self.FEATURE_COLUMNS
+        ]
+        return np.column_stack(columns) if len(df) else np.empty((0, len(self.FEATURE_COLUMNS)))
+
+    def data_hash(self, df: pd.DataFrame) -> str:
+        """
+        학습 입력의 SHA-256 해시
 
-        for _, row in df.iterrows():
-            meeting_date = row['meeting_date_str']
+        실제 학습에 쓰이는 특성 테이블(톤 특성 + 금리 이력에서 만든 라벨)로 계산하므로
+        금리 이력이 CSV가 아닌 ECOS API에서 갱신되어도 라벨 변경이 반영됩니다.
+        """
+        table = self.build_features(df)[['meeting_date_str'] + self.FEATURE_COLUMNS + ['actual_rate', 'label']]
+        digest = hashlib.sha256()
+        digest.update(json.dumps(list(table.columns)).encode('utf-8'))
+        digest.update(pd.util.hash_pandas_object(table, index=False).to_numpy().tobytes())
+        return digest.hexdigest()
+
+    def _artifact_compatible(self, artifact: Dict[str, Any]) -> bool:
+        return (
+            artifact.get('artifact_version') == ARTIFACT_VERSION
+            and artifact.get('feature_columns') == self.FEATURE_COLUMNS
+            and artifact.get('sklearn_version') == (sklearn.__version__ if SKLEARN_AVAILABLE else None)
+        )
 
-            # 해당 회의의 금리 결정 확인
-            if meeting_date not in self.RATE_HISTORY:
+    def list_artifacts(self) -> List[Path]:
+        """저장된 아티팩트 목록 (최신순)"""
+        return sorted(self.model_dir.glob(f"{ARTIFACT_PREFIX}_*.pkl"), reverse=True)
+
+    def save_artifact(self, data_hash: str, metrics: Optional[Dict] = None) -> Path:
+        """
+        학습된 모델을 버전 아티팩트로 저장
+
+        Args:
+            data_hash: 학습 데이터 해시
+            metrics: 학습/검증 지표
+
+        Returns:
+            저장된 파일 경로
+        """
+        if self.model is None:
+            raise ValueError("학습된 모델이 없습니다")
+
+        trained_at = datetime.now()
+        artifact = {
+            'artifact_version': ARTIFACT_VERSION,
+            'sklearn_version': sklearn.__version__,
+            'feature_columns': list(self.FEATURE_COLUMNS),
+            'data_hash': data_hash,
+            'metrics': {k: float(v) for k, v in (metrics or {}).items()},
+            'trained_at': trained_at.isoformat(),
+            'model': self.model,
+            'scaler': self.scaler,
+        }
+        path = self.model_dir / f"{ARTIFACT_PREFIX}_{trained_at:%Y%m%d_%H%M%S_%f}_{data_hash[:12]}.pkl"
+        with atomic_write(path) as f:
+            pickle.dump(artifact, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        # 오래된 아티팩트 정리
+        for old in self.list_artifacts()[MAX_ARTIFACTS:]:
+            old.unlink(missing_ok=True)
+
+        self.artifact_info = {k: v for k, v in artifact.items() if k not in ('model', 'scaler')}
+        self.artifact_info['path'] = str(path)
+        logger.info(f"모델 아티팩트 저장: {path.name}")
+        return path
+
+    def load_artifact(self, data_hash: Optional[str] = None) -> bool:
+        """
+        가장 최신의 호환 아티팩트 로드
+
+        Args:
+            data_hash: 지정 시 해당 데이터로 학습된 아티팩트만 사용
+
+        Returns:
+            로드 성공 여부
+        """
+        if not SKLEARN_AVAILABLE:
+            return False
+
+        for path in self.list_artifacts():
+            try:
+                with open(path, 'rb') as f:
+                    artifact = pickle.load(f)
+            except Exception as e:
+                logger.warning(f"아티팩트 로드 실패 ({path.name}): {e}")
                 continue
 
-            rate, action = self.RATE_HISTORY[meeting_date]
-            y = self.ACTION_MAP[action]
+            if not self._artifact_compatible(artifact):
+                continue
+            if data_hash is not None and artifact.get('data_hash') != data_hash:
+                continue
+
+            self.model = artifact['model']
+            self.scaler = artifact['scaler']
+            self.is_fitted = True
+            self.artifact_info = {k: v for k, v in artifact.items() if k not in ('model', 'scaler')}
+            self.artifact_info['path'] = str(path)
+            logger.info(f"모델 아티팩트 로드: {path.name}")
+            return True
+        return False
 
-            # 특성 추출
-            features = [
-                row['tone_index'],
-                row['hawkish_score'],
-                row['dovish_score'],
-                row['hawkish_terms_count'],
-                row['dovish_terms_count'],
-            ]
+    def load_or_train(self, df: Optional[pd.DataFrame] = None) -> bool:
+        """
+        학습 데이터 해시가 같은 아티팩트가 있으면 로드하고, 없으면 학습 후 저장
+
+        Returns:
+            True면 아티팩트 로드, False면 새로 학습(또는 룰 기반 fallback)
+        """
+        if df is None:
+            try:
+                df = self.load_tone_data()
+            except FileNotFoundError:
+                logger.warning("톤 분석 결과 파일이 없습니다. 휴리스틱 모드로 작동합니다.")
+                self.is_fitted = False
+                return False
 
-            X_list.append(features)
-            y_list.append(y)
+        if SKLEARN_AVAILABLE and self.load_artifact(data_hash=self.data_hash(df)):
+            return True
 
-        return np.array(X_list), np.array(y_list)
+        self.train(df)
+        return False
 
-    def train(self, df: Optional[pd.DataFrame] = None):
+    def train(self, df: Optional[pd.DataFrame] = None, save: bool = True):
         """
         모델 학습
 
         Args:
             df: 톤 분석 결과 DataFrame (None이면 파일에서 로드)
+            save: 학습 후 모델 아티팩트 저장 여부
         """
         if df is None:
             try:
@@ -192,7 +380,7 @@ class RatePredictor:
             cv_scores = cross_val_score(self.model, X_scaled, y, cv=tscv)
             logger.info(f"교차 검증 정확도: {cv_scores.mean():.2%} (±{cv_scores.std():.2%})")
 
-            return {
+            metrics = {
                 'accuracy': accuracy,
                 'cv_mean': cv_scores.mean(),
                 'cv_std': cv_scores.std(),
@@ -200,13 +388,21 @@ class RatePredictor:
             }
         except Exception as e:
             logger.warning(f"교차 검증 실패: {e}")
-            return {
+            metrics = {
                 'accuracy': accuracy,
                 'cv_mean': 0.0,
                 'cv_std': 0.0,
                 'n_samples': len(X)
             }
 
+        if save:
+            try:
+                self.save_artifact(self.data_hash(df), metrics)
+            except Exception as e:
+                logger.warning(f"모델 아티팩트 저장 실패: {e}")
+
+        return metrics
+
     def predict(self, tone_result: Dict) -> PredictionResult:
         """
         다음 금통위 금리 결정 확률 예측
@@ -217,48 +413,63 @@ class RatePredictor:
         Returns:
             PredictionResult 객체
         """
-        # sklearn이 없거나 모델이 학습되지 않았으면 룰 기반 예측 사용
-        if not SKLEARN_AVAILABLE or not self.is_fitted or self.model is None:
-            return self._rule_based_predict(tone_result)
-
-        # 특성 추출
-        features = np.array([[
-            tone_result.get('tone_index', 0),
-            tone_result.get('hawkish_score', 0),
-            tone_result.get('dovish_score', 0),
-            tone_result.get('hawkish_terms_count', 0),
-            tone_result.get('dovish_terms_count', 0),
-        ]])
+        row = self.predict_batch(pd.DataFrame([tone_result])).iloc[0]
+        return PredictionResult(
+            meeting_date=row['meeting_date'],
+            prob_hike=float(row['prob_hike']),
+            prob_hold=float(row['prob_hold']),
+            prob_cut=float(row['prob_cut']),
+            predicted_action=row['predicted_action'],
+            confidence=float(row['confidence']),
+            tone_index=tone_result.get('tone_index', 0)
+        )
 
-        # 스케일링
-        features_scaled = self.scaler.transform(features)
+    def predict_batch(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        여러 톤 결과(과거 회의, 시뮬레이션 시나리오 등)를 한 번에 예측
 
-        # 확률 예측
-        probs = self.model.predict_proba(features_scaled)[0]
-        classes = self.model.classes_
+        스케일링과 predict_proba를 전체 행에 대해 한 번씩만 호출합니다.
 
-        # 클래스별 확률 매핑
-        prob_dict = dict(zip(classes, probs))
-        prob_hike = prob_dict.get(1, 0.0)
-        prob_hold = prob_dict.get(0, 0.0)
-        prob_cut = prob_dict.get(-1, 0.0)
+        Args:
+            df: FEATURE_COLUMNS를 포함한 DataFrame (없는 컬럼은 0으로 간주)
 
-        # 예측 행동
-        pred_class = self.model.predict(features_scaled)[0]
-        predicted_action = self.ACTION_LABELS.get(pred_class, "동결")
-        confidence = max(probs)
+        Returns:
+            DataFrame (meeting_date, tone_index, prob_hike, prob_hold, prob_cut,
+                       predicted_action, confidence) - 입력과 같은 행 순서
+        """
+        X = self._feature_matrix(df)
 
-        return PredictionResult(
-            meeting_date=tone_result.get('meeting_date_str', ''),
-            prob_hike=prob_hike,
-            prob_hold=prob_hold,
-            prob_cut=prob_cut,
-            predicted_action=predicted_action,
-            confidence=confidence,
-            tone_index=tone_result.get('tone_index', 0)
+        # sklearn이 없거나 모델이 학습되지 않았으면 룰 기반 예측 사용
+        if not SKLEARN_AVAILABLE or not self.is_fitted or self.model is None:
+            probs, actions = self._rule_based_batch(X[:, 0])
+        else:
+            class_probs = self.model.predict_proba(self.scaler.transform(X))
+            classes = self.model.classes_
+
+            # 클래스별 확률 매핑 (학습에 없던 클래스는 0)
+            probs = {}
+            for label, column in self.PROB_COLUMNS.items():
+                matches = np.flatnonzero(classes == label)
+                probs[column] = class_probs[:, matches[0]] if matches.size else np.zeros(len(X))
+
+            pred_class = classes[np.argmax(class_probs, axis=1)]
+            actions = np.array([self.ACTION_LABELS.get(c, "동결") for c in pred_class], dtype=object)
+
+        meeting_dates = df['meeting_date_str'] if 'meeting_date_str' in df.columns else pd.Series('', index=df.index)
+        result = pd.DataFrame(
+            {
+                'meeting_date': meeting_dates.fillna('').to_numpy(),
+                'tone_index': X[:, 0],
+                'prob_hike': probs['prob_hike'],
+                'prob_hold': probs['prob_hold'],
+                'prob_cut': probs['prob_cut'],
+                'predicted_action': actions,
+            }
         )
+        result['confidence'] = result[['prob_hike', 'prob_hold', 'prob_cut']].max(axis=1)
+        return result
 
-    def _rule_based_predict(self, tone_result: Dict) -> PredictionResult:
+    def _rule_based_batch(self, tone: np.ndarray) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
         """
         규칙 기반 예측 (모델이 없을 때 사용)
 
@@ -267,82 +478,199 @@ class RatePredictor:
         - -0.2 < tone < 0.2: 동결 가능성 높음
         - tone < -0.2: 인하 가능성 높음
         """
-        tone = tone_result.get('tone_index', 0)
+        tone = np.asarray(tone, dtype=float)
+        magnitude = np.abs(tone)
+        hawkish = tone > 0.2
+        dovish = tone < -0.2
 
-        if tone > 0.2:
-            prob_hike = 0.6 + tone * 0.3
-            prob_hold = 0.3 - tone * 0.1
-            prob_cut = 0.1 - tone * 0.05
-            predicted_action = "인상"
-        elif tone < -0.2:
-            prob_cut = 0.6 + abs(tone) * 0.3
-            prob_hold = 0.3 - abs(tone) * 0.1
-            prob_hike = 0.1 - abs(tone) * 0.05
-            predicted_action = "인하"
-        else:
-            prob_hold = 0.7
-            prob_hike = 0.15 + tone * 0.2
-            prob_cut = 0.15 - tone * 0.2
-            predicted_action = "동결"
+        prob_hike = np.select([hawkish, dovish], [0.6 + tone * 0.3, 0.1 - magnitude * 0.05], 0.15 + tone * 0.2)
+        prob_hold = np.select([hawkish, dovish], [0.3 - tone * 0.1, 0.3 - magnitude * 0.1], 0.7)
+        prob_cut = np.select([hawkish, dovish], [0.1 - tone * 0.05, 0.6 + magnitude * 0.3], 0.15 - tone * 0.2)
+        actions = np.select([hawkish, dovish], ["인상", "인하"], "동결").astype(object)
 
         # 확률 정규화
         total = prob_hike + prob_hold + prob_cut
-        prob_hike /= total
-        prob_hold /= total
-        prob_cut /= total
+        probs = {
+            'prob_hike': prob_hike / total,
+            'prob_hold': prob_hold / total,
+            'prob_cut': prob_cut / total,
+        }
+        return probs, actions
 
+    def _rule_based_predict(self, tone_result: Dict) -> PredictionResult:
+        """규칙 기반 단일 예측"""
+        tone = tone_result.get('tone_index', 0)
+        probs, actions = self._rule_based_batch(np.array([tone]))
         return PredictionResult(
             meeting_date=tone_result.get('meeting_date_str', ''),
-            prob_hike=prob_hike,
-            prob_hold=prob_hold,
-            prob_cut=prob_cut,
-            predicted_action=predicted_action,
-            confidence=max(prob_hike, prob_hold, prob_cut),
+            prob_hike=float(probs['prob_hike'][0]),
+            prob_hold=float(probs['prob_hold'][0]),
+            prob_cut=float(probs['prob_cut'][0]),
+            predicted_action=actions[0],
+            confidence=float(max(p[0] for p in probs.values())),
             tone_index=tone
         )
 
-    def evaluate_historical(self, df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+    def _walk_forward_cache_path(self) -> Path:
+        return self.model_dir / "walk_forward_cache.pkl"
+
+    def _load_walk_forward_cache(self) -> Dict[str, Optional[np.ndarray]]:
+        path = self._walk_forward_cache_path()
+        if not path.exists():
+            return {}
+        try:
+            with open(path, 'rb') as f:
+                cache = pickle.load(f)
+            if cache.get('sklearn_version') == sklearn.__version__:
+                return cache.get('folds', {})
+        except Exception as e:
+            logger.warning(f"walk-forward 캐시 로드 실패: {e}")
+        return {}
+
+    def _save_walk_forward_cache(self, folds: Dict[str, Optional[np.ndarray]]):
+        with atomic_write(self._walk_forward_cache_path()) as f:
+            pickle.dump({'sklearn_version': sklearn.__version__, 'folds': folds}, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def _fold_key(X: np.ndarray, y: np.ndarray, end: int) -> str:
+        """회의 end를 예측하는 fold의 키: 학습 구간 + 예측 대상 특성의 해시"""
+        digest = hashlib.sha256()
+        digest.update(np.ascontiguousarray(X[:end + 1]).tobytes())
+        digest.update(np.ascontiguousarray(y[:end]).tobytes())
+        return digest.hexdigest()
+
+    def walk_forward_evaluate(
+        self,
+        df: Optional[pd.DataFrame] = None,
+        min_train: int = 12,
+        n_jobs: Optional[int] = None,
+        use_cache: bool = True,
+    ) -> WalkForwardResult:
         """
-        과거 데이터에 대한 예측 정확도 평가
+        Walk-forward 표본외 검증
+
+        각 회의마다 그 이전 회의만으로 모델을 다시 학습하고 해당 회의를 예측합니다.
+        fold들은 서로 독립이므로 프로세스 풀에서 병렬로 실행하며, fold 결과는
+        학습 데이터 해시로 캐시되어 새 회의가 추가되면 새 fold만 계산합니다.
+
+        Args:
+            df: 톤 분석 결과 DataFrame (None이면 파일에서 로드)
+            min_train: 첫 예측 전 최소 학습 회의 수
+            n_jobs: 워커 프로세스 수 (None이면 CPU 수, 1이면 순차 실행)
+            use_cache: fold 캐시 사용 여부
 
         Returns:
-            평가 결과 DataFrame
+            WalkForwardResult (회의별 확률 테이블 + accuracy/log-loss/Brier)
         """
         if df is None:
             df = self.load_tone_data()
 
-        results = []
-
-        for _, row in df.iterrows():
-            meeting_date = row['meeting_date_str']
+        features = self.build_features(df)
+        order = pd.to_datetime(features['meeting_date_str'].str.replace('_', '-'), errors='coerce').argsort(kind='stable')
+        features = features.iloc[order].reset_index(drop=True)
+        X = features[self.FEATURE_COLUMNS].to_numpy(dtype=float)
+        y = features['label'].to_numpy(dtype=int)
+        targets = list(range(min_train, len(features)))
+        if not targets:
+            raise ValueError(f"walk-forward 검증에 필요한 회의 수가 부족합니다: {len(features)} <= {min_train}")
 
-            # 실제 금리 결정 확인
-            if meeting_date not in self.RATE_HISTORY:
-                continue
-
-            rate, actual_action = self.RATE_HISTORY[meeting_date]
-
-            # 예측
-            prediction = self.predict(row.to_dict())
+        fold_probs: Dict[int, Optional[np.ndarray]] = {}
+        if SKLEARN_AVAILABLE:
+            cache = self._load_walk_forward_cache() if use_cache else {}
+            keys = {i: self._fold_key(X, y, i) for i in targets}
+            pending = [i for i in targets if keys[i] not in cache]
+
+            if pending:
+                tasks = [(X[:i], y[:i], X[i]) for i in pending]
+                workers = max(1, min(n_jobs or (os.cpu_count() or 1), len(tasks)))
+                if workers > 1:
+                    chunks = [list(c) for c in np.array_split(np.arange(len(tasks)), workers) if len(c)]
+                    with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+                        futures = [pool.submit(_walk_forward_chunk, [tasks[j] for j in chunk]) for chunk in chunks]
+                        computed = [prob for future in futures for prob in future.result()]
+                else:
+                    computed = _walk_forward_chunk(tasks)
+                for i, prob in zip(pending, computed):
+                    cache[keys[i]] = prob
+                logger.info(f"walk-forward: {len(pending)}개 fold 계산, {len(targets) - len(pending)}개 캐시 사용")
+                if use_cache:
+                    self._save_walk_forward_cache(cache)
+
+            fold_probs = {i: cache[keys[i]] for i in targets}
+
+        # 학습이 불가능한 fold는 룰 기반 확률로 대체
+        rule_probs, _ = self._rule_based_batch(X[targets, 0])
+        probs = np.empty((len(targets), 3))
+        methods = []
+        for row, i in enumerate(targets):
+            prob = fold_probs.get(i)
+            if prob is None:
+                prob = [rule_probs['prob_cut'][row], rule_probs['prob_hold'][row], rule_probs['prob_hike'][row]]
+                methods.append('rule')
+            else:
+                methods.append('logit')
+            probs[row] = prob
+
+        actual = y[targets]
+        onehot = np.zeros_like(probs)
+        onehot[np.arange(len(targets)), actual + 1] = 1.0
+        predicted = np.argmax(probs, axis=1) - 1
+        eps = 1e-15
+
+        predictions = pd.DataFrame({
+            'meeting_date': features['meeting_date_str'].iloc[targets].to_numpy(),
+            'n_train': targets,
+            'method': methods,
+            'prob_cut': probs[:, 0],
+            'prob_hold': probs[:, 1],
+            'prob_hike': probs[:, 2],
+            'actual_action': [self.ACTION_LABELS[a] for a in actual],
+            'predicted_action': [self.ACTION_LABELS[p] for p in predicted],
+            'is_correct': predicted == actual,
+            'log_loss': -np.log(np.clip(probs[np.arange(len(targets)), actual + 1], eps, 1.0)),
+            'brier': ((probs - onehot) ** 2).sum(axis=1),
+        })
+        metrics = {
+            'n_predictions': float(len(predictions)),
+            'accuracy': float(predictions['is_correct'].mean()),
+            'log_loss': float(predictions['log_loss'].mean()),
+            'brier_score': float(predictions['brier'].mean()),
+        }
+        logger.info(
+            f"walk-forward 정확도 {metrics['accuracy']:.2%}, "
+            f"log-loss {metrics['log_loss']:.3f}, Brier {metrics['brier_score']:.3f}"
+        )
+        return WalkForwardResult(predictions=predictions, metrics=metrics)
 
-            # 예측 vs 실제 비교
-            actual_label = self.ACTION_LABELS.get(self.ACTION_MAP[actual_action], "동결")
-            is_correct = prediction.predicted_action == actual_label
+    def evaluate_historical(self, df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """
+        과거 데이터에 대한 예측 정확도 평가
 
-            results.append({
-                'meeting_date': meeting_date,
-                'tone_index': row['tone_index'],
-                'actual_action': actual_label,
-                'predicted_action': prediction.predicted_action,
-                'prob_hike': prediction.prob_hike,
-                'prob_hold': prediction.prob_hold,
-                'prob_cut': prediction.prob_cut,
-                'confidence': prediction.confidence,
-                'is_correct': is_correct,
-                'actual_rate': rate
-            })
+        Returns:
+            평가 결과 DataFrame
+        """
+        if df is None:
+            df = self.load_tone_data()
 
-        result_df = pd.DataFrame(results)
+        features = self.build_features(df)
+        if features.empty:
+            return pd.DataFrame()
+
+        predictions = self.predict_batch(features)
+        actual_labels = features['label'].map(self.ACTION_LABELS).fillna("동결")
+
+        result_df = pd.DataFrame({
+            'meeting_date': features['meeting_date_str'],
+            'tone_index': features['tone_index'],
+            'actual_action': actual_labels,
+            'predicted_action': predictions['predicted_action'],
+            'prob_hike': predictions['prob_hike'],
+            'prob_hold': predictions['prob_hold'],
+            'prob_cut': predictions['prob_cut'],
+            'confidence': predictions['confidence'],
+            'is_correct': predictions['predicted_action'] == actual_labels,
+            'actual_rate': features['actual_rate'],
+        })
 
         if len(result_df) > 0:
             accuracy = result_df['is_correct'].mean()
@@ -369,12 +697,14 @@ def main():
 
     predictor = RatePredictor()
 
-    # 모델 학습
+    # 모델 학습 (명시적 실행이므로 데이터 변경 여부와 관계없이 재학습 후 아티팩트 저장)
     print("\n[1] 모델 학습")
     train_result = predictor.train()
     if train_result:
         print(f"  - 학습 정확도: {train_result['accuracy']:.2%}")
         print(f"  - 교차 검증: {train_result['cv_mean']:.2%} (±{train_result['cv_std']:.2%})")
+    if predictor.artifact_info:
+        print(f"  - 아티팩트: {predictor.artifact_info['path']}")
 
     # 과거 데이터 평가
     print("\n[2] 과거 데이터 예측 평가")
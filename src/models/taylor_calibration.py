@@ -0,0 +1,213 @@
+# pyright: reportCallIssue=false, reportArgumentType=false, reportReturnType=false, reportAttributeAccessIssue=false, reportGeneralTypeIssues=false
+"""
+Rolling / Expanding Taylor Rule Calibration.
+
+Estimates the BOK reaction function window by window:
+
+    Base_Rate - pi = r* + alpha(pi - pi*) + beta*y + gamma*FSI + s*Tone + e
+
+The design matrix is built once. Per-window normal equations come from
+cumulative sums of x_t x_t' and x_t y_t, so every window is solved in one
+batched linear-algebra call. Bootstrap confidence bands re-run the same
+batched solve on resampled targets, fanned out over a process pool.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.taylor_rule import ExtendedTaylorRule
+
+COEFFICIENTS = ("r_star", "alpha", "beta", "gamma", "tone_sensitivity")
+REGRESSORS = ("Inflation_Gap", "Output_Gap", "FSI", "tone_index")
+
+
+def _window_bounds(n_obs: int, window: Optional[int], min_obs: int) -> Tuple[np.ndarray, np.ndarray]:
+    """[start, end) row bounds: full rolling windows, or expanding windows from min_obs rows."""
+    if window is None:
+        ends = np.arange(min_obs, n_obs + 1)
+        return np.zeros_like(ends), ends
+    ends = np.arange(window, n_obs + 1)
+    return ends - window, ends
+
+
+def _window_sums(values: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Sum of values[start:end] along axis 0 for every window, via one cumulative sum."""
+    cum = np.concatenate([np.zeros((1,) + values.shape[1:]), np.cumsum(values, axis=0)])
+    return cum[ends] - cum[starts]
+
+
+def _solve_windows(
+    X: np.ndarray,
+    y: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """OLS coefficients, R-squared and (X'X)^+ for every window via cumulative normal equations."""
+    xx = np.einsum("ti,tj->tij", X, X)
+    w_xx = _window_sums(xx, starts, ends)
+    w_xy = _window_sums(X * y[:, np.newaxis], starts, ends)
+    inv_xx = np.linalg.pinv(w_xx)
+    coefs = np.einsum("wij,wj->wi", inv_xx, w_xy)
+
+    n = (ends - starts).astype(float)
+    sum_y = _window_sums(y, starts, ends)
+    sum_yy = _window_sums(y * y, starts, ends)
+    ss_tot = sum_yy - (sum_y ** 2) / n
+    # SSR = y'y - 2 b'X'y + b'X'X b
+    ss_res = (
+        sum_yy
+        - 2.0 * np.einsum("wi,wi->w", coefs, w_xy)
+        + np.einsum("wi,wij,wj->w", coefs, w_xx, coefs)
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r_squared = np.where(ss_tot > 0, 1.0 - ss_res / ss_tot, np.nan)
+    return coefs, r_squared, inv_xx
+
+
+def _bootstrap_worker(
+    X: np.ndarray,
+    y: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    coefs: np.ndarray,
+    inv_xx: np.ndarray,
+    block_size: int,
+    n_reps: int,
+    seed: np.random.SeedSequence,
+) -> np.ndarray:
+    """Wild block bootstrap on each window's own residuals.
+
+    With block-wise Rademacher signs s_t, the resampled target is
+    y*_t = x_t'b_w + s_t e_wt, so b*_w = b_w + (X'X)^+ X'(s * e_w), where
+    X'(s * e_w) = sum(s x y) - sum(s x x') b_w over the window.
+    """
+    rng = np.random.default_rng(seed)
+    n_obs = len(y)
+    n_blocks = -(-n_obs // block_size)
+    xx = np.einsum("ti,tj->tij", X, X)
+    xy = X * y[:, np.newaxis]
+    out = np.empty((n_reps, len(starts), X.shape[1]))
+    for rep in range(n_reps):
+        signs = rng.choice([-1.0, 1.0], size=n_blocks).repeat(block_size)[:n_obs]
+        s_xy = _window_sums(signs[:, np.newaxis] * xy, starts, ends)
+        s_xx = _window_sums(signs[:, np.newaxis, np.newaxis] * xx, starts, ends)
+        score = s_xy - np.einsum("wij,wj->wi", s_xx, coefs)
+        out[rep] = coefs + np.einsum("wij,wj->wi", inv_xx, score)
+    return out
+
+
+class TaylorRuleCalibrator:
+    """Rolling and expanding-window estimates of the Taylor rule coefficients."""
+
+    def __init__(self, engine: Optional[ExtendedTaylorRule] = None) -> None:
+        self.engine = engine or ExtendedTaylorRule()
+
+    def build_design_matrix(self) -> Tuple[pd.DatetimeIndex, np.ndarray, np.ndarray]:
+        """Dates, regressors [1, pi-pi*, y, FSI, tone] and target Base_Rate - pi."""
+        df = self.engine._augmented_frame()
+        df = df.dropna(subset=["Base_Rate", "Inflation", *REGRESSORS]).reset_index(drop=True)
+        X = np.column_stack([np.ones(len(df)), df[list(REGRESSORS)].to_numpy(dtype=float)])
+        y = (df["Base_Rate"] - df["Inflation"]).to_numpy(dtype=float)
+        return pd.DatetimeIndex(df["Date"]), X, y
+
+    def calibrate(
+        self,
+        window: Optional[int] = 60,
+        min_obs: int = 36,
+        n_bootstrap: int = 0,
+        block_size: int = 6,
+        confidence: float = 0.90,
+        n_jobs: Optional[int] = None,
+        seed: int = 42,
+    ) -> pd.DataFrame:
+        """
+        Estimate coefficients for every window end date.
+
+        Args:
+            window: rolling window length in months; None for an expanding window.
+            min_obs: size of the first expanding window (ignored for rolling windows).
+            n_bootstrap: bootstrap replications for confidence bands (0 disables).
+            block_size: block length (months) for the wild block bootstrap.
+            confidence: two-sided band coverage.
+            n_jobs: worker processes for the bootstrap (None = CPU count).
+            seed: base random seed.
+
+        Returns:
+            DataFrame indexed by window end Date with one column per coefficient,
+            n_obs, r_squared and, when bootstrapping, <coef>_lower/<coef>_upper.
+        """
+        dates, X, y = self.build_design_matrix()
+        n_obs, k = X.shape
+        first_window = max(min_obs, k + 1) if window is None else window
+        if first_window < k + 1:
+            raise ValueError(f"window must be at least {k + 1} observations")
+        if n_obs < first_window:
+            raise ValueError(f"Not enough observations for calibration: {n_obs} < {first_window}")
+
+        starts, ends = _window_bounds(n_obs, window, first_window)
+        coefs, r_squared, inv_xx = _solve_windows(X, y, starts, ends)
+
+        out = pd.DataFrame(coefs, columns=list(COEFFICIENTS), index=dates[ends - 1])
+        out.index.name = "Date"
+        out["n_obs"] = ends - starts
+        out["r_squared"] = r_squared
+
+        if n_bootstrap > 0:
+            draws = self._bootstrap(X, y, starts, ends, coefs, inv_xx, n_bootstrap, block_size, n_jobs, seed)
+            tail = (1.0 - confidence) / 2.0
+            lower = np.quantile(draws, tail, axis=0)
+            upper = np.quantile(draws, 1.0 - tail, axis=0)
+            for i, name in enumerate(COEFFICIENTS):
+                out[f"{name}_lower"] = lower[:, i]
+                out[f"{name}_upper"] = upper[:, i]
+        return out
+
+    def _bootstrap(
+        self,
+        X: np.ndarray,
+        y: np.ndarray,
+        starts: np.ndarray,
+        ends: np.ndarray,
+        coefs: np.ndarray,
+        inv_xx: np.ndarray,
+        n_bootstrap: int,
+        block_size: int,
+        n_jobs: Optional[int],
+        seed: int,
+    ) -> np.ndarray:
+        """Bootstrap draws (reps x windows x coefs), split into chunks across worker processes."""
+        workers = max(1, min(n_jobs or (os.cpu_count() or 1), n_bootstrap))
+        chunk_sizes = [len(c) for c in np.array_split(np.arange(n_bootstrap), workers) if len(c)]
+        seeds = np.random.SeedSequence(seed).spawn(len(chunk_sizes))
+
+        if len(chunk_sizes) == 1:
+            return _bootstrap_worker(X, y, starts, ends, coefs, inv_xx, block_size, chunk_sizes[0], seeds[0])
+
+        results: List[np.ndarray] = []
+        with ProcessPoolExecutor(max_workers=len(chunk_sizes)) as pool:
+            futures = [
+                pool.submit(_bootstrap_worker, X, y, starts, ends, coefs, inv_xx, block_size, reps, s)
+                for reps, s in zip(chunk_sizes, seeds)
+            ]
+            for future in futures:
+                results.append(future.result())
+        return np.concatenate(results, axis=0)
+
+    def calibrate_all(self, window: int = 60, min_obs: int = 36, **kwargs) -> Dict[str, pd.DataFrame]:
+        """Rolling and expanding estimates side by side."""
+        return {
+            "rolling": self.calibrate(window=window, min_obs=min_obs, **kwargs),
+            "expanding": self.calibrate(window=None, min_obs=min_obs, **kwargs),
+        }
+
+
+if __name__ == "__main__":
+    calibrator = TaylorRuleCalibrator()
+    coefs = calibrator.calibrate(window=60, n_bootstrap=200)
+    print(coefs.tail(5).to_string())
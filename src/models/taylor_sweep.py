@@ -0,0 +1,166 @@
+# pyright: reportCallIssue=false, reportArgumentType=false, reportReturnType=false, reportAttributeAccessIssue=false, reportGeneralTypeIssues=false
+"""
+Vectorized Taylor Rule Parameter Sweep.
+
+Evaluates the standard / extended / augmented Taylor rule for every
+combination of parameter grids in one NumPy broadcast:
+
+    Taylor[p, t] = r*[p] + pi[t] + alpha[p](pi[t] - pi*[p]) + beta[p] y[t]
+                   + gamma[p] FSI[t] + delta[p] s[p] Tone[t]
+
+followed by the rho smoothing recursion run as an IIR filter per rho value.
+Inputs come from the cached ExtendedTaylorRule inputs stage, so no CSV is
+reloaded per combination.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.taylor_rule import ExtendedTaylorRule
+from src.utils.filters import recursive_filter
+
+PARAM_NAMES = ("alpha", "beta", "r_star", "pi_star", "gamma", "delta", "rho")
+METRIC_NAMES = ("latest_taylor_rate", "latest_gap", "rmse", "directional_accuracy")
+
+
+@dataclass
+class TaylorSweepResult:
+    """Labeled sweep output: Taylor paths (params x dates) plus summary metrics."""
+
+    model_type: str
+    params: pd.DataFrame
+    dates: pd.DatetimeIndex
+    taylor_rates: np.ndarray
+    base_rate: np.ndarray
+    metrics: pd.DataFrame
+
+    @property
+    def gaps(self) -> np.ndarray:
+        """Taylor rate minus actual base rate, shape (n_params, n_dates)."""
+        return self.taylor_rates - self.base_rate[np.newaxis, :]
+
+    def to_frame(self) -> pd.DataFrame:
+        """Parameters joined with summary metrics, one row per combination."""
+        return pd.concat([self.params, self.metrics], axis=1)
+
+    def surface(self, x: str, y: str, metric: str = "latest_gap") -> pd.DataFrame:
+        """2-D sensitivity surface (y rows, x columns), averaging over any other swept parameter."""
+        if metric not in self.metrics.columns:
+            raise ValueError(f"Unknown metric: {metric}")
+        table = self.to_frame()
+        return table.pivot_table(index=y, columns=x, values=metric, aggfunc="mean").sort_index()
+
+
+class TaylorRuleSweep:
+    """Broadcast a Taylor rule variant across parameter grids."""
+
+    def __init__(self, model_type: str = "extended", engine: Optional[ExtendedTaylorRule] = None) -> None:
+        model = model_type.lower().strip()
+        if model not in ("standard", "extended", "augmented"):
+            raise ValueError(f"Unknown model_type: {model_type}")
+        self.model_type = model
+        self.engine = engine or ExtendedTaylorRule()
+
+    def _load_inputs(self) -> pd.DataFrame:
+        if self.model_type == "standard":
+            return self.engine._core_frame()
+        if self.model_type == "extended":
+            return self.engine._extended_frame()
+        return self.engine._augmented_frame()
+
+    def _param_table(self, grid: Mapping[str, Iterable[float]]) -> pd.DataFrame:
+        unknown = set(grid) - set(PARAM_NAMES)
+        if unknown:
+            raise ValueError(f"Unknown sweep parameters: {sorted(unknown)}")
+
+        axes: Dict[str, np.ndarray] = {}
+        for name in PARAM_NAMES:
+            if name in grid:
+                values = np.atleast_1d(np.asarray(list(grid[name]), dtype=float))
+                if values.size == 0:
+                    raise ValueError(f"Empty grid for parameter: {name}")
+            else:
+                values = np.array([float(getattr(self.engine, name))])
+            axes[name] = values
+
+        mesh = np.meshgrid(*axes.values(), indexing="ij")
+        return pd.DataFrame({name: grid_axis.ravel() for name, grid_axis in zip(PARAM_NAMES, mesh)})
+
+    def _tone_sensitivity(self, residual: np.ndarray, tone: np.ndarray) -> np.ndarray:
+        """Row-wise OLS slope of residual on tone, clipped like calculate_augmented."""
+        if len(tone) <= 10:
+            return np.zeros(residual.shape[0])
+        tone_c = tone - tone.mean()
+        ss_tone = float(tone_c @ tone_c)
+        if ss_tone == 0:
+            return np.zeros(residual.shape[0])
+        resid_c = residual - residual.mean(axis=1, keepdims=True)
+        return np.clip((resid_c @ tone_c) / ss_tone, -2.0, 2.0)
+
+    def _metrics(self, taylor: np.ndarray, base: np.ndarray, params: pd.DataFrame) -> pd.DataFrame:
+        errors = taylor - base[np.newaxis, :]
+        prev_base = np.concatenate([base[:1], base[:-1]])
+        actual_dir = np.sign(np.diff(base, prepend=base[0]))
+        expected_dir = np.sign(taylor - prev_base[np.newaxis, :])
+        return pd.DataFrame(
+            {
+                "latest_taylor_rate": taylor[:, -1],
+                "latest_gap": errors[:, -1],
+                "rmse": np.sqrt(np.mean(errors ** 2, axis=1)),
+                "directional_accuracy": np.mean(expected_dir == actual_dir[np.newaxis, :], axis=1),
+            },
+            index=params.index,
+        )
+
+    def run(self, grid: Mapping[str, Iterable[float]]) -> TaylorSweepResult:
+        """Evaluate every combination of the given grids.
+
+        Parameters not in ``grid`` are held at the engine's current values.
+        Directional accuracy compares sign(Taylor[t] - Base[t-1]) with the
+        sign of the actual monthly base-rate change.
+        """
+        params = self._param_table(grid)
+        df = self._load_inputs()
+
+        col = {name: params[name].to_numpy()[:, np.newaxis] for name in PARAM_NAMES}
+        inflation = df["Inflation"].to_numpy(dtype=float)[np.newaxis, :]
+        output_gap = df["Output_Gap"].to_numpy(dtype=float)[np.newaxis, :]
+        base = df["Base_Rate"].to_numpy(dtype=float)
+
+        standard = (
+            col["r_star"]
+            + inflation
+            + col["alpha"] * (inflation - col["pi_star"])
+            + col["beta"] * output_gap
+        )
+
+        if self.model_type == "standard":
+            taylor = standard
+        else:
+            fsi = df["FSI"].to_numpy(dtype=float)[np.newaxis, :]
+            raw = standard + col["gamma"] * fsi
+            if self.model_type == "augmented":
+                tone = df["tone_index"].to_numpy(dtype=float)
+                sensitivity = self._tone_sensitivity(base[np.newaxis, :] - standard, tone)
+                raw = raw + col["delta"] * sensitivity[:, np.newaxis] * tone[np.newaxis, :]
+            taylor = recursive_filter(raw, params["rho"].to_numpy())
+
+        return TaylorSweepResult(
+            model_type=self.model_type,
+            params=params,
+            dates=pd.DatetimeIndex(df["Date"]),
+            taylor_rates=taylor,
+            base_rate=base,
+            metrics=self._metrics(taylor, base, params),
+        )
+
+
+if __name__ == "__main__":
+    sweep = TaylorRuleSweep(model_type="augmented")
+    out = sweep.run({"alpha": np.linspace(0.0, 2.0, 21), "beta": np.linspace(0.0, 2.0, 21), "rho": [0.0, 0.5, 0.8]})
+    print(out.to_frame().sort_values("rmse").head(10).to_string(index=False))
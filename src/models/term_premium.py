@@ -9,43 +9,23 @@ KTB_10Y = E(base_rate_avg) + TermPremium
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 
 import pandas as pd
 
+from src.data.compute_graph import ComputationGraph, get_market_graph
+
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 
 
 class TermPremiumAnalyzer:
-    def __init__(self) -> None:
+    def __init__(self, graph: Optional[ComputationGraph] = None) -> None:
         self.data_dir = PROJECT_ROOT / "data"
-
-    def _load_daily_series(self, relative_csv: str, value_name: str) -> pd.DataFrame:
-        path = self.data_dir / relative_csv
-        df = pd.read_csv(path, usecols=["TIME", "DATA_VALUE"])
-        df["Date"] = pd.to_datetime(df["TIME"].astype(str), format="%Y%m%d", errors="coerce")
-        df[value_name] = pd.to_numeric(df["DATA_VALUE"], errors="coerce")
-        out = df[["Date", value_name]].dropna().sort_values("Date")
-        return out.groupby("Date", as_index=False).last()
-
-    def _to_monthly_last(self, df: pd.DataFrame, value_col: str) -> pd.DataFrame:
-        out = df[["Date", value_col]].copy()
-        out["Date"] = out["Date"].dt.to_period("M").dt.to_timestamp("M")
-        out = out.groupby("Date", as_index=False).last()
-        return out
+        self.graph = graph or get_market_graph(self.data_dir)
 
     def _load_monthly_core(self) -> pd.DataFrame:
-        y3 = self._load_daily_series("08_ecos/bond_yields/ktb_3y.csv", "KTB_3Y")
-        y10 = self._load_daily_series("08_ecos/bond_yields/ktb_10y.csv", "KTB_10Y")
-        base = self._load_daily_series("08_ecos/base_rate/base_rate.csv", "Base_Rate")
-
-        y3_m = self._to_monthly_last(y3, "KTB_3Y")
-        y10_m = self._to_monthly_last(y10, "KTB_10Y")
-        base_m = self._to_monthly_last(base, "Base_Rate")
-
-        merged = y3_m.merge(y10_m, on="Date", how="inner")
-        merged = merged.merge(base_m, on="Date", how="inner")
-        return merged.sort_values("Date").reset_index(drop=True)
+        """Month-end KTB 3Y/10Y and base rate from the shared market graph."""
+        return self.graph.get("rates.monthly")
 
     def calculate_simple(self) -> pd.DataFrame:
         """Simple spread-based term premium (10Y-3Y)."""
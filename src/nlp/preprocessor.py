@@ -6,14 +6,20 @@
 - 섹션 분리 (토의 내용, 의결 문구)
 - 문장 분리
 - 위원별 발언 추출
+
+문장/절/위원 발언 경계는 텍스트 내용 해시별로 한 번 계산해 저장합니다 (sentence_index 참고).
 """
 
 import re
+import json
+import hashlib
 import logging
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from .sentence_index import SentenceIndex, TextBoundaries
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -34,6 +40,16 @@ class ProcessedMinutes:
     cleaned_text: str = ""
 
 
+def _strip_span(text: str, start: int, end: int) -> Tuple[int, int]:
+    """text[start:end].strip()에 해당하는 구간 (공백뿐이면 빈 구간)"""
+    segment = text[start:end]
+    stripped = segment.lstrip()
+    if not stripped:
+        return start, start
+    lead = len(segment) - len(stripped)
+    return start + lead, start + lead + len(stripped.rstrip())
+
+
 class TextPreprocessor:
     """한국은행 의사록 텍스트 전처리기"""
 
@@ -81,15 +97,27 @@ class TextPreprocessor:
 
     SENTENCE_CONNECTORS = ["다만", "그러나", "한편", "또한", "반면"]
 
-    def __init__(self, use_kss: bool = True):
+    # 문장을 앞/뒤 절로 나누는 대조 표현 (앞선 패턴 우선)
+    CONTRAST_PATTERNS = [r"에도\s*불구하고", r"이지만", r"지만", r"이나\s", r"그러나"]
+
+    # 정규식 분리 시 이보다 짧은 문장은 제외
+    MIN_SENTENCE_LENGTH = 10
+
+    def __init__(self, use_kss: bool = True, sentence_index: Optional[SentenceIndex] = None):
         """
         전처리기 초기화
 
         Args:
             use_kss: Korean Sentence Splitter 사용 여부
+            sentence_index: 문장 경계 저장소 (None이면 data/cache/sentences)
         """
         self.use_kss = use_kss
         self._kss = None
+        self.sentence_index = sentence_index or SentenceIndex()
+
+        connector_pattern = '|'.join(self.SENTENCE_CONNECTORS)
+        self._sentence_split = re.compile(rf'(?<=[.?!;])\s+|(?<=다)\s+(?=({connector_pattern}))')
+        self._contrast_patterns = [re.compile(pattern) for pattern in self.CONTRAST_PATTERNS]
 
         if use_kss:
             try:
@@ -172,72 +200,169 @@ class TextPreprocessor:
 
         return discussion.strip(), decision.strip()
 
-    def split_sentences(self, text: str) -> List[str]:
+    @property
+    def boundary_key(self) -> str:
+        """문장 경계 캐시 키 (분리 방식 + 분리 규칙 해시)"""
+        method = "kss" if self.use_kss and self._kss else "regex"
+        rules = json.dumps([
+            self.SENTENCE_CONNECTORS,
+            self.CONTRAST_PATTERNS,
+            self.MEMBER_PATTERN.pattern,
+            self.MIN_SENTENCE_LENGTH,
+        ], ensure_ascii=False)
+        return f"{method}-{hashlib.sha256(rules.encode('utf-8')).hexdigest()[:10]}"
+
+    def boundaries(self, text: str, persist: bool = False) -> TextBoundaries:
         """
-        문장 분리
+        문장/절/위원 발언 경계 (텍스트 내용 해시별로 한 번만 계산)
 
         Args:
             text: 입력 텍스트
+            persist: 디스크 캐시에 저장 (파일 단위 문서만, 임의 문자열은 메모리에만)
 
         Returns:
-            문장 리스트
+            TextBoundaries (오프셋은 text 기준)
         """
+        return self.sentence_index.get(text, self.boundary_key, self.compute_boundaries, persist=persist)
+
+    def compute_boundaries(self, text: str, sha256: str = "") -> TextBoundaries:
+        """캐시 없이 경계 계산"""
+        sentences = None
+        persist = True
         if self.use_kss and self._kss:
             try:
-                sentences = self._kss.split_sentences(text)
-                return [str(s).strip() for s in sentences if str(s).strip()]
+                sentences = self._kss_sentence_spans(text)
             except Exception as e:
                 logger.warning(f"KSS 문장 분리 실패, 기본 분리 사용: {e}")
+                persist = False
+        if sentences is None:
+            sentences = self._regex_sentence_spans(text)
+
+        clauses = []
+        for start, end in sentences:
+            split = self.split_contrast(text[start:end])
+            clauses.append(tuple(start + pos for pos in split) if split else (-1, -1, -1, -1))
+
+        return TextBoundaries.from_spans(
+            sha256,
+            sentences,
+            clauses,
+            self._member_spans(text),
+            persist=persist,
+        )
 
-        # 기본 문장 분리 (마침표, 물음표, 느낌표 + 전환 표현 기준)
-        connector_pattern = '|'.join(self.SENTENCE_CONNECTORS)
-        split_pattern = rf'(?<=[.?!;])\s+|(?<=다)\s+(?=({connector_pattern}))'
-        sentences = re.split(split_pattern, text)
-        # 캡처 그룹으로 들어온 전환 표현 조각 제거
-        connector_set = set(self.SENTENCE_CONNECTORS)
-        sentences = [s for s in sentences if s and s not in connector_set]
-        return [s.strip() for s in sentences if s.strip() and len(s.strip()) > 10]
-
-    def extract_member_opinions(self, text: str) -> List[Dict[str, str]]:
+    def _kss_sentence_spans(self, text: str) -> List[Tuple[int, int]]:
+        """KSS 분리 결과를 원문 위치로 정렬 (공백이 바뀐 문장은 공백 무시 검색)"""
+        spans = []
+        cursor = 0
+        for sentence in self._kss.split_sentences(text):
+            sentence = str(sentence).strip()
+            if not sentence:
+                continue
+            start = text.find(sentence, cursor)
+            if start >= 0:
+                end = start + len(sentence)
+            else:
+                pattern = r'\s*'.join(re.escape(ch) for ch in sentence if not ch.isspace())
+                match = re.compile(pattern).search(text, cursor)
+                if match is None:
+                    logger.debug(f"KSS 문장 위치를 찾지 못함: {sentence[:30]}")
+                    continue
+                start, end = match.span()
+            spans.append((start, end))
+            cursor = end
+        return spans
+
+    def _regex_sentence_spans(self, text: str) -> List[Tuple[int, int]]:
+        """기본 문장 분리 (마침표, 물음표, 느낌표 + 전환 표현 기준)"""
+        spans = []
+        pos = 0
+        for match in self._sentence_split.finditer(text):
+            spans.append(_strip_span(text, pos, match.start()))
+            pos = match.end()
+        spans.append(_strip_span(text, pos, len(text)))
+        return [(start, end) for start, end in spans if end - start > self.MIN_SENTENCE_LENGTH]
+
+    def split_contrast(self, sentence: str) -> Optional[Tuple[int, int, int, int]]:
         """
-        위원별 발언 추출
+        대조 표현 기준 앞/뒤 절 위치
 
         Returns:
-            [{"member": "한 위원", "opinion": "발언 내용"}, ...]
+            (앞 절 시작, 끝, 뒤 절 시작, 끝) 또는 뒤 절이 없으면 None
         """
-        opinions = []
-
-        # 위원 발언 패턴으로 텍스트 분할
-        parts = self.MEMBER_PATTERN.split(text)
-
+        for pattern in self._contrast_patterns:
+            match = pattern.search(sentence)
+            if not match:
+                continue
+            second = _strip_span(sentence, match.end(), len(sentence))
+            if second[0] == second[1]:
+                continue
+            return _strip_span(sentence, 0, match.start()) + second
+        return None
+
+    def _member_spans(self, text: str) -> List[Tuple[int, int, int, int]]:
+        """위원 표현과 바로 뒤 발언 구간 (MEMBER_PATTERN.split 순회와 동일)"""
+        segments = []
+        pos = 0
+        for match in self.MEMBER_PATTERN.finditer(text):
+            segments.append((pos, match.start()))
+            segments.append(match.span(1))
+            pos = match.end()
+        segments.append((pos, len(text)))
+
+        spans = []
         current_member = None
-        for i, part in enumerate(parts):
-            part = part.strip()
-            if not part:
+        for start, end in segments:
+            start, end = _strip_span(text, start, end)
+            if start == end:
                 continue
-
             # 위원 패턴에 매치되면 다음 부분이 해당 위원의 발언
-            if self.MEMBER_PATTERN.match(part):
-                current_member = part
+            if self.MEMBER_PATTERN.match(text[start:end]):
+                current_member = (start, end)
             elif current_member:
-                # 발언 내용 정제
-                opinion_text = self.normalize_text(part)
-                if len(opinion_text) > 20:  # 너무 짧은 발언 제외
-                    opinions.append({
-                        "member": current_member,
-                        "opinion": opinion_text
-                    })
+                spans.append(current_member + (start, end))
                 current_member = None
+        return spans
+
+    def split_sentences(self, text: str, persist: bool = False) -> List[str]:
+        """
+        문장 분리
+
+        Args:
+            text: 입력 텍스트
+            persist: 문장 경계를 디스크 캐시에 저장 (파일 단위 문서만)
+
+        Returns:
+            문장 리스트
+        """
+        return self.boundaries(text, persist).sentence_texts(text)
+
+    def extract_member_opinions(self, text: str, persist: bool = False) -> List[Dict[str, str]]:
+        """
+        위원별 발언 추출
 
+        Returns:
+            [{"member": "한 위원", "opinion": "발언 내용"}, ...]
+        """
+        opinions = []
+        for member, part in self.boundaries(text, persist).member_texts(text):
+            # 발언 내용 정제
+            opinion_text = self.normalize_text(part)
+            if len(opinion_text) > 20:  # 너무 짧은 발언 제외
+                opinions.append({
+                    "member": member,
+                    "opinion": opinion_text
+                })
         return opinions
 
-    def process(self, text: str, meeting_date: str = "") -> ProcessedMinutes:
+    def process(self, text: str, meeting_date: str = "", persist: bool = False) -> ProcessedMinutes:
         """
         의사록 텍스트 전처리 수행
 
         Args:
             text: 원본 의사록 텍스트
             meeting_date: 회의 날짜 (YYYY_MM_DD 형식)
+            persist: 토의 내용의 문장 경계를 디스크 캐시에 저장 (파일 단위 문서만)
 
         Returns:
             ProcessedMinutes 객체
@@ -260,11 +385,11 @@ class TextPreprocessor:
 
         # 4. 문장 분리 (토의 내용 기준)
         if discussion:
-            result.sentences = self.split_sentences(discussion)
+            result.sentences = self.split_sentences(discussion, persist)
 
         # 5. 위원별 발언 추출
         if discussion:
-            result.member_opinions = self.extract_member_opinions(discussion)
+            result.member_opinions = self.extract_member_opinions(discussion, persist)
 
         # 6. 전처리된 텍스트 저장
         result.cleaned_text = cleaned
@@ -294,7 +419,7 @@ class TextPreprocessor:
             # 파일명에서 날짜 추출 (예: minutes_2024_01_11.txt)
             meeting_date = filepath.stem.replace("minutes_", "")
 
-            return self.process(text, meeting_date)
+            return self.process(text, meeting_date, persist=True)
 
         except Exception as e:
             logger.error(f"파일 처리 실패 [{filepath}]: {e}")
@@ -0,0 +1,213 @@
+"""
+문장/절 경계 오프셋 캐시
+
+TextPreprocessor.split_sentences가 분석을 돌릴 때마다 문서를 KSS(또는 정규식)로
+다시 분리하고 결과를 버리던 비용을 없애기 위해, 텍스트 내용 해시(SHA-256)와
+분리 설정별로 한 번 계산한 경계를 int32 오프셋 배열(.npz)로 저장합니다.
+
+저장 내용 (모든 오프셋은 입력 텍스트 내 문자 위치, [시작, 끝)):
+- sentences: 문장 구간 [N, 2]
+- clauses: 문장별 대조 표현 기준 앞/뒤 절 구간 [N, 4] (대조 표현이 없으면 -1)
+- members: 위원 표현/발언 구간 [M, 4]
+
+텍스트 자체는 저장하지 않으므로 조회 시 같은 텍스트를 넘겨 잘라 씁니다.
+디스크에는 파일 단위 문서(persist=True로 조회한 텍스트)만 저장하고,
+임의 문자열은 프로세스 메모리(LRU)에만 둡니다.
+"""
+
+import hashlib
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+from src.utils.cache_io import atomic_write
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+CACHE_DIR = PROJECT_ROOT / "data" / "cache" / "sentences"
+CACHE_VERSION = 1
+
+
+def text_sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _spans(rows: List[Tuple[int, ...]], width: int) -> np.ndarray:
+    return np.asarray(rows, dtype=np.int32).reshape(-1, width)
+
+
+@dataclass
+class TextBoundaries:
+    """한 텍스트의 문장/절/위원 발언 경계"""
+
+    sha256: str
+    sentences: np.ndarray  # int32 [N, 2]
+    clauses: np.ndarray  # int32 [N, 4]: 앞 절 시작/끝, 뒤 절 시작/끝 (분리 없으면 -1)
+    members: np.ndarray  # int32 [M, 4]: 위원 표현 시작/끝, 발언 시작/끝
+    persist: bool = True  # False면 디스크에 저장하지 않음 (예: KSS 실패로 정규식 대체)
+
+    @classmethod
+    def from_spans(
+        cls,
+        sha256: str,
+        sentences: List[Tuple[int, int]],
+        clauses: List[Tuple[int, int, int, int]],
+        members: List[Tuple[int, int, int, int]],
+        persist: bool = True,
+    ) -> "TextBoundaries":
+        return cls(
+            sha256=sha256,
+            sentences=_spans(sentences, 2),
+            clauses=_spans(clauses, 4),
+            members=_spans(members, 4),
+            persist=persist,
+        )
+
+    @property
+    def n_sentences(self) -> int:
+        return len(self.sentences)
+
+    def sentence_texts(self, text: str) -> List[str]:
+        return [text[start:end] for start, end in self.sentences.tolist()]
+
+    def clause_texts(self, text: str) -> List[Optional[Tuple[str, str]]]:
+        """문장별 (앞 절, 뒤 절) 또는 대조 표현이 없으면 None"""
+        return [
+            (text[a:b], text[c:d]) if a >= 0 else None
+            for a, b, c, d in self.clauses.tolist()
+        ]
+
+    def member_texts(self, text: str) -> List[Tuple[str, str]]:
+        """(위원 표현, 발언 원문) 목록"""
+        return [(text[a:b], text[c:d]) for a, b, c, d in self.members.tolist()]
+
+    def sentence_at(self, offset: int) -> int:
+        """offset을 포함하거나 그 뒤에 오는 첫 문장 번호 (없으면 문장 수)"""
+        return int(np.searchsorted(self.sentences[:, 1], offset, side="right"))
+
+    # ------------------------------------------------------------------
+    # 저장 / 로드
+    # ------------------------------------------------------------------
+
+    def save(self, path: Path) -> None:
+        with atomic_write(path) as f:
+            np.savez(
+                f,
+                version=np.int32(CACHE_VERSION),
+                sentences=self.sentences,
+                clauses=self.clauses,
+                members=self.members,
+            )
+
+    @classmethod
+    def load(cls, path: Path, sha256: str) -> Optional["TextBoundaries"]:
+        try:
+            with np.load(path) as data:
+                if int(data["version"]) != CACHE_VERSION:
+                    return None
+                return cls(
+                    sha256=sha256,
+                    sentences=data["sentences"],
+                    clauses=data["clauses"],
+                    members=data["members"],
+                )
+        except (OSError, KeyError, ValueError) as exc:
+            logger.warning(f"문장 경계 캐시를 읽을 수 없어 다시 계산합니다 ({path.name}): {exc}")
+            return None
+
+
+class SentenceIndex:
+    """내용 해시 + 분리 설정 키 기준 문장 경계 저장소 (메모리 → 디스크 → 계산)"""
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_memory: int = 256, use_disk: bool = True):
+        """
+        Args:
+            cache_dir: .npz 저장 위치 (None이면 data/cache/sentences)
+            max_memory: 프로세스 내에 유지할 최대 문서 수
+            use_disk: False면 디스크를 읽지도 쓰지도 않음 (메모리 전용)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else CACHE_DIR
+        self.max_memory = max_memory
+        self.use_disk = use_disk
+        self._memory: "OrderedDict[Tuple[str, str], TextBoundaries]" = OrderedDict()
+
+    def path_for(self, sha256: str, key: str) -> Path:
+        return self.cache_dir / sha256[:2] / f"{sha256}.{key}.npz"
+
+    def get(
+        self,
+        text: str,
+        key: str,
+        compute: Callable[[str, str], TextBoundaries],
+        persist: bool = False,
+    ) -> TextBoundaries:
+        """
+        텍스트의 경계 조회 (없으면 compute(text, sha256)로 계산)
+
+        Args:
+            text: 입력 텍스트
+            key: 분리 설정 키 (분리 방식/규칙이 바뀌면 달라져야 함)
+            compute: 경계 계산 함수
+            persist: 계산 결과를 디스크에 저장 (파일 단위 문서에만 사용)
+        """
+        sha256 = text_sha256(text)
+        memory_key = (sha256, key)
+        path = self.path_for(sha256, key)
+        on_disk = False
+        boundaries = self._memory.get(memory_key)
+        if boundaries is not None:
+            self._memory.move_to_end(memory_key)
+        else:
+            if self.use_disk and path.exists():
+                boundaries = TextBoundaries.load(path, sha256)
+                on_disk = boundaries is not None
+            if boundaries is None:
+                boundaries = compute(text, sha256)
+            self._memory[memory_key] = boundaries
+            while len(self._memory) > self.max_memory:
+                self._memory.popitem(last=False)
+
+        # 메모리에만 있던 텍스트라도 파일 단위 문서로 다시 조회되면 저장
+        if persist and self.use_disk and boundaries.persist and not on_disk and not path.exists():
+            try:
+                boundaries.save(path)
+            except OSError as exc:
+                logger.warning(f"문장 경계 캐시 저장 실패 ({path.name}): {exc}")
+        return boundaries
+
+
+def main():
+    """텍스트 디렉토리 전체의 문장 경계를 미리 계산 (KSS 비용을 문서당 한 번만 지불)"""
+    import argparse
+    import time
+
+    from src.nlp.preprocessor import TextPreprocessor
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    parser = argparse.ArgumentParser(description="문장/절 경계 캐시 생성")
+    parser.add_argument("paths", nargs="*", type=Path, help="텍스트 파일 또는 디렉토리 (기본 data/texts)")
+    parser.add_argument("--kss", action="store_true", help="KSS로 문장 분리")
+    parser.add_argument("--cache-dir", type=Path, default=None, help="경계 캐시 위치 (기본 data/cache/sentences)")
+    args = parser.parse_args()
+
+    preprocessor = TextPreprocessor(use_kss=args.kss, sentence_index=SentenceIndex(args.cache_dir))
+    files: List[Path] = []
+    for path in args.paths or [PROJECT_ROOT / "data" / "texts"]:
+        files.extend(sorted(path.rglob("*.txt")) if path.is_dir() else [path])
+
+    started = time.perf_counter()
+    n_sentences = 0
+    for path in files:
+        text = path.read_text(encoding="utf-8", errors="ignore")
+        n_sentences += preprocessor.boundaries(text, persist=True).n_sentences
+    elapsed = time.perf_counter() - started
+    print(f"{len(files)}개 파일, 문장 {n_sentences:,}개 ({preprocessor.boundary_key}, {elapsed:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
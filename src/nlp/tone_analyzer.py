@@ -79,7 +79,7 @@ class ToneAnalyzer:
         "부분적", "일시적", "가능성", "여지"
     ]
 
-    CONTRAST_PATTERNS = [r"에도\s*불구하고", r"이지만", r"지만", r"이나\s", r"그러나"]
+    CONTRAST_PATTERNS = TextPreprocessor.CONTRAST_PATTERNS
     POLICY_INTENT_PATTERNS = [r"할\s*필요", r"필요가\s*있", r"당부", r"대응해야", r"검토"]
 
     def __init__(
@@ -189,22 +189,20 @@ class ToneAnalyzer:
 
         return hawkish_score, dovish_score
 
-    def _score_sentence_with_contrast(self, sentence: str) -> Tuple[float, float]:
-        for pattern in self.CONTRAST_PATTERNS:
-            match = re.search(pattern, sentence)
-            if not match:
-                continue
-
-            first_clause = sentence[:match.start()].strip()
-            second_clause = sentence[match.end():].strip()
-            if not second_clause:
-                continue
+    def _score_clauses(self, sentence: str, clauses: Optional[Tuple[str, str]]) -> Tuple[float, float]:
+        """대조 표현이 있으면 앞 절 0.7, 뒤 절 1.3 가중"""
+        if clauses is None:
+            return self._score_sentence_context(sentence)
 
-            first_h, first_d = self._score_sentence_context(first_clause)
-            second_h, second_d = self._score_sentence_context(second_clause)
-            return (0.7 * first_h + 1.3 * second_h, 0.7 * first_d + 1.3 * second_d)
+        first_clause, second_clause = clauses
+        first_h, first_d = self._score_sentence_context(first_clause)
+        second_h, second_d = self._score_sentence_context(second_clause)
+        return (0.7 * first_h + 1.3 * second_h, 0.7 * first_d + 1.3 * second_d)
 
-        return self._score_sentence_context(sentence)
+    def _score_sentence_with_contrast(self, sentence: str) -> Tuple[float, float]:
+        split = self.preprocessor.split_contrast(sentence)
+        clauses = (sentence[split[0]:split[1]], sentence[split[2]:split[3]]) if split else None
+        return self._score_clauses(sentence, clauses)
 
     def _score_policy_intent(self, sentence: str, h_score: float, d_score: float) -> float:
         if not self._has_pattern(sentence, self.POLICY_INTENT_PATTERNS):
@@ -216,13 +214,37 @@ class ToneAnalyzer:
 
         return self.calculate_tone_index(h_score * intent_multiplier, d_score * intent_multiplier)
 
-    def analyze_text(self, text: str, meeting_date: str = "") -> ToneResult:
+    def score_sentences(self, text: str, persist: bool = False) -> List[Tuple[str, float, float]]:
+        """
+        문장별 문맥 조정 점수
+
+        문장/절 경계는 전처리기의 경계 캐시를 재사용합니다.
+
+        Args:
+            text: 분석할 텍스트
+            persist: 문장 경계를 디스크 캐시에 저장 (파일 단위 문서만)
+
+        Returns:
+            [(문장, 매파 점수, 비둘기파 점수), ...]
+        """
+        boundaries = self.preprocessor.boundaries(text, persist)
+        scored = []
+        for sentence, clauses in zip(boundaries.sentence_texts(text), boundaries.clause_texts(text)):
+            h_score, d_score = self._score_clauses(sentence, clauses)
+            if re.search(r"할\s*필요", sentence):
+                h_score *= 1.5
+                d_score *= 1.5
+            scored.append((sentence, h_score, d_score))
+        return scored
+
+    def analyze_text(self, text: str, meeting_date: str = "", persist: bool = False) -> ToneResult:
         """
         텍스트의 톤 분석
 
         Args:
             text: 분석할 텍스트
             meeting_date: 회의 날짜
+            persist: 문장 경계를 디스크 캐시에 저장 (파일 단위 문서만)
 
         Returns:
             ToneResult 객체
@@ -243,18 +265,13 @@ class ToneAnalyzer:
         ngram_tone = self.calculate_tone_index(ngram_hawkish, ngram_dovish)
 
         # 3) 문장 단위 문맥 조정 톤 + 정책 의도 톤
-        sentences = self.preprocessor.split_sentences(text)
+        scored_sentences = self.score_sentences(text, persist)
         sentence_tones: List[float] = []
         context_h_total = 0.0
         context_d_total = 0.0
         policy_intent_values: List[float] = []
 
-        for sentence in sentences:
-            h_score, d_score = self._score_sentence_with_contrast(sentence)
-            if re.search(r"할\s*필요", sentence):
-                h_score *= 1.5
-                d_score *= 1.5
-
+        for sentence, h_score, d_score in scored_sentences:
             if h_score > 0 or d_score > 0:
                 sent_tone = self.calculate_tone_index(h_score, d_score)
                 sentence_tones.append(sent_tone)
@@ -285,7 +302,7 @@ class ToneAnalyzer:
             hawkish_terms=hawkish_terms,
             dovish_terms=dovish_terms,
             sentence_tones=sentence_tones,
-            total_sentences=len(sentences),
+            total_sentences=len(scored_sentences),
             interpretation=self.interpret_tone(tone_index),
             policy_intent_tone=policy_intent_tone,
             raw_keyword_tone=raw_keyword_tone,
@@ -322,7 +339,7 @@ class ToneAnalyzer:
                 text = f.read()
 
             meeting_date = filepath.stem.replace("minutes_", "")
-            return self.analyze_text(text, meeting_date)
+            return self.analyze_text(text, meeting_date, persist=True)
 
         except Exception as e:
             logger.error(f"파일 분석 실패 [{filepath}]: {e}")
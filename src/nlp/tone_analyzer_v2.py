@@ -93,6 +93,9 @@ class EnhancedToneAnalyzer(ToneAnalyzer):
         self.beta = beta
         self.gamma = gamma
 
+        # 일괄 계산된 시장 반응 점수 (회의 날짜 YYYY-MM-DD -> 점수)
+        self._market_reactions: Dict[str, float] = {}
+
         # 데이터베이스에서 가중치 로드 (있으면)
         params = self.db.get_model_parameters()
         if 'alpha' in params:
@@ -121,12 +124,15 @@ class EnhancedToneAnalyzer(ToneAnalyzer):
         meeting_date_std = meeting_date.replace('_', '-')
 
         try:
-            # ECOS 커넥터를 통해 시장 반응 계산
-            market_reaction = self.ecos.calculate_market_reaction(
-                meeting_date_std,
-                days_before=5,
-                days_after=10
-            )
+            # 일괄 계산된 값이 있으면 사용, 없으면 ECOS 커넥터를 통해 계산
+            if meeting_date_std in self._market_reactions:
+                market_reaction = self._market_reactions[meeting_date_std]
+            else:
+                market_reaction = self.ecos.calculate_market_reaction(
+                    meeting_date_std,
+                    days_before=5,
+                    days_after=10
+                )
 
             details = {
                 'meeting_date': meeting_date_std,
@@ -268,8 +274,17 @@ class EnhancedToneAnalyzer(ToneAnalyzer):
             EnhancedToneResult 리스트
         """
         results = []
+        filepaths = sorted(dir_path.glob("*.txt"))
+
+        # 시장 반응은 전체 회의에 대해 한 번에 계산 (지표별 DB 조회 1회)
+        meeting_dates = [fp.stem.replace("minutes_", "").replace('_', '-') for fp in filepaths]
+        try:
+            scores = self.ecos.calculate_market_reaction_batch(meeting_dates, days_before=5, days_after=10)
+            self._market_reactions.update({date: float(score) for date, score in scores.items()})
+        except Exception as e:
+            logger.warning(f"시장 반응 일괄 계산 실패: {e}")
 
-        for filepath in sorted(dir_path.glob("*.txt")):
+        for filepath in filepaths:
             try:
                 with open(filepath, 'r', encoding='utf-8') as f:
                     text = f.read()
@@ -10,14 +10,21 @@ Models:
 Where:
 - FSI = Financial Stability Index (credit gap, FX deviation, yield spread)
 - ToneAdj = Tone-based policy adjustment from NLP analysis
+
+Computation is split into two stages:
+- Inputs stage (core frame, output gap, FSI components, monthly tone) depends
+  only on the CSV data and is cached per data version.
+- Policy rule stage applies alpha/beta/r*/pi*/gamma/delta/rho to the cached
+  inputs and is cheap enough to rerun on every slider move.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional, Sequence, Tuple
 import logging
+import threading
 
 import warnings
 
@@ -25,11 +32,52 @@ import numpy as np
 import pandas as pd
 import statsmodels.api as sm
 
+from src.data.compute_graph import ComputationGraph, get_market_graph
+from src.utils.cache_io import stat_signature
+from src.utils.filters import recursive_filter
+
 warnings.filterwarnings("ignore", message="divide by zero", category=RuntimeWarning)
 
 logger = logging.getLogger(__name__)
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
+CORE_INPUT_FILES = (
+    "08_ecos/base_rate/base_rate.csv",
+    "08_ecos/cpi/cpi_total.csv",
+    "08_ecos/gdp/gdp_real.csv",
+)
+FSI_INPUT_FILES = (
+    "08_ecos/household_debt/household_credit.csv",
+    "08_ecos/gdp/gdp_real.csv",
+    "08_ecos/exchange_rates/usd_krw.csv",
+    "08_ecos/bond_yields/ktb_3y.csv",
+    "08_ecos/bond_yields/ktb_10y.csv",
+)
+TONE_INPUT_FILES = ("analysis/tone_index_results.csv",)
+
+FSI_WEIGHTS = {
+    "Credit_Component": 0.35,
+    "FX_Component": 0.25,
+    "FX_Volatility_Component": 0.15,
+    "Spread_Component": 0.25,
+}
+FSI_RAW_COLUMNS = {
+    "Credit_Component": "Credit_Gap",
+    "FX_Component": "FX_Deviation",
+    "FX_Volatility_Component": "FX_Volatility",
+    "Spread_Component": "Spread_Risk",
+}
+
+# Parameter-independent inputs keyed by (stage, data_dir, hp_method, data version).
+_INPUT_CACHE: Dict[Tuple, pd.DataFrame] = {}
+_INPUT_CACHE_LOCK = threading.Lock()
+
+
+def clear_input_cache() -> None:
+    """Drop all cached Taylor rule inputs (forces reload from CSV)."""
+    with _INPUT_CACHE_LOCK:
+        _INPUT_CACHE.clear()
+
 
 @dataclass
 class TaylorRuleResult:
@@ -45,6 +93,20 @@ class TaylorRuleResult:
     tone_details: Optional[Dict[str, float]]
 
 
+@dataclass
+class TaylorRuleInputs:
+    """Explicit inputs for the policy rule stage (defaults to cached full-sample data).
+
+    fit_until limits the tone-sensitivity regression sample to dates on or
+    before it, so out-of-sample periods do not leak into the estimate.
+    """
+
+    core: pd.DataFrame
+    fsi: Optional[pd.DataFrame] = None
+    tone: Optional[pd.DataFrame] = None
+    fit_until: Optional[pd.Timestamp] = None
+
+
 class ExtendedTaylorRule:
     """Extended Taylor Rule calculator with local CSV data support."""
 
@@ -57,6 +119,8 @@ class ExtendedTaylorRule:
         gamma: float = 0.3,
         delta: float = 0.2,
         rho: float = 0.8,
+        hp_method: str = "kalman",
+        graph: Optional[ComputationGraph] = None,
     ) -> None:
         self.alpha = alpha
         self.beta = beta
@@ -65,7 +129,9 @@ class ExtendedTaylorRule:
         self.gamma = gamma
         self.delta = delta
         self.rho = rho
+        self.hp_method = hp_method
         self.data_dir = PROJECT_ROOT / "data"
+        self.graph = graph or get_market_graph(self.data_dir)
 
     def _csv_path(self, relative_path: str) -> Path:
         csv_file = self.data_dir / relative_path
@@ -84,6 +150,48 @@ class ExtendedTaylorRule:
             return periods.to_timestamp(how="end").normalize()
         raise ValueError(f"Unsupported frequency: {frequency}")
 
+    def _data_version(self, relative_paths: Sequence[str]) -> Tuple:
+        """File signature (mtime, size) of the CSVs feeding an input stage."""
+        signature = []
+        for relative_path in relative_paths:
+            signature.append((relative_path, *stat_signature(self._csv_path(relative_path))))
+        return tuple(signature)
+
+    def _cached_input(
+        self,
+        stage: str,
+        relative_paths: Sequence[str],
+        builder: Callable[[], pd.DataFrame],
+    ) -> pd.DataFrame:
+        """Return a copy of a parameter-independent input, building it once per data version."""
+        scope = (stage, str(self.data_dir), self.hp_method.lower().strip())
+        key = scope + (self._data_version(relative_paths),)
+        with _INPUT_CACHE_LOCK:
+            cached = _INPUT_CACHE.get(key)
+        if cached is None:
+            cached = builder()
+            with _INPUT_CACHE_LOCK:
+                for stale in [k for k in _INPUT_CACHE if k[:3] == scope]:
+                    del _INPUT_CACHE[stale]
+                _INPUT_CACHE[key] = cached
+        return cached.copy()
+
+    def load_core_inputs(self) -> pd.DataFrame:
+        """Monthly base rate, CPI, inflation and output gap (cached)."""
+        return self._cached_input("core", CORE_INPUT_FILES, self._build_core_dataframe)
+
+    def load_fsi_raw_inputs(self) -> pd.DataFrame:
+        """Monthly raw FSI measures before normalization (cached)."""
+        return self._cached_input("fsi_raw", FSI_INPUT_FILES, self._calculate_fsi_raw)
+
+    def load_fsi_inputs(self) -> pd.DataFrame:
+        """Monthly FSI and its normalized components (cached)."""
+        return self._cached_input("fsi", FSI_INPUT_FILES, lambda: self._fsi_from_raw(self.load_fsi_raw_inputs()))
+
+    def load_tone_inputs(self) -> pd.DataFrame:
+        """Monthly mean tone index (cached)."""
+        return self._cached_input("tone", TONE_INPUT_FILES, self._load_tone_data)
+
     def _load_csv(self, csv_path: str, frequency: str, value_name: str = "Value") -> pd.DataFrame:
         """Load ECOS CSV to [Date, value_name] DataFrame."""
         path = self._csv_path(csv_path)
@@ -98,12 +206,6 @@ class ExtendedTaylorRule:
         out = out.groupby("Date", as_index=False).last()
         return out
 
-    def _to_monthly_last(self, df: pd.DataFrame, value_col: str) -> pd.DataFrame:
-        out = df[["Date", value_col]].copy()
-        out["Date"] = out["Date"].dt.to_period("M").dt.to_timestamp("M")
-        out = out.groupby("Date", as_index=False).last()
-        return out
-
     def _to_monthly_mean(self, df: pd.DataFrame, value_col: str) -> pd.DataFrame:
         out = df[["Date", value_col]].copy()
         out["Date"] = out["Date"].dt.to_period("M").dt.to_timestamp("M")
@@ -115,8 +217,9 @@ class ExtendedTaylorRule:
         out = out.set_index("Date").resample("ME").ffill().reset_index()
         return out
 
-    def _normalize_tanh(self, series: pd.Series) -> pd.Series:
-        sigma = series.std(ddof=0)
+    def _normalize_tanh(self, series: pd.Series, sigma: Optional[float] = None) -> pd.Series:
+        if sigma is None:
+            sigma = series.std(ddof=0)
         if sigma is None or np.isnan(sigma) or sigma == 0:
             return pd.Series(0.0, index=series.index)
         return np.tanh(series / sigma)
@@ -132,7 +235,56 @@ class ExtendedTaylorRule:
             raise ValueError("No overlapping period among required datasets")
         return pd.DataFrame({"Date": pd.date_range(start=start_date, end=end_date, freq="ME")})
 
-    def _one_sided_hp_filter(
+    def _one_sided_hp_filter(self, series: pd.Series, lamb: float) -> pd.Series:
+        """One-sided (real-time) HP filter cycle using the configured method."""
+        method = self.hp_method.lower().strip()
+        if method == "kalman":
+            return self._one_sided_hp_filter_kalman(series, lamb=lamb)
+        if method == "ar_extension":
+            return self._one_sided_hp_filter_ar(series, lamb=lamb)
+        raise ValueError(f"Unknown hp_method: {self.hp_method}")
+
+    def _one_sided_hp_filter_kalman(self, series: pd.Series, lamb: float) -> pd.Series:
+        """Exact one-sided HP filter via a single forward Kalman filter pass.
+
+        State-space form of the HP trend (cycle variance normalised to 1):
+            y_t = tau_t + c_t,                         Var(c_t) = 1
+            tau_t = 2 tau_{t-1} - tau_{t-2} + e_t,     Var(e_t) = 1 / lamb
+        The filtered trend E[tau_t | y_1..y_t] is the one-sided HP trend.
+        Missing observations only run the prediction step.
+        """
+        values = pd.to_numeric(series, errors="coerce").astype(float).to_numpy()
+        n = len(values)
+        cycles = np.full(n, np.nan, dtype=float)
+        finite = np.flatnonzero(np.isfinite(values))
+        if len(finite) < 3:
+            cycles[finite] = 0.0
+            return pd.Series(cycles, index=series.index)
+
+        y0, y1 = values[finite[0]], values[finite[1]]
+        transition = np.array([[2.0, -1.0], [1.0, 0.0]])
+        q = 1.0 / float(lamb)
+        # Back-cast the state so the first two predictions reproduce y0 and y1.
+        state = np.array([2.0 * y0 - y1, 3.0 * y0 - 2.0 * y1])
+        cov = np.eye(2) * 1e5
+
+        for t in range(finite[0], n):
+            state = transition @ state
+            cov = transition @ cov @ transition.T
+            cov[0, 0] += q
+
+            y_t = values[t]
+            if not np.isfinite(y_t):
+                continue
+            innovation_var = cov[0, 0] + 1.0
+            gain = cov[:, 0] / innovation_var
+            state = state + gain * (y_t - state[0])
+            cov = cov - np.outer(gain, cov[0, :])
+            cycles[t] = y_t - state[0]
+
+        return pd.Series(cycles, index=series.index)
+
+    def _one_sided_hp_filter_ar(
         self,
         series: pd.Series,
         lamb: float,
@@ -202,11 +354,10 @@ class ExtendedTaylorRule:
         return tone_monthly
 
     def _build_core_dataframe(self) -> pd.DataFrame:
-        base_daily = self._load_csv("08_ecos/base_rate/base_rate.csv", "daily", "Base_Rate")
         cpi_monthly = self._load_csv("08_ecos/cpi/cpi_total.csv", "monthly", "CPI")
         gdp_quarterly = self._load_csv("08_ecos/gdp/gdp_real.csv", "quarterly", "GDP_Real")
 
-        base_monthly = self._to_monthly_last(base_daily, "Base_Rate")
+        base_monthly = self.graph.get("base_rate.monthly_last")
         inflation_df = self._calculate_inflation(cpi_monthly)
         output_gap_quarterly = self._calculate_output_gap(gdp_quarterly)
         output_gap_monthly = self._quarterly_to_monthly_ffill(output_gap_quarterly, "Output_Gap")
@@ -221,7 +372,6 @@ class ExtendedTaylorRule:
         merged[["Base_Rate", "CPI", "Inflation", "Output_Gap"]] = merged[
             ["Base_Rate", "CPI", "Inflation", "Output_Gap"]
         ].ffill()
-        merged["Inflation_Gap"] = merged["Inflation"] - self.pi_star
         return merged.dropna(subset=["Base_Rate", "CPI", "Inflation", "Output_Gap"]).reset_index(drop=True)
 
     def _build_result(
@@ -255,8 +405,8 @@ class ExtendedTaylorRule:
             tone_details=tone_details,
         )
 
-    def _calculate_fsi(self) -> pd.DataFrame:
-        """Calculate Financial Stability Index and components."""
+    def _calculate_fsi_raw(self) -> pd.DataFrame:
+        """Monthly raw FSI measures (credit gap, FX deviation/volatility, spread risk)."""
         credit_q = self._load_csv(
             "08_ecos/household_debt/household_credit.csv",
             "quarterly",
@@ -264,8 +414,8 @@ class ExtendedTaylorRule:
         )
         gdp_q = self._load_csv("08_ecos/gdp/gdp_real.csv", "quarterly", "GDP_Real")
         fx_d = self._load_csv("08_ecos/exchange_rates/usd_krw.csv", "daily", "USD_KRW")
-        y3_d = self._load_csv("08_ecos/bond_yields/ktb_3y.csv", "daily", "KTB_3Y")
-        y10_d = self._load_csv("08_ecos/bond_yields/ktb_10y.csv", "daily", "KTB_10Y")
+        y3_d = self.graph.get("ktb_3y.daily")
+        y10_d = self.graph.get("ktb_10y.daily")
 
         credit = credit_q.merge(gdp_q, on="Date", how="inner").dropna().copy()
         credit["Credit_to_GDP"] = (credit["Household_Credit"] / credit["GDP_Real"]) * 100.0
@@ -295,72 +445,65 @@ class ExtendedTaylorRule:
         fsi[["Credit_Gap", "FX_Deviation", "FX_Volatility", "Spread_Risk"]] = fsi[
             ["Credit_Gap", "FX_Deviation", "FX_Volatility", "Spread_Risk"]
         ].ffill()
-        fsi = fsi.dropna(subset=["Credit_Gap", "FX_Deviation", "FX_Volatility", "Spread_Risk"]).reset_index(drop=True)
-
-        fsi["Credit_Component"] = self._normalize_tanh(fsi["Credit_Gap"])
-        fsi["FX_Component"] = self._normalize_tanh(fsi["FX_Deviation"])
-        fsi["FX_Volatility_Component"] = self._normalize_tanh(fsi["FX_Volatility"])
-        fsi["Spread_Component"] = self._normalize_tanh(fsi["Spread_Risk"])
-
-        fsi["FSI"] = (
-            0.35 * fsi["Credit_Component"]
-            + 0.25 * fsi["FX_Component"]
-            + 0.15 * fsi["FX_Volatility_Component"]
-            + 0.25 * fsi["Spread_Component"]
-        )
+        return fsi.dropna(subset=["Credit_Gap", "FX_Deviation", "FX_Volatility", "Spread_Risk"]).reset_index(drop=True)
+
+    def _fsi_from_raw(self, raw: pd.DataFrame, scales: Optional[Dict[str, float]] = None) -> pd.DataFrame:
+        """Normalize raw FSI measures with tanh(x / sigma) and aggregate.
+
+        ``scales`` maps raw column -> sigma; by default sigma is the full-sample
+        standard deviation. Walk-forward backtests pass scales estimated on
+        data available at the fold origin.
+        """
+        fsi = raw.copy()
+        for component, raw_col in FSI_RAW_COLUMNS.items():
+            sigma = None if scales is None else scales.get(raw_col)
+            fsi[component] = self._normalize_tanh(fsi[raw_col], sigma=sigma)
+        fsi["FSI"] = sum(weight * fsi[component] for component, weight in FSI_WEIGHTS.items())
         return fsi
-    def calculate_standard(self) -> TaylorRuleResult:
-        """Standard Taylor Rule: i = r* + pi + alpha(pi-pi*) + beta(y)."""
-        df = self._build_core_dataframe()
-        df["Taylor_Rate"] = (
+
+    def _calculate_fsi(self) -> pd.DataFrame:
+        """Calculate Financial Stability Index and components."""
+        return self._fsi_from_raw(self._calculate_fsi_raw())
+
+    def _standard_rate(self, df: pd.DataFrame) -> pd.Series:
+        return (
             self.r_star
             + df["Inflation"]
             + (self.alpha * df["Inflation_Gap"])
             + (self.beta * df["Output_Gap"])
         )
 
-        ordered = df[
-            [
-                "Date",
-                "Base_Rate",
-                "CPI",
-                "Inflation",
-                "Output_Gap",
-                "Inflation_Gap",
-                "Taylor_Rate",
-            ]
-        ].copy()
-        return self._build_result(ordered, "standard")
+    def _smooth(self, series: pd.Series) -> np.ndarray:
+        return recursive_filter(series.to_numpy(dtype=float), self.rho)
 
-    def calculate_extended(self) -> TaylorRuleResult:
-        """Extended Taylor Rule with financial stability term."""
-        core = self._build_core_dataframe()
-        fsi = self._calculate_fsi()
+    def _core_frame(self, inputs: Optional[TaylorRuleInputs] = None) -> pd.DataFrame:
+        df = self.load_core_inputs() if inputs is None else inputs.core.copy()
+        df["Inflation_Gap"] = df["Inflation"] - self.pi_star
+        return df
 
-        df = core.merge(fsi, on="Date", how="left")
+    def _extended_frame(self, inputs: Optional[TaylorRuleInputs] = None) -> pd.DataFrame:
+        """Core inputs joined with FSI plus the standard rate (no gamma/rho applied)."""
+        fsi = inputs.fsi if inputs is not None and inputs.fsi is not None else self.load_fsi_inputs()
+        df = self._core_frame(inputs).merge(fsi, on="Date", how="left")
         df["FSI"] = df["FSI"].ffill()
         df = df.dropna(subset=["FSI"]).reset_index(drop=True)
+        df["Taylor_Rate_Standard"] = self._standard_rate(df)
+        return df
 
-        df["Taylor_Rate_Standard"] = (
-            self.r_star
-            + df["Inflation"]
-            + (self.alpha * df["Inflation_Gap"])
-            + (self.beta * df["Output_Gap"])
-        )
-        df["Taylor_Rate"] = df["Taylor_Rate_Standard"] + (self.gamma * df["FSI"])
-        df["Taylor_Rate_Raw"] = df["Taylor_Rate"].copy()
-
-        smoothed = df["Taylor_Rate"].to_numpy(dtype=float).copy()
-        for t in range(1, len(smoothed)):
-            smoothed[t] = (self.rho * smoothed[t - 1]) + ((1.0 - self.rho) * smoothed[t])
-        df["Taylor_Rate"] = smoothed
+    def _augmented_frame(self, inputs: Optional[TaylorRuleInputs] = None) -> pd.DataFrame:
+        """Extended frame plus the previous month's tone index (no tone sensitivity applied)."""
+        tone = inputs.tone if inputs is not None and inputs.tone is not None else self.load_tone_inputs()
+        df = self._extended_frame(inputs).merge(tone, on="Date", how="left")
+        df["tone_index"] = df["tone_index"].shift(1).ffill().fillna(0.0)
+        return df
 
+    def _fsi_details(self, df: pd.DataFrame) -> Dict[str, float]:
         latest = df.iloc[-1]
         # Use last row with valid component data (components may be NaN in trailing months after ffill of FSI)
         comp_cols = ["Credit_Component", "FX_Component", "FX_Volatility_Component", "Spread_Component"]
         valid_comp = df.dropna(subset=comp_cols)
         comp_row = valid_comp.iloc[-1] if not valid_comp.empty else latest
-        fsi_details = {
+        return {
             "fsi_latest": float(latest["FSI"]),
             "credit_component_latest": float(comp_row["Credit_Component"]),
             "fx_component_latest": float(comp_row["FX_Component"]),
@@ -369,6 +512,31 @@ class ExtendedTaylorRule:
             "gamma": float(self.gamma),
         }
 
+    def calculate_standard(self, inputs: Optional[TaylorRuleInputs] = None) -> TaylorRuleResult:
+        """Standard Taylor Rule: i = r* + pi + alpha(pi-pi*) + beta(y)."""
+        df = self._core_frame(inputs)
+        df["Taylor_Rate"] = self._standard_rate(df)
+
+        ordered = df[
+            [
+                "Date",
+                "Base_Rate",
+                "CPI",
+                "Inflation",
+                "Output_Gap",
+                "Inflation_Gap",
+                "Taylor_Rate",
+            ]
+        ].copy()
+        return self._build_result(ordered, "standard")
+
+    def calculate_extended(self, inputs: Optional[TaylorRuleInputs] = None) -> TaylorRuleResult:
+        """Extended Taylor Rule with financial stability term."""
+        df = self._extended_frame(inputs)
+        df["Taylor_Rate_Raw"] = df["Taylor_Rate_Standard"] + (self.gamma * df["FSI"])
+        df["Taylor_Rate"] = self._smooth(df["Taylor_Rate_Raw"])
+        fsi_details = self._fsi_details(df)
+
         ordered = df[
             [
                 "Date",
@@ -389,21 +557,17 @@ class ExtendedTaylorRule:
         ].copy()
         return self._build_result(ordered, "extended", fsi_details=fsi_details)
 
-    def calculate_augmented(self) -> TaylorRuleResult:
+    def calculate_augmented(self, inputs: Optional[TaylorRuleInputs] = None) -> TaylorRuleResult:
         """Augmented Taylor Rule with FSI and NLP tone adjustment."""
-        extended_result = self.calculate_extended()
-        df = extended_result.df.copy()
-        tone = self._load_tone_data()
-
-        df = df.merge(tone, on="Date", how="left")
-        df["tone_index"] = df["tone_index"].shift(1).ffill().fillna(0.0)
+        df = self._augmented_frame(inputs)
         df["Taylor_Residual"] = df["Base_Rate"] - df["Taylor_Rate_Standard"]
 
         sensitivity = 0.0
         r_squared = 0.0
         p_value = np.nan
-        valid = df[["Taylor_Residual", "tone_index"]].dropna()
-        if len(valid) > 10:
+        fit_rows = df if inputs is None or inputs.fit_until is None else df[df["Date"] <= inputs.fit_until]
+        valid = fit_rows[["Taylor_Residual", "tone_index"]].dropna()
+        if len(valid) > 10 and valid["tone_index"].nunique() > 1:
             X = sm.add_constant(valid["tone_index"])
             model = sm.OLS(valid["Taylor_Residual"], X).fit()
             sensitivity = float(model.params.get("tone_index", 0.0))
@@ -418,10 +582,7 @@ class ExtendedTaylorRule:
             + (self.delta * df["Tone_Adjustment"])
         )
 
-        smoothed = df["Taylor_Rate_Raw"].to_numpy(dtype=float).copy()
-        for t in range(1, len(smoothed)):
-            smoothed[t] = (self.rho * smoothed[t - 1]) + ((1.0 - self.rho) * smoothed[t])
-        df["Taylor_Rate"] = smoothed
+        df["Taylor_Rate"] = self._smooth(df["Taylor_Rate_Raw"])
 
         latest = df.iloc[-1]
         tone_details = {
@@ -457,19 +618,23 @@ class ExtendedTaylorRule:
         return self._build_result(
             ordered,
             "augmented",
-            fsi_details=extended_result.fsi_details,
+            fsi_details=self._fsi_details(df),
             tone_details=tone_details,
         )
 
-    def calculate(self, model_type: str = "extended") -> TaylorRuleResult:
-        """Main entry point for rule variants."""
+    def calculate(self, model_type: str = "extended", inputs: Optional[TaylorRuleInputs] = None) -> TaylorRuleResult:
+        """Main entry point for rule variants.
+
+        ``inputs`` overrides the cached full-sample inputs, e.g. with data
+        truncated to a backtest fold.
+        """
         model = model_type.lower().strip()
         if model == "standard":
-            return self.calculate_standard()
+            return self.calculate_standard(inputs)
         if model == "extended":
-            return self.calculate_extended()
+            return self.calculate_extended(inputs)
         if model == "augmented":
-            return self.calculate_augmented()
+            return self.calculate_augmented(inputs)
         raise ValueError(f"Unknown model_type: {model_type}")
 
 
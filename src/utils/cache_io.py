@@ -0,0 +1,82 @@
+"""
+캐시/아티팩트 파일 공용 입출력
+
+패널 저장소, 인용 색인, 페이지/문장 경계 캐시, 수집 색인, 모델 아티팩트가
+같은 방식으로 파일을 쓰고 원본 변경을 감지하도록 모은 헬퍼입니다.
+
+- atomic_write: 같은 디렉토리의 임시 파일에 쓴 뒤 os.replace로 교체
+  (읽는 쪽은 이전 파일 또는 완성된 새 파일만 보며, 실패 시 임시 파일 삭제)
+- write_json / read_json: 메타데이터 JSON (읽을 수 없으면 None = 캐시 없음)
+- stat_signature / file_signature: 원본 파일의 (mtime_ns, size) 서명
+"""
+
+import json
+import logging
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@contextmanager
+def atomic_write(path: Path, mode: str = "wb") -> Iterator[IO]:
+    """
+    path에 원자적으로 쓰기
+
+    Args:
+        path: 대상 파일 (상위 디렉토리는 없으면 생성)
+        mode: "wb" 또는 "w" (텍스트는 UTF-8)
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp_path, mode, encoding=None if "b" in mode else "utf-8") as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def write_text(path: Path, text: str) -> None:
+    with atomic_write(path, "w") as f:
+        f.write(text)
+
+
+def write_json(path: Path, data: Any) -> None:
+    with atomic_write(path, "w") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def read_json(path: Path) -> Optional[Any]:
+    """JSON 읽기 (없거나 손상되었으면 None)"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as exc:
+        logger.warning(f"읽을 수 없는 JSON 무시 ({path}): {exc}")
+        return None
+
+
+def stat_signature(path: Path) -> Tuple[int, int]:
+    """파일의 (mtime_ns, size) (없으면 FileNotFoundError)"""
+    stat = Path(path).stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def file_signature(paths: Iterable[Path], root: Path) -> Dict[str, List[int]]:
+    """root 기준 상대 경로(POSIX)별 [mtime_ns, size] (없는 파일은 제외, JSON 메타데이터 저장용)"""
+    signature = {}
+    for path in paths:
+        path = Path(path)
+        try:
+            mtime_ns, size = stat_signature(path)
+        except FileNotFoundError:
+            continue
+        signature[path.relative_to(root).as_posix()] = [mtime_ns, size]
+    return signature
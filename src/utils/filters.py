@@ -0,0 +1,80 @@
+"""
+재귀 필터 유틸리티
+
+금리 평활화(inertia) 규칙 y[t] = rho * y[t-1] + (1 - rho) * x[t] 를
+scipy.signal.lfilter 기반 1차 IIR 필터로 벡터화하여 적용합니다.
+- 1-D 시계열 또는 2-D (시나리오/파라미터 × 시간) 배열 지원
+- 행별로 다른 rho 지원
+- NaN 인지 모드 (결측 시점은 직전 평활값 유지)
+"""
+
+from typing import Union
+
+import numpy as np
+from scipy.signal import lfilter
+
+ArrayLike = Union[float, np.ndarray]
+
+
+def _filter_rows(x: np.ndarray, rho: float) -> np.ndarray:
+    """단일 rho로 2-D 배열의 각 행(시간축 = 마지막 축)에 필터 적용"""
+    if rho == 0.0:
+        return x.copy()
+    # y[0] = x[0] 이 되도록 초기 상태를 rho * x[0] 로 설정
+    zi = (rho * x[:, :1]).astype(float)
+    out, _ = lfilter([1.0 - rho], [1.0, -rho], x, axis=-1, zi=zi)
+    return out
+
+
+def _filter_row_nan_aware(row: np.ndarray, rho: float) -> np.ndarray:
+    """결측값을 건너뛰고 유효 관측치에만 필터를 적용한 뒤 직전 값으로 채움"""
+    out = np.full(row.shape, np.nan, dtype=float)
+    valid = np.flatnonzero(np.isfinite(row))
+    if valid.size == 0:
+        return out
+    out[valid] = _filter_rows(row[valid][np.newaxis, :], rho)[0]
+    # 첫 유효 관측 이후의 결측 구간은 직전 평활값 유지
+    filled_idx = np.maximum.accumulate(np.where(np.isfinite(out), np.arange(len(out)), -1))
+    has_value = filled_idx >= 0
+    out[has_value] = out[filled_idx[has_value]]
+    return out
+
+
+def recursive_filter(x: np.ndarray, rho: ArrayLike, nan_aware: bool = False) -> np.ndarray:
+    """
+    1차 재귀 평활 필터: y[t] = rho * y[t-1] + (1 - rho) * x[t], y[0] = x[0]
+
+    Args:
+        x: 1-D 시계열 또는 2-D 배열 (행 = 시나리오/파라미터, 열 = 시간)
+        rho: 스칼라 또는 행별 rho 배열 (2-D 입력일 때 길이 = 행 수)
+        nan_aware: True면 NaN 시점은 직전 평활값을 유지하고 다음 유효값부터 재귀 계속.
+            False면 NaN이 이후 시점으로 전파됩니다 (기존 루프와 동일).
+
+    Returns:
+        x와 같은 shape의 평활 결과
+    """
+    values = np.asarray(x, dtype=float)
+    if values.ndim not in (1, 2):
+        raise ValueError(f"recursive_filter expects 1-D or 2-D input, got {values.ndim}-D")
+
+    matrix = values.reshape(1, -1) if values.ndim == 1 else values
+    rhos = np.broadcast_to(np.asarray(rho, dtype=float).reshape(-1), (matrix.shape[0],))
+    if np.any((rhos < 0.0) | (rhos > 1.0)):
+        raise ValueError("rho must be within [0, 1]")
+
+    out = np.empty_like(matrix)
+    if matrix.shape[1] == 0:
+        return out.reshape(values.shape)
+
+    rows_with_nan = ~np.isfinite(matrix).all(axis=1) if nan_aware else np.zeros(matrix.shape[0], dtype=bool)
+
+    # 같은 rho를 공유하는 행은 한 번의 lfilter 호출로 처리
+    for rho_value in np.unique(rhos):
+        rows = np.flatnonzero((rhos == rho_value) & ~rows_with_nan)
+        if rows.size:
+            out[rows] = _filter_rows(matrix[rows], float(rho_value))
+
+    for row in np.flatnonzero(rows_with_nan):
+        out[row] = _filter_row_nan_aware(matrix[row], float(rhos[row]))
+
+    return out.reshape(values.shape)
@@ -0,0 +1,256 @@
+"""
+PDF 페이지 텍스트/단어 좌표 캐시
+
+PDFTextLocator가 검색할 때마다 PDF를 다시 열어 전 페이지의 extract_text()와
+extract_words()를 호출하던 비용을 없애기 위해, 문서당 한 번 추출한 결과를
+PDF 내용 해시(SHA-256) 기준 .npz 파일로 저장합니다.
+
+저장 내용 (모든 오프셋은 페이지 텍스트 내 문자 위치):
+- 페이지 텍스트와 정규화 텍스트(공백류 제거)
+- 정규화 텍스트 → 원문 위치 오프셋 맵 (int32)
+- 단어 좌표 (float32 [N, 4]: x0, top, x1, bottom)와 단어별 시작/끝 오프셋 (int32)
+
+인용 위치 검색은 메모리 내 문자열 검색 + 오프셋 → 좌표 이진 탐색으로 처리됩니다.
+"""
+
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pdfplumber
+
+from src.crawlers.blob_store import file_sha256
+from src.utils.cache_io import atomic_write, stat_signature
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+CACHE_DIR = PROJECT_ROOT / "data" / "cache" / "pdf_pages"
+CACHE_VERSION = 2
+
+# fuzzy 비교/인용 색인 공용 정규화에서 제거하는 공백류 (탭, 줄바꿈, CR, NBSP, 전각 공백 등)
+WHITESPACE_CODEPOINTS = (9, 10, 11, 12, 13, 32, 0xA0, 0x3000)
+
+
+def _encode(text: str) -> np.ndarray:
+    return np.frombuffer(text.encode("utf-8"), dtype=np.uint8)
+
+
+def _decode(array: np.ndarray) -> str:
+    return array.tobytes().decode("utf-8")
+
+
+def normalize_with_map(text: str) -> Tuple[str, np.ndarray]:
+    """공백류를 모두 제거한 텍스트와 (정규화 위치 → 원문 위치) int32 맵"""
+    codepoints = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+    keep = ~np.isin(codepoints, WHITESPACE_CODEPOINTS)
+    return codepoints[keep].tobytes().decode("utf-32-le"), np.flatnonzero(keep).astype(np.int32)
+
+
+@dataclass
+class PageCache:
+    """한 PDF의 페이지 텍스트/단어 좌표"""
+
+    sha256: str
+    page_texts: List[str]
+    norm_texts: List[str]
+    norm_maps: List[np.ndarray]
+    word_boxes: np.ndarray  # float32 [N, 4]
+    word_start: np.ndarray  # int32 [N], 페이지 텍스트 내 시작 위치 (정렬 실패 시 -1)
+    word_end: np.ndarray  # int32 [N]
+    word_texts: List[str]
+    page_word_bounds: np.ndarray  # int64 [pages + 1], 페이지별 단어 구간
+
+    @property
+    def n_pages(self) -> int:
+        return len(self.page_texts)
+
+    # ------------------------------------------------------------------
+    # 생성 / 저장
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def build(cls, pdf_path: Path, sha256: Optional[str] = None) -> "PageCache":
+        """pdfplumber로 페이지 텍스트와 단어 좌표를 한 번에 추출"""
+        sha256 = sha256 or file_sha256(pdf_path)
+        page_texts, boxes, starts, ends, word_texts, bounds = [], [], [], [], [], [0]
+        with pdfplumber.open(pdf_path) as pdf:
+            for page in pdf.pages:
+                text = page.extract_text() or ""
+                cursor = 0
+                for word in page.extract_words():
+                    start = text.find(word["text"], cursor)
+                    if start >= 0:
+                        cursor = start + len(word["text"])
+                    boxes.append((word["x0"], word["top"], word["x1"], word["bottom"]))
+                    starts.append(start)
+                    ends.append(start + len(word["text"]) if start >= 0 else -1)
+                    word_texts.append(word["text"])
+                page_texts.append(text)
+                bounds.append(len(word_texts))
+
+        norm_texts, norm_maps = [], []
+        for text in page_texts:
+            norm_text, norm_map = normalize_with_map(text)
+            norm_texts.append(norm_text)
+            norm_maps.append(norm_map)
+
+        return cls(
+            sha256=sha256,
+            page_texts=page_texts,
+            norm_texts=norm_texts,
+            norm_maps=norm_maps,
+            word_boxes=np.asarray(boxes, dtype=np.float32).reshape(-1, 4),
+            word_start=np.asarray(starts, dtype=np.int32),
+            word_end=np.asarray(ends, dtype=np.int32),
+            word_texts=word_texts,
+            page_word_bounds=np.asarray(bounds, dtype=np.int64),
+        )
+
+    def save(self, path: Path) -> None:
+        """단일 .npz로 원자적 저장 (문자열은 UTF-8 바이트 + 페이지 경계)"""
+        with atomic_write(path) as f:
+            np.savez(
+                f,
+                version=np.int32(CACHE_VERSION),
+                page_texts=_encode("".join(self.page_texts)),
+                page_lengths=np.asarray([len(t) for t in self.page_texts], dtype=np.int64),
+                norm_texts=_encode("".join(self.norm_texts)),
+                norm_maps=np.concatenate(self.norm_maps) if self.norm_maps else np.zeros(0, np.int32),
+                norm_lengths=np.asarray([len(t) for t in self.norm_texts], dtype=np.int64),
+                word_boxes=self.word_boxes,
+                word_start=self.word_start,
+                word_end=self.word_end,
+                word_texts=_encode("\x00".join(self.word_texts)),
+                page_word_bounds=self.page_word_bounds,
+            )
+
+    @classmethod
+    def load(cls, path: Path, sha256: str) -> Optional["PageCache"]:
+        try:
+            with np.load(path) as data:
+                if int(data["version"]) != CACHE_VERSION:
+                    return None
+                page_texts = _split(_decode(data["page_texts"]), data["page_lengths"])
+                norm_lengths = data["norm_lengths"]
+                norm_texts = _split(_decode(data["norm_texts"]), norm_lengths)
+                norm_maps = np.split(data["norm_maps"], np.cumsum(norm_lengths)[:-1]) if len(norm_lengths) else []
+                word_texts = _decode(data["word_texts"]).split("\x00") if len(data["word_start"]) else []
+                return cls(
+                    sha256=sha256,
+                    page_texts=page_texts,
+                    norm_texts=norm_texts,
+                    norm_maps=norm_maps,
+                    word_boxes=data["word_boxes"],
+                    word_start=data["word_start"],
+                    word_end=data["word_end"],
+                    word_texts=word_texts,
+                    page_word_bounds=data["page_word_bounds"],
+                )
+        except (OSError, KeyError, ValueError) as exc:
+            logger.warning(f"페이지 캐시를 읽을 수 없어 다시 생성합니다 ({path.name}): {exc}")
+            return None
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def find(self, page_index: int, search_text: str, fuzzy: bool = True, start: int = 0) -> Optional[Tuple[int, int]]:
+        """
+        페이지 텍스트에서 검색어 위치
+
+        Returns:
+            원문 기준 (시작, 끝) 문자 위치 또는 None
+        """
+        if fuzzy:
+            query, _ = normalize_with_map(search_text)
+            norm_map = self.norm_maps[page_index]
+            norm_start = int(np.searchsorted(norm_map, start))
+            idx = self.norm_texts[page_index].find(query, norm_start) if query else -1
+            if idx < 0:
+                return None
+            return int(norm_map[idx]), int(norm_map[idx + len(query) - 1]) + 1
+        idx = self.page_texts[page_index].find(search_text, start) if search_text else -1
+        if idx < 0:
+            return None
+        return idx, idx + len(search_text)
+
+    def words_in_range(self, page_index: int, char_start: int, char_end: int) -> np.ndarray:
+        """원문 [char_start, char_end) 구간과 겹치는 단어 인덱스 (문서 전체 기준)"""
+        lo, hi = int(self.page_word_bounds[page_index]), int(self.page_word_bounds[page_index + 1])
+        ends = self.word_end[lo:hi]
+        starts = self.word_start[lo:hi]
+        if hi == lo:
+            return np.zeros(0, dtype=np.int64)
+        # 단어 위치는 페이지 안에서 증가 순 (정렬 실패 단어의 -1은 누적 최대로 무시)
+        first = int(np.searchsorted(np.maximum.accumulate(ends), char_start, side="right"))
+        last = int(np.searchsorted(np.maximum.accumulate(starts), char_end, side="left"))
+        candidates = np.arange(first, max(first, last))
+        overlap = candidates[(starts[candidates] >= 0) & (starts[candidates] < char_end)]
+        return overlap + lo
+
+    def word_dict(self, page_index: int, word_index: int) -> Dict:
+        x0, top, x1, bottom = (float(v) for v in self.word_boxes[word_index])
+        return {
+            "page": page_index + 1,
+            "x0": x0,
+            "y0": top,
+            "x1": x1,
+            "y1": bottom,
+            "text": self.word_texts[word_index],
+        }
+
+
+def _split(text: str, lengths: np.ndarray) -> List[str]:
+    parts, pos = [], 0
+    for length in lengths:
+        parts.append(text[pos:pos + int(length)])
+        pos += int(length)
+    return parts
+
+
+def cache_path(sha256: str) -> Path:
+    return CACHE_DIR / sha256[:2] / f"{sha256}.npz"
+
+
+@lru_cache(maxsize=32)
+def _load_or_build(pdf_key: str, mtime_ns: int, size: int) -> PageCache:
+    pdf_path = Path(pdf_key)
+    sha256 = file_sha256(pdf_path)
+    path = cache_path(sha256)
+    if path.exists():
+        cache = PageCache.load(path, sha256)
+        if cache is not None:
+            return cache
+    logger.info(f"페이지 캐시 생성: {pdf_path.name}")
+    cache = PageCache.build(pdf_path, sha256)
+    cache.save(path)
+    return cache
+
+
+def get_page_cache(pdf_path: Path) -> PageCache:
+    """PDF의 페이지 캐시 (프로세스 내 캐시 → 디스크 캐시 → 새로 생성)"""
+    pdf_path = Path(pdf_path).resolve()
+    return _load_or_build(str(pdf_path), *stat_signature(pdf_path))
+
+
+def load_page_cache(pdf_path: Path, build: bool = False) -> Optional[PageCache]:
+    """디스크 캐시가 있을 때만 로드 (build=True면 없을 때 생성)"""
+    if build:
+        return get_page_cache(pdf_path)
+    pdf_path = Path(pdf_path).resolve()
+    if not cache_path(file_sha256(pdf_path)).exists():
+        return None
+    return _load_or_build(str(pdf_path), *stat_signature(pdf_path))
+
+
+def ensure_page_cache(pdf_path: Path) -> Path:
+    """디스크 캐시가 없으면 생성하고 캐시 경로 반환 (추출 단계용, 메모리에 남기지 않음)"""
+    sha256 = file_sha256(pdf_path)
+    path = cache_path(sha256)
+    if not path.exists():
+        PageCache.build(pdf_path, sha256).save(path)
+    return path
@@ -3,13 +3,14 @@ PDF 딥링크 및 텍스트 검증 도구
 
 기능:
 - PDF 내 텍스트 위치 찾기
+- 코퍼스 전체에서 인용 문구 출처 찾기
 - 인용 문구 정확성 검증
 - PDF 좌표 추출
 """
 
-import pdfplumber
 import pandas as pd
 import numpy as np
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from sklearn.feature_extraction.text import TfidfVectorizer
@@ -17,6 +18,10 @@ from sklearn.metrics.pairwise import cosine_similarity
 import logging
 import json
 
+from src.utils.pdf_page_cache import PageCache, get_page_cache
+from src.utils.quote_index import QuoteIndex
+from src.utils.quote_verifier import get_verifier
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -24,9 +29,12 @@ logger = logging.getLogger(__name__)
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 PDF_DIR = PROJECT_ROOT / "data" / "pdfs"
 
+# 두 문서 단어 TF-IDF 유사도 임계값 (코퍼스 벡터라이저와 같은 보정 쌍에서 균형 정확도 최대)
+TWO_DOCUMENT_THRESHOLD = 0.5
+
 
 class PDFTextLocator:
-    """PDF 텍스트 위치 찾기"""
+    """PDF 텍스트 위치 찾기 (페이지 텍스트/단어 좌표 캐시 사용)"""
 
     def __init__(self, pdf_path: Path):
         """
@@ -36,10 +44,18 @@ class PDFTextLocator:
             pdf_path: PDF 파일 경로
         """
         self.pdf_path = pdf_path
+        self._cache: Optional[PageCache] = None
 
         if not pdf_path.exists():
             raise FileNotFoundError(f"PDF 파일을 찾을 수 없습니다: {pdf_path}")
 
+    @property
+    def cache(self) -> PageCache:
+        """문서 페이지 캐시 (최초 접근 시 로드, 없으면 생성)"""
+        if self._cache is None:
+            self._cache = get_page_cache(self.pdf_path)
+        return self._cache
+
     def find_text_coordinates(
         self,
         search_text: str,
@@ -50,66 +66,41 @@ class PDFTextLocator:
 
         Args:
             search_text: 검색할 텍스트
-            fuzzy: 유사 매칭 사용 여부
+            fuzzy: 유사 매칭 사용 여부 (공백/줄바꿈 무시)
 
         Returns:
-            List of dicts with page, x0, y0, x1, y1, text
+            List of dicts with page, x0, y0, x1, y1, text (첫 단어 좌표),
+            char_start, char_end (페이지 텍스트 내 위치), bbox (일치 구간 전체 좌표)
         """
         logger.info(f"텍스트 검색: '{search_text[:50]}...'")
 
         results = []
 
         try:
-            with pdfplumber.open(self.pdf_path) as pdf:
-                for page_num, page in enumerate(pdf.pages, start=1):
-                    # 페이지 텍스트 추출
-                    page_text = page.extract_text()
-
-                    if not page_text:
-                        continue
-
-                    # 검색 텍스트가 페이지에 있는지 확인
-                    if fuzzy:
-                        # 공백/줄바꿈 제거 후 비교
-                        search_normalized = search_text.replace(' ', '').replace('\n', '')
-                        page_normalized = page_text.replace(' ', '').replace('\n', '')
-
-                        if search_normalized in page_normalized:
-                            # 단어 단위로 좌표 찾기
-                            words = page.extract_words()
-
-                            # 검색 텍스트의 첫 단어로 시작점 찾기
-                            search_words = search_text.split()[:3]  # 처음 3단어
-
-                            for i, word in enumerate(words):
-                                if any(sw in word['text'] for sw in search_words):
-                                    results.append({
-                                        'page': page_num,
-                                        'x0': word['x0'],
-                                        'y0': word['top'],
-                                        'x1': word['x1'],
-                                        'y1': word['bottom'],
-                                        'text': word['text'],
-                                        'found_in_page': True
-                                    })
-                                    break
-                    else:
-                        # 정확한 매칭
-                        if search_text in page_text:
-                            words = page.extract_words()
-
-                            for word in words:
-                                if search_text.startswith(word['text']):
-                                    results.append({
-                                        'page': page_num,
-                                        'x0': word['x0'],
-                                        'y0': word['top'],
-                                        'x1': word['x1'],
-                                        'y1': word['bottom'],
-                                        'text': word['text'],
-                                        'found_in_page': True
-                                    })
-                                    break
+            cache = self.cache
+            for page_index in range(cache.n_pages):
+                span = cache.find(page_index, search_text, fuzzy=fuzzy)
+                if span is None:
+                    continue
+
+                words = cache.words_in_range(page_index, *span)
+                if len(words) == 0:
+                    continue
+
+                boxes = cache.word_boxes[words]
+                result = cache.word_dict(page_index, int(words[0]))
+                result.update({
+                    'found_in_page': True,
+                    'char_start': span[0],
+                    'char_end': span[1],
+                    'bbox': (
+                        float(boxes[:, 0].min()),
+                        float(boxes[:, 1].min()),
+                        float(boxes[:, 2].max()),
+                        float(boxes[:, 3].max()),
+                    ),
+                })
+                results.append(result)
 
         except Exception as e:
             logger.error(f"PDF 처리 중 오류: {e}")
@@ -129,13 +120,12 @@ class PDFTextLocator:
             페이지 텍스트 또는 None
         """
         try:
-            with pdfplumber.open(self.pdf_path) as pdf:
-                if page_num < 1 or page_num > len(pdf.pages):
-                    logger.warning(f"유효하지 않은 페이지 번호: {page_num}")
-                    return None
+            cache = self.cache
+            if page_num < 1 or page_num > cache.n_pages:
+                logger.warning(f"유효하지 않은 페이지 번호: {page_num}")
+                return None
 
-                page = pdf.pages[page_num - 1]
-                return page.extract_text()
+            return cache.page_texts[page_num - 1]
 
         except Exception as e:
             logger.error(f"페이지 텍스트 추출 실패: {e}")
@@ -150,22 +140,15 @@ class PDFTextLocator:
         """
         logger.info("PDF 좌표 추출 중...")
 
-        all_coords = []
-
         try:
-            with pdfplumber.open(self.pdf_path) as pdf:
-                for page_num, page in enumerate(pdf.pages, start=1):
-                    words = page.extract_words()
-
-                    for word in words:
-                        all_coords.append({
-                            'page': page_num,
-                            'x0': word['x0'],
-                            'y0': word['top'],
-                            'x1': word['x1'],
-                            'y1': word['bottom'],
-                            'text': word['text']
-                        })
+            cache = self.cache
+            all_coords = [
+                cache.word_dict(page_index, word_index)
+                for page_index in range(cache.n_pages)
+                for word_index in range(
+                    int(cache.page_word_bounds[page_index]), int(cache.page_word_bounds[page_index + 1])
+                )
+            ]
 
             # JSON 저장
             with open(output_path, 'w', encoding='utf-8') as f:
@@ -177,25 +160,48 @@ class PDFTextLocator:
             logger.error(f"좌표 저장 실패: {e}")
 
 
+@lru_cache(maxsize=None)
+def _log_corpus_fallback(reason: str):
+    """두 문서 TF-IDF 대체 경고는 이유별로 프로세스당 한 번만"""
+    logger.warning(f"코퍼스 벡터라이저 사용 불가, 두 문서 TF-IDF로 대체: {reason}")
+
+
 def verify_quote_accuracy(
     original_text: str,
     extracted_quote: str,
-    threshold: float = 0.85
+    threshold: Optional[float] = None
 ) -> Dict:
     """
     인용 문구 정확성 검증
 
-    TF-IDF 기반 코사인 유사도로 검증
+    코퍼스로 학습해 둔 문자 n-gram TF-IDF가 있으면 그 코사인 유사도로 검증하고,
+    없거나 코퍼스가 바뀌었으면 두 문서 TF-IDF로 대체 (학습은 python -m src.utils.quote_verifier,
+    여러 쌍은 quote_verifier.get_verifier().verify_batch 사용)
+
+    두 유사도는 척도가 달라 임계값도 방식별로 보정되어 있습니다
+    (코퍼스 quote_verifier.DEFAULT_THRESHOLD, 두 문서 TWO_DOCUMENT_THRESHOLD).
 
     Args:
         original_text: 원본 텍스트
         extracted_quote: 추출된 인용 문구
-        threshold: 유사도 임계값
+        threshold: 유사도 임계값 (None이면 사용한 방식의 보정값, 지정 시 방식과 무관하게 적용)
 
     Returns:
-        Dict with similarity, is_accurate, warning
+        Dict with similarity, is_accurate, warning, threshold, scorer ("corpus" 또는 "two_document")
     """
     try:
+        try:
+            verifier = get_verifier(fit=False)
+        except (ValueError, OSError) as e:
+            _log_corpus_fallback(str(e))
+        else:
+            if threshold is None:
+                return verifier.verify_batch([original_text], [extracted_quote])[0]
+            return verifier.verify_batch([original_text], [extracted_quote], threshold)[0]
+
+        if threshold is None:
+            threshold = TWO_DOCUMENT_THRESHOLD
+
         # 텍스트 전처리 (공백/줄바꿈 정규화)
         original_clean = ' '.join(original_text.split())
         quote_clean = ' '.join(extracted_quote.split())
@@ -214,7 +220,8 @@ def verify_quote_accuracy(
             'similarity': float(similarity),
             'is_accurate': is_accurate,
             'warning': warning,
-            'threshold': threshold
+            'threshold': threshold,
+            'scorer': 'two_document'
         }
 
         if warning:
@@ -230,7 +237,7 @@ def verify_quote_accuracy(
             'similarity': 0.0,
             'is_accurate': False,
             'warning': True,
-            'threshold': threshold,
+            'threshold': threshold if threshold is not None else TWO_DOCUMENT_THRESHOLD,
             'error': str(e)
         }
 
@@ -302,6 +309,33 @@ def find_quote_in_pdf(
         return None
 
 
+_quote_index: Optional[QuoteIndex] = None
+
+
+def find_quote_in_corpus(quote: str, top_k: int = 5, min_score: float = 0.6) -> List[Dict]:
+    """
+    data/ 전체 문서에서 인용 문구 출처 찾기 (어느 PDF인지 몰라도 됨)
+
+    Args:
+        quote: 찾을 인용 문구
+        top_k: 반환할 최대 후보 수
+        min_score: 최소 유사도 (0~1)
+
+    Returns:
+        List of dicts with score, document, category, date, page, snippet, pdf, bbox
+    """
+    global _quote_index
+
+    try:
+        if _quote_index is None:
+            _quote_index = QuoteIndex().load()
+        return [match.to_dict() for match in _quote_index.search(quote, top_k=top_k, min_score=min_score)]
+
+    except Exception as e:
+        logger.error(f"코퍼스 인용 문구 검색 실패: {e}")
+        return []
+
+
 def main():
     """테스트 실행"""
     print("=" * 70)
@@ -0,0 +1,494 @@
+"""
+코퍼스 전체 인용 문구 위치 색인
+
+전문가가 붙여 넣은 인용문이 어느 회의/문서/페이지에서 나왔는지 찾기 위해,
+data/ 아래 추출 텍스트 전체를 공백 제거 정규화한 뒤 문자 3-gram 역색인을
+만듭니다. 색인은 메모리 매핑 가능한 .npy 배열(CSR 형식 posting)과 메타데이터
+(JSON)로 저장합니다.
+
+- 페이지 경계 오프셋으로 코퍼스 위치 → (문서, 페이지, 페이지 내 위치) 변환
+- 검색: 정확 일치 + 3-gram 대각선 투표로 후보 구간 선정 → difflib 정렬 점수로 순위
+  → OCR 오류, 줄바꿈/공백 차이가 있어도 검색
+- 후보 PDF의 페이지 캐시(pdf_page_cache)가 있으면 좌표(bbox)까지 반환
+- 일치 구간을 포함하는 문장 전체(context)는 문장 경계 캐시(sentence_index)로 복원
+- 텍스트 파일 (mtime, size) 서명이 바뀌면 다시 빌드
+"""
+
+import argparse
+import difflib
+import hashlib
+import logging
+import re
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.nlp.preprocessor import TextPreprocessor
+from src.nlp.sentence_index import SentenceIndex
+from src.utils.cache_io import atomic_write, file_signature, read_json, write_json, write_text
+from src.utils.pdf_page_cache import load_page_cache, normalize_with_map
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DEFAULT_DATA_DIR = PROJECT_ROOT / "data"
+DEFAULT_INDEX_DIR = PROJECT_ROOT / "data" / "cache" / "quote_index"
+
+INDEX_VERSION = 1
+NGRAM = 3
+MAX_POSTINGS = 20000  # 이보다 흔한 3-gram은 투표에서 제외
+PAGE_SEPARATOR = "\x00"
+PAGE_MARKER = re.compile(r"^--- 페이지 (\d+) ---\n", re.MULTILINE)
+DATE_PATTERN = re.compile(r"((?:19|20)\d{2})_(0[1-9]|1[0-2])(?:_(\d{2}))?")
+# 색인에서 제외할 data/ 하위 디렉토리
+EXCLUDED_DIRS = ("blobs", "cache", "panel", "raw")
+
+
+def _ngram_keys(codepoints: np.ndarray) -> np.ndarray:
+    """연속 3문자 코드포인트를 하나의 uint64 키로 (21비트씩)"""
+    cp = codepoints.astype(np.uint64)
+    return (cp[:-2] << np.uint64(42)) | (cp[1:-1] << np.uint64(21)) | cp[2:]
+
+
+def page_spans(text: str) -> List[Tuple[int, int, int]]:
+    """저장 형식("--- 페이지 N ---")의 (페이지 번호, 시작, 끝) 위치 (표시 없으면 페이지 0)"""
+    markers = list(PAGE_MARKER.finditer(text))
+    if not markers:
+        return [(0, 0, len(text))]
+    spans = [(0, 0, markers[0].start())] if text[:markers[0].start()].strip() else []
+    for marker, next_marker in zip(markers, markers[1:] + [None]):
+        end = next_marker.start() if next_marker else len(text)
+        spans.append((int(marker.group(1)), marker.end(), end))
+    return spans
+
+
+def split_pages(text: str) -> List[Tuple[int, str]]:
+    """저장 형식("--- 페이지 N ---")을 (페이지 번호, 텍스트)로 분리 (표시 없으면 페이지 0)"""
+    return [(number, text[start:end]) for number, start, end in page_spans(text)]
+
+
+@dataclass
+class QuoteMatch:
+    """인용문 검색 후보"""
+
+    score: float
+    document: str  # data/ 기준 텍스트 경로
+    category: str
+    date: Optional[str]
+    page: int  # 1부터 (0이면 페이지 정보 없음)
+    snippet: str  # 원문 일치 구간
+    pdf: Optional[str] = None  # data/ 기준 PDF 경로
+    bbox: Optional[Tuple[float, float, float, float]] = None
+    context: str = ""  # 일치 구간을 포함하는 문장 전체 (페이지 안으로 제한)
+
+    def to_dict(self) -> Dict:
+        return {
+            "score": self.score,
+            "document": self.document,
+            "category": self.category,
+            "date": self.date,
+            "page": self.page,
+            "snippet": self.snippet,
+            "pdf": self.pdf,
+            "bbox": self.bbox,
+            "context": self.context,
+        }
+
+
+class QuoteIndex:
+    """추출 텍스트 전체에 대한 3-gram 역색인"""
+
+    def __init__(
+        self,
+        index_dir: Optional[Path] = None,
+        data_dir: Optional[Path] = None,
+        preprocessor: Optional[TextPreprocessor] = None,
+    ):
+        """
+        Args:
+            index_dir: 색인 파일 디렉토리 (None이면 data/cache/quote_index)
+            data_dir: 텍스트 원본 디렉토리 (None이면 data)
+            preprocessor: 문장 경계용 전처리기 (None이면 정규식 분리, 경계 캐시는 index_dir/sentences)
+        """
+        self.index_dir = Path(index_dir) if index_dir is not None else DEFAULT_INDEX_DIR
+        self.data_dir = Path(data_dir) if data_dir is not None else DEFAULT_DATA_DIR
+        self.preprocessor = preprocessor or TextPreprocessor(
+            use_kss=False,
+            sentence_index=SentenceIndex(self.index_dir / "sentences"),
+        )
+        self.meta_path = self.index_dir / "quote_index_meta.json"
+        self._lock = threading.Lock()
+        self._loaded: Optional[Dict] = None
+
+    # ------------------------------------------------------------------
+    # 원본
+    # ------------------------------------------------------------------
+
+    def text_files(self) -> List[Path]:
+        """색인 대상 텍스트 파일 (blobs/cache 등 제외, 카테고리 경로 우선 순서)"""
+        files = []
+        for path in sorted(self.data_dir.rglob("*.txt")):
+            rel = path.relative_to(self.data_dir)
+            if rel.parts[0] in EXCLUDED_DIRS or any(part.startswith(".") for part in rel.parts):
+                continue
+            files.append(path)
+        # 레거시 data/texts는 카테고리 디렉토리와 중복되므로 뒤로 (내용 중복 시 카테고리 경로 우선)
+        return sorted(files, key=lambda p: (p.relative_to(self.data_dir).parts[0] == "texts", str(p)))
+
+    def source_signature(self) -> Dict[str, List[int]]:
+        """텍스트 파일별 [mtime_ns, size]"""
+        return file_signature(self.text_files(), self.data_dir)
+
+    def _pdf_lookup(self) -> Dict[Tuple[str, str], str]:
+        """(카테고리, 파일명) → PDF 상대경로"""
+        lookup = {}
+        for path in sorted(self.data_dir.rglob("*.pdf")):
+            rel = path.relative_to(self.data_dir)
+            if rel.parts[0] in EXCLUDED_DIRS:
+                continue
+            lookup.setdefault((rel.parts[0], path.stem), rel.as_posix())
+        return lookup
+
+    def is_stale(self) -> bool:
+        """색인이 없거나 텍스트 파일이 바뀌었으면 True"""
+        meta = read_json(self.meta_path)
+        if meta is None or meta.get("version") != INDEX_VERSION:
+            return True
+        if meta.get("sources") != self.source_signature():
+            return True
+        return any(not (self.index_dir / name).exists() for name in ("corpus.txt", "keys.npy", "postings.npy"))
+
+    # ------------------------------------------------------------------
+    # 빌드
+    # ------------------------------------------------------------------
+
+    def _write_array(self, name: str, array: np.ndarray) -> None:
+        with atomic_write(self.index_dir / f"{name}.npy") as f:
+            np.save(f, array)
+
+    def build(self) -> Dict:
+        """색인 빌드 및 저장, 메타데이터 반환"""
+        with self._lock:
+            self.index_dir.mkdir(parents=True, exist_ok=True)
+            sources = self.source_signature()
+            pdf_lookup = self._pdf_lookup()
+
+            documents, seen_hashes = [], set()
+            parts, page_starts, page_doc, page_no = [], [], [], []
+            offset = 0
+            for path in self.text_files():
+                text = path.read_text(encoding="utf-8", errors="ignore")
+                digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+                if digest in seen_hashes or not text.strip():
+                    continue
+                seen_hashes.add(digest)
+
+                rel = path.relative_to(self.data_dir)
+                category = rel.parts[0]
+                if category == "texts":
+                    category = "01_minutes"  # 레거시 의사록 디렉토리
+                    pdf = pdf_lookup.get(("pdfs", path.stem))
+                else:
+                    pdf = pdf_lookup.get((category, path.stem))
+                date_match = DATE_PATTERN.search(path.stem)
+                documents.append({
+                    "path": rel.as_posix(),
+                    "category": category,
+                    "date": "-".join(g for g in date_match.groups() if g) if date_match else None,
+                    "pdf": pdf,
+                })
+
+                for number, page_text in split_pages(text):
+                    normalized, _ = normalize_with_map(page_text)
+                    if not normalized:
+                        continue
+                    page_starts.append(offset)
+                    page_doc.append(len(documents) - 1)
+                    page_no.append(number)
+                    parts.append(normalized + PAGE_SEPARATOR)
+                    offset += len(normalized) + 1
+
+            corpus = "".join(parts)
+            codepoints = np.frombuffer(corpus.encode("utf-32-le"), dtype=np.uint32)
+            keys = _ngram_keys(codepoints)
+            positions = np.arange(len(keys), dtype=np.int32)
+            # 페이지 경계를 넘는 3-gram 제외
+            valid = (codepoints[:-2] != 0) & (codepoints[1:-1] != 0) & (codepoints[2:] != 0)
+            keys, positions = keys[valid], positions[valid]
+            order = np.argsort(keys, kind="stable")
+            sorted_keys = keys[order]
+            unique_keys, key_offsets = np.unique(sorted_keys, return_index=True)
+
+            write_text(self.index_dir / "corpus.txt", corpus)
+            self._write_array("keys", unique_keys)
+            self._write_array("key_offsets", np.append(key_offsets, len(sorted_keys)).astype(np.int64))
+            self._write_array("postings", positions[order])
+            self._write_array("page_starts", np.asarray(page_starts, dtype=np.int64))
+            self._write_array("page_doc", np.asarray(page_doc, dtype=np.int32))
+            self._write_array("page_no", np.asarray(page_no, dtype=np.int32))
+
+            meta = {
+                "version": INDEX_VERSION,
+                "built_at": datetime.now().isoformat(timespec="seconds"),
+                "ngram": NGRAM,
+                "sources": sources,
+                "n_chars": len(corpus),
+                "n_pages": len(page_starts),
+                "n_ngrams": int(len(unique_keys)),
+                "documents": documents,
+            }
+            write_json(self.meta_path, meta)
+            self._loaded = None
+
+        logger.info(
+            f"인용 색인 빌드 완료: 문서 {len(documents)}개, 페이지 {len(page_starts)}개, "
+            f"{len(corpus):,}자, 3-gram {len(unique_keys):,}종"
+        )
+        return meta
+
+    # ------------------------------------------------------------------
+    # 로드 / 검색
+    # ------------------------------------------------------------------
+
+    def load(self, rebuild_if_stale: bool = True) -> "QuoteIndex":
+        """색인 로드 (posting 배열은 읽기 전용 memmap)"""
+        if rebuild_if_stale and self.is_stale():
+            self.build()
+        meta = read_json(self.meta_path)
+        if meta is None:
+            raise FileNotFoundError(f"인용 색인 없음: {self.meta_path}")
+        with open(self.index_dir / "corpus.txt", "r", encoding="utf-8") as f:
+            corpus = f.read()
+        self._loaded = {
+            "meta": meta,
+            "corpus": corpus,
+            "keys": np.load(self.index_dir / "keys.npy", mmap_mode="r"),
+            "key_offsets": np.load(self.index_dir / "key_offsets.npy", mmap_mode="r"),
+            "postings": np.load(self.index_dir / "postings.npy", mmap_mode="r"),
+            "page_starts": np.load(self.index_dir / "page_starts.npy"),
+            "page_doc": np.load(self.index_dir / "page_doc.npy"),
+            "page_no": np.load(self.index_dir / "page_no.npy"),
+        }
+        return self
+
+    def _index(self) -> Dict:
+        if self._loaded is None:
+            self.load()
+        return self._loaded
+
+    def _candidate_starts(self, query: str, max_candidates: int) -> List[Tuple[int, float]]:
+        """3-gram 대각선(코퍼스 위치 - 질의 위치) 투표 상위 후보 (시작 위치, 득표율)"""
+        index = self._index()
+        query_keys = _ngram_keys(np.frombuffer(query.encode("utf-32-le"), dtype=np.uint32))
+        if len(query_keys) == 0:
+            return []
+        keys, key_offsets, postings = index["keys"], index["key_offsets"], index["postings"]
+        slots = np.searchsorted(keys, query_keys)
+        diagonals = []
+        for query_pos, (slot, key) in enumerate(zip(slots, query_keys)):
+            if slot >= len(keys) or keys[slot] != key:
+                continue
+            lo, hi = int(key_offsets[slot]), int(key_offsets[slot + 1])
+            if hi - lo > MAX_POSTINGS:
+                continue
+            diagonals.append(np.asarray(postings[lo:hi], dtype=np.int64) - query_pos)
+        if not diagonals:
+            return []
+
+        # 삽입/삭제로 대각선이 조금 어긋나도 같은 후보로 모이도록 구간 단위 집계
+        band = max(4, len(query) // 8)
+        diagonal = np.concatenate(diagonals)
+        buckets, counts = np.unique(diagonal // band, return_counts=True)
+        # 인접 구간 합산
+        neighbor = np.zeros_like(counts)
+        adjacent = np.flatnonzero(np.diff(buckets) == 1)
+        neighbor[adjacent] += counts[adjacent + 1]
+        neighbor[adjacent + 1] += counts[adjacent]
+        votes = counts + neighbor
+        top = np.argsort(-votes, kind="stable")[:max_candidates]
+        return [(int(buckets[i]) * band, float(votes[i]) / len(query_keys)) for i in top]
+
+    def _align(self, query: str, start: int) -> Tuple[float, int, int]:
+        """후보 위치 주변 코퍼스 구간과 질의를 정렬, (유사도, 시작, 끝) 반환"""
+        corpus = self._index()["corpus"]
+        slack = max(8, len(query) // 4)
+        lo = max(0, start - slack)
+        hi = min(len(corpus), start + len(query) + 2 * slack)
+        window = corpus[lo:hi]
+        matcher = difflib.SequenceMatcher(None, query, window, autojunk=False)
+        blocks = [block for block in matcher.get_matching_blocks() if block.size]
+        if not blocks:
+            return 0.0, lo, lo
+        span_start = lo + blocks[0].b
+        span_end = lo + blocks[-1].b + blocks[-1].size
+        matched = sum(block.size for block in blocks)
+        score = 2.0 * matched / (len(query) + (span_end - span_start))
+        return score, span_start, span_end
+
+    def _locate(self, start: int, end: int) -> Tuple[int, int, int]:
+        """코퍼스 위치 → (페이지 행, 페이지 내 시작, 페이지 내 끝)"""
+        page_starts = self._index()["page_starts"]
+        row = int(np.searchsorted(page_starts, start, side="right")) - 1
+        page_start = int(page_starts[row])
+        return row, start - page_start, end - page_start
+
+    def _original_snippet(self, document: Dict, page: int, norm_start: int, norm_end: int) -> Tuple[str, str]:
+        """정규화 위치를 원문 텍스트 구간과 그 구간을 포함하는 문장으로 복원"""
+        try:
+            text = (self.data_dir / document["path"]).read_text(encoding="utf-8", errors="ignore")
+        except OSError:
+            return "", ""
+        for number, page_start, page_end in page_spans(text):
+            if number != page:
+                continue
+            normalized, norm_map = normalize_with_map(text[page_start:page_end])
+            if not normalized:
+                return "", ""
+            norm_end = min(norm_end, len(norm_map))
+            if norm_start >= norm_end:
+                return "", ""
+            start = page_start + int(norm_map[norm_start])
+            end = page_start + int(norm_map[norm_end - 1]) + 1
+            return text[start:end], self._sentence_context(text, start, end, page_start, page_end)
+        return "", ""
+
+    def _sentence_context(self, text: str, start: int, end: int, page_start: int, page_end: int) -> str:
+        """[start, end)와 겹치는 문장 전체 (문서 단위 문장 경계 캐시 사용)"""
+        boundaries = self.preprocessor.boundaries(text, persist=True)
+        sentences = boundaries.sentences
+        first = boundaries.sentence_at(start)
+        last = boundaries.sentence_at(end - 1)
+        if first < len(sentences) and sentences[first, 0] < end:
+            start = min(start, int(sentences[first, 0]))
+        if last < len(sentences) and sentences[last, 0] < end:
+            end = max(end, int(sentences[last, 1]))
+        return text[max(start, page_start):min(end, page_end)].strip()
+
+    def _bbox(self, pdf: str, page: int, snippet: str, build_page_cache: bool) -> Tuple[int, Optional[Tuple]]:
+        """PDF 페이지 캐시에서 원문 구간의 좌표 (페이지 번호 미상이면 전 페이지 탐색)"""
+        try:
+            cache = load_page_cache(self.data_dir / pdf, build=build_page_cache)
+        except OSError:
+            return page, None
+        if cache is None or not snippet:
+            return page, None
+        page_indices = [page - 1] if 0 < page <= cache.n_pages else range(cache.n_pages)
+        for page_index in page_indices:
+            span = cache.find(page_index, snippet, fuzzy=True)
+            if span is None:
+                continue
+            words = cache.words_in_range(page_index, *span)
+            if len(words) == 0:
+                continue
+            boxes = cache.word_boxes[words]
+            return page_index + 1, (
+                float(boxes[:, 0].min()),
+                float(boxes[:, 1].min()),
+                float(boxes[:, 2].max()),
+                float(boxes[:, 3].max()),
+            )
+        return page, None
+
+    def search(
+        self,
+        quote: str,
+        top_k: int = 5,
+        min_score: float = 0.6,
+        resolve_bbox: bool = True,
+        build_page_cache: bool = False,
+    ) -> List[QuoteMatch]:
+        """
+        인용문 출처 검색
+
+        Args:
+            quote: 인용 문구 (공백/줄바꿈 무관)
+            top_k: 반환할 최대 후보 수
+            min_score: 최소 정렬 유사도 (0~1)
+            resolve_bbox: PDF 페이지 캐시로 좌표까지 조회
+            build_page_cache: 페이지 캐시가 없으면 생성 (첫 조회가 느려짐)
+
+        Returns:
+            점수 내림차순 QuoteMatch 목록
+        """
+        index = self._index()
+        corpus = index["corpus"]
+        query, _ = normalize_with_map(quote)
+        if not query:
+            return []
+
+        spans: List[Tuple[float, int, int]] = []
+        pos = corpus.find(query)
+        while pos >= 0 and len(spans) < top_k:
+            spans.append((1.0, pos, pos + len(query)))
+            pos = corpus.find(query, pos + 1)
+        if len(spans) < top_k and len(query) >= NGRAM:
+            candidates = self._candidate_starts(query, max_candidates=2 * top_k)
+            best_votes = candidates[0][1] if candidates else 0.0
+            for start, votes in candidates:
+                # 득표가 최다 후보의 절반에 못 미치면 정렬 생략
+                if votes >= 0.5 * best_votes:
+                    spans.append(self._align(query, start))
+
+        documents = index["meta"]["documents"]
+        results: List[QuoteMatch] = []
+        taken: List[Tuple[int, int, int]] = []
+        for score, start, end in sorted(spans, key=lambda s: -s[0]):
+            if score < min_score or len(results) >= top_k:
+                break
+            row, norm_start, norm_end = self._locate(start, end)
+            # 같은 구간이 이미 결과에 있으면 건너뜀
+            if any(r == row and norm_start < e and s < norm_end for r, s, e in taken):
+                continue
+            taken.append((row, norm_start, norm_end))
+
+            document = documents[int(index["page_doc"][row])]
+            page = int(index["page_no"][row])
+            snippet, context = self._original_snippet(document, page, norm_start, norm_end)
+            bbox = None
+            if resolve_bbox and document["pdf"]:
+                page, bbox = self._bbox(document["pdf"], page, snippet, build_page_cache)
+            results.append(QuoteMatch(
+                score=round(score, 4),
+                document=document["path"],
+                category=document["category"],
+                date=document["date"],
+                page=page,
+                snippet=snippet,
+                pdf=document["pdf"],
+                bbox=bbox,
+                context=context,
+            ))
+        return results
+
+
+def main():
+    """색인 빌드(필요 시) 후 인용문 검색"""
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    parser = argparse.ArgumentParser(description="코퍼스 전체 인용문 출처 검색")
+    parser.add_argument("quote", nargs="?", help="검색할 인용문 (생략 시 색인만 빌드)")
+    parser.add_argument("--top", type=int, default=5)
+    parser.add_argument("--rebuild", action="store_true", help="색인 강제 재빌드")
+    parser.add_argument("--build-page-cache", action="store_true", help="좌표 조회용 페이지 캐시가 없으면 생성")
+    args = parser.parse_args()
+
+    index = QuoteIndex()
+    if args.rebuild:
+        index.build()
+    index.load()
+    meta = index._index()["meta"]
+    print(f"색인: 문서 {len(meta['documents'])}개, 페이지 {meta['n_pages']}개, {meta['n_chars']:,}자")
+    if not args.quote:
+        return
+    for match in index.search(args.quote, top_k=args.top, build_page_cache=args.build_page_cache):
+        location = f"p.{match.page}" if match.page else "p.?"
+        bbox = f" bbox={tuple(round(v, 1) for v in match.bbox)}" if match.bbox else ""
+        print(f"[{match.score:.3f}] {match.document} ({match.date or '-'}) {location}{bbox}")
+        print(f"    {' '.join(match.snippet.split())[:120]}")
+
+
+if __name__ == "__main__":
+    main()
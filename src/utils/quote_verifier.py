@@ -0,0 +1,321 @@
+"""
+코퍼스 기반 인용 문구 일괄 검증
+
+verify_quote_accuracy가 호출마다 두 문서(원문, 인용문)로 TfidfVectorizer를 새로
+학습하던 방식을 대체합니다. 추출 텍스트 전체(페이지 단위)로 문자 n-gram
+TF-IDF를 한 번 학습해 저장하고, 여러 (원문, 인용문) 쌍을 한 번의 희소 행렬
+연산으로 변환한 뒤 행 단위 내적으로 코사인 유사도를 계산합니다.
+
+- 문자 n-gram(char_wb 1~3): 형태소 분석 없이 한국어 어절 변형에 강함
+- IDF가 코퍼스 전체 기준이라 흔한 표현("금융통화위원회는")의 영향이 작음
+- 텍스트 파일 서명이 바뀌면 다시 학습 (학습은 CLI/일괄 검증에서만, 단건 검증은 저장된 아티팩트만 사용)
+- 유사도 척도가 두 문서 단어 TF-IDF와 다르므로 임계값도 따로 보정 (DEFAULT_THRESHOLD)
+- 전문가 주석(expert_comments)은 인용 색인으로 원문 구간을 찾아 한 번에 검증
+"""
+
+import hashlib
+import json
+import logging
+import pickle
+import re
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+import sklearn
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from src.utils.cache_io import atomic_write
+from src.utils.quote_index import QuoteIndex, split_pages
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+MODEL_DIR = PROJECT_ROOT / "data" / "models"
+DEFAULT_MODEL_PATH = MODEL_DIR / "quote_vectorizer.pkl"
+
+# 아티팩트 형식 버전 (pickle 구조나 벡터라이저 설정이 바뀌면 올림)
+ARTIFACT_VERSION = 1
+NGRAM_RANGE = (1, 3)
+# 코퍼스 문장 발췌(일치) 대 단어 30~60% 치환/다른 문장 발췌(불일치) 쌍에서 균형 정확도가 최대인 값
+DEFAULT_THRESHOLD = 0.65
+# 공용 검증기의 코퍼스 서명 재확인 간격 (초, 확인마다 data/ 전체를 순회)
+SIGNATURE_CHECK_INTERVAL = 60.0
+# 원문 구간을 찾을 때 허용하는 최소 정렬 유사도 (이보다 낮으면 원문 없음으로 처리)
+LOCATE_MIN_SCORE = 0.3
+
+
+def _clean(text: Optional[str]) -> str:
+    """공백/줄바꿈 정규화 (verify_quote_accuracy와 동일)"""
+    return " ".join((text or "").split())
+
+
+class QuoteVerifier:
+    """코퍼스로 학습한 문자 n-gram TF-IDF 기반 인용 검증기"""
+
+    def __init__(self, model_path: Optional[Path] = None, index: Optional[QuoteIndex] = None):
+        """
+        Args:
+            model_path: 벡터라이저 아티팩트 경로 (None이면 data/models/quote_vectorizer.pkl)
+            index: 코퍼스 텍스트/인용 위치 색인 (None이면 기본 QuoteIndex)
+        """
+        self.model_path = Path(model_path) if model_path is not None else DEFAULT_MODEL_PATH
+        self.index = index or QuoteIndex()
+        self.vectorizer: Optional[TfidfVectorizer] = None
+        self.artifact_info: Dict = {}
+
+    # ------------------------------------------------------------------
+    # 학습 / 저장
+    # ------------------------------------------------------------------
+
+    def data_hash(self) -> str:
+        """코퍼스 텍스트 파일 서명 해시"""
+        signature = json.dumps(self.index.source_signature(), sort_keys=True)
+        return hashlib.sha256(signature.encode("utf-8")).hexdigest()
+
+    def _corpus_pages(self) -> List[str]:
+        pages, seen = [], set()
+        for path in self.index.text_files():
+            text = path.read_text(encoding="utf-8", errors="ignore")
+            digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+            if digest in seen:
+                continue
+            seen.add(digest)
+            pages.extend(_clean(page) for _, page in split_pages(text) if page.strip())
+        return pages
+
+    def fit(self) -> "QuoteVerifier":
+        """코퍼스 전체 페이지로 벡터라이저 학습 후 저장"""
+        data_hash = self.data_hash()
+        pages = self._corpus_pages()
+        if not pages:
+            raise ValueError(f"학습할 코퍼스 텍스트가 없습니다: {self.index.data_dir}")
+
+        vectorizer = TfidfVectorizer(
+            analyzer="char_wb",
+            ngram_range=NGRAM_RANGE,
+            sublinear_tf=True,
+            min_df=2,
+            dtype=np.float32,
+        )
+        vectorizer.fit(pages)
+        vectorizer.stop_words_ = None  # min_df로 제외된 n-gram 목록 (변환에 불필요, 용량만 차지)
+
+        fitted_at = datetime.now()
+        artifact = {
+            "artifact_version": ARTIFACT_VERSION,
+            "sklearn_version": sklearn.__version__,
+            "data_hash": data_hash,
+            "n_pages": len(pages),
+            "n_features": len(vectorizer.vocabulary_),
+            "fitted_at": fitted_at.isoformat(),
+            "vectorizer": vectorizer,
+        }
+        with atomic_write(self.model_path) as f:
+            pickle.dump(artifact, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self.vectorizer = vectorizer
+        self.artifact_info = {k: v for k, v in artifact.items() if k != "vectorizer"}
+        logger.info(f"인용 검증 벡터라이저 학습: 페이지 {len(pages)}개, n-gram {len(vectorizer.vocabulary_):,}종")
+        return self
+
+    def load(self, refit_if_stale: bool = True, fit: bool = True) -> "QuoteVerifier":
+        """
+        저장된 벡터라이저 로드 (없거나 코퍼스/버전이 바뀌었으면 다시 학습)
+
+        Args:
+            refit_if_stale: 코퍼스 서명이 바뀐 아티팩트는 사용하지 않음
+            fit: False면 학습하지 않고 FileNotFoundError (대화형 경로용)
+        """
+        artifact = None
+        if self.model_path.exists():
+            try:
+                with open(self.model_path, "rb") as f:
+                    artifact = pickle.load(f)
+            except Exception as e:
+                logger.warning(f"벡터라이저 로드 실패 ({self.model_path.name}): {e}")
+
+        compatible = (
+            artifact is not None
+            and artifact.get("artifact_version") == ARTIFACT_VERSION
+            and artifact.get("sklearn_version") == sklearn.__version__
+        )
+        if compatible and (not refit_if_stale or artifact.get("data_hash") == self.data_hash()):
+            self.vectorizer = artifact["vectorizer"]
+            self.artifact_info = {k: v for k, v in artifact.items() if k != "vectorizer"}
+            return self
+        if not fit:
+            raise FileNotFoundError(
+                f"사용 가능한 인용 검증 벡터라이저가 없습니다 ({self.model_path.name}, "
+                "python -m src.utils.quote_verifier로 학습)"
+            )
+        return self.fit()
+
+    def is_current(self) -> bool:
+        """로드된 벡터라이저가 현재 코퍼스 서명과 일치하는지"""
+        return self.vectorizer is not None and self.artifact_info.get("data_hash") == self.data_hash()
+
+    # ------------------------------------------------------------------
+    # 검증
+    # ------------------------------------------------------------------
+
+    def similarities(self, sources: Sequence[str], quotes: Sequence[str]) -> np.ndarray:
+        """(원문, 인용문) 쌍별 코사인 유사도 (L2 정규화 행의 행 단위 내적)"""
+        if len(sources) != len(quotes):
+            raise ValueError("sources와 quotes의 길이가 다릅니다")
+        if self.vectorizer is None:
+            self.load()
+        if len(sources) == 0:
+            return np.zeros(0, dtype=np.float32)
+        source_matrix = self.vectorizer.transform([_clean(text) for text in sources])
+        quote_matrix = self.vectorizer.transform([_clean(text) for text in quotes])
+        return np.asarray(source_matrix.multiply(quote_matrix).sum(axis=1), dtype=np.float32).ravel()
+
+    def verify_batch(
+        self,
+        sources: Sequence[str],
+        quotes: Sequence[str],
+        threshold: float = DEFAULT_THRESHOLD,
+    ) -> List[Dict]:
+        """
+        인용 문구 일괄 검증
+
+        Returns:
+            쌍별 Dict with similarity, is_accurate, warning, threshold
+            (verify_quote_accuracy와 같은 형식)
+        """
+        scores = self.similarities(sources, quotes)
+        results = []
+        for score in scores:
+            similarity = float(score)
+            results.append({
+                "similarity": similarity,
+                "is_accurate": similarity >= threshold,
+                "warning": similarity < threshold,
+                "threshold": threshold,
+                "scorer": "corpus",
+            })
+        n_warnings = sum(result["warning"] for result in results)
+        if n_warnings:
+            logger.warning(f"인용 문구 유사도 낮음: {n_warnings}/{len(results)}건 < {threshold:.3f}")
+        return results
+
+    def _locate_source(self, quote: str, meeting_date: Optional[str]) -> Optional[Dict]:
+        """인용 색인에서 원문 구간 찾기 (같은 회의 날짜 문서 우선)"""
+        matches = self.index.search(quote, top_k=5, min_score=LOCATE_MIN_SCORE, resolve_bbox=False)
+        if not matches:
+            return None
+        digits = re.sub(r"\D", "", meeting_date or "")
+        for match in matches:
+            if digits and match.date and re.sub(r"\D", "", match.date) == digits:
+                return match.to_dict()
+        return matches[0].to_dict()
+
+    def verify_expert_comments(self, db=None, threshold: float = DEFAULT_THRESHOLD) -> pd.DataFrame:
+        """
+        expert_comments 전체 일괄 검증
+
+        인용 색인으로 각 인용문의 원문 구간을 찾은 뒤 한 번에 유사도를 계산합니다.
+        원문을 찾지 못한 인용문은 유사도 0(경고)으로 처리됩니다.
+
+        Args:
+            db: DatabaseManager (None이면 기본 DB)
+            threshold: 유사도 임계값
+
+        Returns:
+            주석별 DataFrame (id, meeting_date, quote, similarity, is_accurate, warning,
+            source_document, source_page, source_text)
+        """
+        if db is None:
+            from src.data.database import DatabaseManager
+
+            db = DatabaseManager()
+
+        comments = db.get_all_expert_comments()
+        columns = [
+            "id", "meeting_date", "expert_name", "quote", "similarity", "is_accurate", "warning",
+            "source_document", "source_page", "source_text",
+        ]
+        if not comments:
+            return pd.DataFrame(columns=columns)
+
+        sources = [self._locate_source(comment["quote"] or "", comment["meeting_date"]) for comment in comments]
+        results = self.verify_batch(
+            [source["snippet"] if source else "" for source in sources],
+            [comment["quote"] or "" for comment in comments],
+            threshold=threshold,
+        )
+
+        rows = []
+        for comment, source, result in zip(comments, sources, results):
+            rows.append({
+                "id": comment["id"],
+                "meeting_date": comment["meeting_date"],
+                "expert_name": comment["expert_name"],
+                "quote": comment["quote"],
+                "similarity": result["similarity"],
+                "is_accurate": result["is_accurate"],
+                "warning": result["warning"],
+                "source_document": source["document"] if source else None,
+                "source_page": source["page"] if source else None,
+                "source_text": source["snippet"] if source else None,
+            })
+        return pd.DataFrame(rows, columns=columns)
+
+
+_default_verifier: Optional[QuoteVerifier] = None
+_default_missing: Optional[str] = None  # 마지막 확인 때 사용 가능한 아티팩트가 없던 이유
+_default_checked_at = float("-inf")
+_default_lock = threading.Lock()
+
+
+def get_verifier(fit: bool = True) -> QuoteVerifier:
+    """
+    프로세스 공용 검증기
+
+    코퍼스 서명은 SIGNATURE_CHECK_INTERVAL마다 한 번만 다시 확인하고, 바뀌었으면 다시 로드합니다.
+
+    Args:
+        fit: False면 학습하지 않음 (저장된 아티팩트가 없거나 오래됐으면 FileNotFoundError)
+    """
+    global _default_verifier, _default_missing, _default_checked_at
+    with _default_lock:
+        now = time.monotonic()
+        if now - _default_checked_at >= SIGNATURE_CHECK_INTERVAL:
+            if _default_verifier is not None and not _default_verifier.is_current():
+                _default_verifier = None
+            _default_missing = None
+            _default_checked_at = now
+
+        if _default_verifier is None:
+            if _default_missing is not None and not fit:
+                raise FileNotFoundError(_default_missing)
+            try:
+                _default_verifier = QuoteVerifier().load(fit=fit)
+            except FileNotFoundError as e:
+                _default_missing = str(e)
+                raise
+            _default_missing = None
+        return _default_verifier
+
+
+def main():
+    """벡터라이저 학습(필요 시) 후 전문가 주석 일괄 검증"""
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    verifier = get_verifier()
+    info = verifier.artifact_info
+    print(f"벡터라이저: 페이지 {info['n_pages']}개, n-gram {info['n_features']:,}종 ({info['fitted_at']})")
+    report = verifier.verify_expert_comments()
+    if report.empty:
+        print("검증할 전문가 주석이 없습니다")
+        return
+    print(f"주석 {len(report)}건, 경고 {int(report['warning'].sum())}건")
+    print(report[["meeting_date", "similarity", "source_document", "source_page", "quote"]].to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,18 @@
 # pyright: basic
 import ast
+import html
 from datetime import datetime
+from pathlib import Path
 
 import pandas as pd
 import plotly.graph_objects as go
 import streamlit as st
 
+from src.data.panel_store import PanelStore
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+MINUTES_TEXT_DIRS = [PROJECT_ROOT / 'data' / '01_minutes' / 'txt', PROJECT_ROOT / 'data' / 'texts']
+
 
 def _safe_float(value, default=0.0):
     try:
@@ -64,76 +71,65 @@ def _extract_sentence_tones(row):
     return None
 
 
-def _render_metric_card(title, value, color):
-    st.markdown(
-        f'<div style="background: linear-gradient(145deg, #1E1E2E 0%, #1B263B 100%); border-left: 4px solid {color}; padding: 16px; border-radius: 12px; min-height: 120px; box-shadow: 0 6px 20px rgba(0,0,0,0.25);"><p style="margin: 0; color: #90A4AE; font-size: 0.82rem;">{title}</p><h3 style="margin: 10px 0 0 0; color: #E0E0E0; font-size: 1.8rem;">{value}</h3></div>',
-        unsafe_allow_html=True,
-    )
-
+@st.cache_resource(show_spinner=False)
+def _get_tone_analyzer():
+    from src.nlp.tone_analyzer import ToneAnalyzer
 
-def _load_macro_data(meeting_date_str: str) -> dict:
-    """Load macro indicators from ECOS CSVs closest to meeting date."""
-    import os
+    return ToneAnalyzer()
 
-    base_path = os.path.join(os.path.dirname(__file__), '..', '..', 'data', '08_ecos')
-    result = {}
 
+@st.cache_data(show_spinner=False)
+def _load_scored_sentences(meeting_date_str):
+    """Score each sentence of the meeting's minutes, reusing the cached sentence/clause boundaries."""
+    filename = f'minutes_{meeting_date_str}.txt'
+    path = next((d / filename for d in MINUTES_TEXT_DIRS if (d / filename).exists()), None)
+    if path is None:
+        return []
     try:
-        br = pd.read_csv(os.path.join(base_path, 'base_rate', 'base_rate.csv'))
-        br['DATA_VALUE'] = pd.to_numeric(br['DATA_VALUE'], errors='coerce')
-        values = br['DATA_VALUE'].dropna()
-        result['base_rate'] = values.iloc[-1] if not values.empty else None
-        result['base_rate_prev'] = values.iloc[-2] if len(values) > 1 else None
+        text = path.read_text(encoding='utf-8', errors='ignore')
+        scored = _get_tone_analyzer().score_sentences(text, persist=True)
     except Exception:
-        result['base_rate'] = None
-        result['base_rate_prev'] = None
+        return []
+    return [(sentence, float(h), float(d)) for sentence, h, d in scored if h > 0 or d > 0]
 
-    try:
-        cpi = pd.read_csv(os.path.join(base_path, 'cpi', 'cpi_total.csv'))
-        cpi['DATA_VALUE'] = pd.to_numeric(cpi['DATA_VALUE'], errors='coerce')
-        cpi = cpi.sort_values('TIME')
-        cpi['YoY'] = cpi['DATA_VALUE'].pct_change(12) * 100
-        yoy = cpi['YoY'].dropna()
-        result['cpi_yoy'] = yoy.iloc[-1] if not yoy.empty else None
-    except Exception:
-        result['cpi_yoy'] = None
 
-    try:
-        gdp = pd.read_csv(os.path.join(base_path, 'gdp', 'gdp_real.csv'))
-        gdp['DATA_VALUE'] = pd.to_numeric(gdp['DATA_VALUE'], errors='coerce')
-        gdp = gdp.sort_values('TIME')
-        gdp['YoY'] = gdp['DATA_VALUE'].pct_change(4) * 100
-        yoy = gdp['YoY'].dropna()
-        result['gdp_yoy'] = yoy.iloc[-1] if not yoy.empty else None
-    except Exception:
-        result['gdp_yoy'] = None
+def _render_key_sentences(title, sentences, color):
+    items = ''.join(
+        f'<li style="margin-bottom: 8px;">{html.escape(" ".join(sentence.split())[:220])}</li>' for sentence, _, _ in sentences
+    ) or '<li>해당 문장 없음</li>'
+    st.markdown(
+        f'<div style="background:#1E1E2E;border-left:4px solid {color};border-radius:12px;padding:14px 16px;"><p style="margin:0 0 8px 0;color:{color};font-weight:700;">{title}</p><ul style="margin:0;padding-left:18px;color:#CFD8DC;font-size:0.88rem;">{items}</ul></div>',
+        unsafe_allow_html=True,
+    )
 
-    try:
-        fx = pd.read_csv(os.path.join(base_path, 'exchange_rates', 'usd_krw.csv'))
-        fx['DATA_VALUE'] = pd.to_numeric(fx['DATA_VALUE'], errors='coerce')
-        values = fx['DATA_VALUE'].dropna()
-        result['usd_krw'] = values.iloc[-1] if not values.empty else None
-    except Exception:
-        result['usd_krw'] = None
 
-    try:
-        hc = pd.read_csv(os.path.join(base_path, 'household_debt', 'household_credit.csv'))
-        hc['DATA_VALUE'] = pd.to_numeric(hc['DATA_VALUE'], errors='coerce')
-        values = hc['DATA_VALUE'].dropna()
-        result['household_credit'] = values.iloc[-1] if not values.empty else None
-    except Exception:
-        result['household_credit'] = None
+def _render_metric_card(title, value, color):
+    st.markdown(
+        f'<div style="background: linear-gradient(145deg, #1E1E2E 0%, #1B263B 100%); border-left: 4px solid {color}; padding: 16px; border-radius: 12px; min-height: 120px; box-shadow: 0 6px 20px rgba(0,0,0,0.25);"><p style="margin: 0; color: #90A4AE; font-size: 0.82rem;">{title}</p><h3 style="margin: 10px 0 0 0; color: #E0E0E0; font-size: 1.8rem;">{value}</h3></div>',
+        unsafe_allow_html=True,
+    )
+
+
+def _load_macro_data(meeting_date_str: str) -> dict:
+    """Load the latest macro indicators from the aligned indicator panel."""
+    keys = ['base_rate', 'base_rate_prev', 'cpi_yoy', 'gdp_yoy', 'usd_krw', 'household_credit', 'ktb_3y']
+    result = {key: None for key in keys}
 
     try:
-        ktb = pd.read_csv(os.path.join(base_path, 'bond_yields', 'ktb_3y.csv'))
-        ktb['DATA_VALUE'] = pd.to_numeric(ktb['DATA_VALUE'], errors='coerce')
-        values = ktb['DATA_VALUE'].dropna()
-        result['ktb_3y'] = values.iloc[-1] if not values.empty else None
+        panel = PanelStore().load('daily')
     except Exception:
-        result['ktb_3y'] = None
-
-    if meeting_date_str:
         return result
+
+    for key in keys:
+        column = 'base_rate' if key == 'base_rate_prev' else key
+        if column not in panel:
+            continue
+        values = panel.latest(column, 2)
+        if key == 'base_rate_prev':
+            result[key] = values[-2] if len(values) > 1 else None
+        else:
+            result[key] = values[-1] if len(values) else None
+
     return result
 
 
@@ -586,7 +582,11 @@ def render_analysis_view(row, previous_row=None):
         _render_asset_card('🏘️', '부동산 (Real Estate)', real_estate_outlook, '#FFC107', ['서울·수도권: 공급부족 우려로 강세', '지방: 미분양 누적으로 약세 지속', '금리 인하기 진입 시 수도권 자극 우려'])
 
     st.markdown('## Sentence Tone Distribution')
+    scored_sentences = _load_scored_sentences(str(row.get('meeting_date_str') or ''))
     sentence_tones = _extract_sentence_tones(row)
+    if not sentence_tones and scored_sentences:
+        analyzer = _get_tone_analyzer()
+        sentence_tones = [float(analyzer.calculate_tone_index(h, d)) for _, h, d in scored_sentences]
     if sentence_tones:
         hist = go.Figure(go.Histogram(x=sentence_tones, nbinsx=20, marker_color='#64B5F6', opacity=0.85))
         hist.update_layout(template='plotly_dark', paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', height=320, xaxis_title='Sentence Tone Score', yaxis_title='Count', bargap=0.05)
@@ -594,6 +594,15 @@ def render_analysis_view(row, previous_row=None):
     else:
         st.info('문장 단위 톤 분포 데이터가 없어 히스토그램을 표시하지 않습니다.')
 
+    if scored_sentences:
+        st.markdown('## Key Sentences')
+        ranked = sorted(scored_sentences, key=lambda item: item[1] - item[2])
+        k1, k2 = st.columns(2)
+        with k1:
+            _render_key_sentences('매파 문장 (Hawkish)', [item for item in ranked[::-1][:3] if item[1] > item[2]], '#EF5350')
+        with k2:
+            _render_key_sentences('비둘기파 문장 (Dovish)', [item for item in ranked[:3] if item[2] > item[1]], '#42A5F5')
+
     st.markdown('---')
     st.markdown(
         '<div style="background-color: #1E1E2E; border-radius: 10px; padding: 16px; border: 1px solid rgba(255,255,255,0.08);"><p style="margin: 0; color: #90A4AE; font-size: 0.88rem;">본 리포트는 텍스트 기반 정량 분석 결과이며 투자 판단의 직접적 근거로 사용될 수 없습니다.</p></div>',
@@ -5,12 +5,40 @@ import pandas as pd
 import plotly.graph_objects as go
 import streamlit as st
 
+from src.data.compute_graph import get_market_graph
 from src.models.expectation_divergence import ExpectationDivergenceAnalyzer
+from src.models.taylor_scenarios import TaylorScenarioEngine
+from src.models.taylor_sweep import TaylorRuleSweep
 from src.models.term_premium import TermPremiumAnalyzer
 from src.taylor_rule import ExtendedTaylorRule
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 
+SHARED_GRAPH_NODES = [
+    "base_rate.monthly_last",
+    "ktb_3y.daily",
+    "ktb_10y.daily",
+    "implied_policy_rate",
+    "rates.monthly",
+    "tone.meetings",
+]
+
+SWEEP_RANGES = {
+    "alpha": (0.0, 2.0),
+    "beta": (0.0, 2.0),
+    "r_star": (0.0, 6.0),
+    "pi_star": (0.0, 6.0),
+    "gamma": (0.0, 1.5),
+    "delta": (0.0, 1.5),
+    "rho": (0.0, 0.99),
+}
+SWEEP_METRIC_LABELS = {
+    "latest_gap": "Latest Gap (%p)",
+    "latest_taylor_rate": "Latest Taylor Rate (%)",
+    "rmse": "RMSE vs Base Rate",
+    "directional_accuracy": "Directional Accuracy",
+}
+
 
 def _chart_layout(title, y_title):
     return dict(
@@ -148,6 +176,57 @@ def create_expectation_chart(df):
     return fig
 
 
+def create_sensitivity_heatmap(surface, x_param, y_param, metric):
+    label = SWEEP_METRIC_LABELS.get(metric, metric)
+    diverging = metric == "latest_gap"
+    fig = go.Figure(
+        data=go.Heatmap(
+            z=surface.to_numpy(),
+            x=surface.columns.to_numpy(),
+            y=surface.index.to_numpy(),
+            colorscale="RdBu_r" if diverging else "Viridis",
+            zmid=0.0 if diverging else None,
+            colorbar=dict(title=label),
+            hovertemplate=f"{x_param}: %{{x:.2f}}<br>{y_param}: %{{y:.2f}}<br>{label}: %{{z:.3f}}<extra></extra>",
+        )
+    )
+    fig.update_layout(
+        title=f"<b>Sensitivity Surface: {label}</b>",
+        template="plotly_dark",
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        xaxis=dict(title=x_param, color="white"),
+        yaxis=dict(title=y_param, color="white"),
+        height=500,
+    )
+    return fig
+
+
+def create_fan_chart(result, history_months=36):
+    history = result.history.tail(history_months)
+    bands = result.quantiles
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=history["Date"], y=history["Base_Rate"], name="Actual Base Rate", line=dict(color="#CFD8DC", width=2, dash="dot")))
+    fig.add_trace(go.Scatter(x=history["Date"], y=history["Taylor_Rate"], name="Taylor Rate (History)", line=dict(color="#00E676", width=3)))
+
+    for lower, upper, opacity in (("q05", "q95", 0.15), ("q25", "q75", 0.3)):
+        fig.add_trace(go.Scatter(x=bands.index, y=bands[upper], mode="lines", line=dict(width=0), showlegend=False, hoverinfo="skip"))
+        fig.add_trace(
+            go.Scatter(
+                x=bands.index,
+                y=bands[lower],
+                mode="lines",
+                line=dict(width=0),
+                fill="tonexty",
+                fillcolor=f"rgba(0, 230, 118, {opacity})",
+                name=f"{lower[1:]}-{upper[1:]}% Band",
+            )
+        )
+    fig.add_trace(go.Scatter(x=bands.index, y=bands["q50"], name="Median Path", line=dict(color="#00E676", width=2, dash="dash")))
+    fig.update_layout(_chart_layout("Taylor Rate Scenario Fan Chart", "Interest Rate (%)"))
+    return fig
+
+
 def render_taylor_view():
     st.markdown(
         """
@@ -192,21 +271,26 @@ def render_taylor_view():
 
     try:
         with st.spinner("Calculating Taylor models and derived analytics..."):
-            engine = ExtendedTaylorRule(alpha=alpha, beta=beta, r_star=r_star, pi_star=pi_star, gamma=gamma, delta=delta, rho=rho)
+            # Shared market series are loaded once per data version and reused by all analyzers below.
+            graph = get_market_graph()
+            graph.evaluate(SHARED_GRAPH_NODES)
+
+            engine = ExtendedTaylorRule(alpha=alpha, beta=beta, r_star=r_star, pi_star=pi_star, gamma=gamma, delta=delta, rho=rho, graph=graph)
+            # Data-dependent inputs are cached inside the engine; only the rule stage reruns here.
             selected_result = engine.calculate(model_type=model_type)
-            extended_result = engine.calculate(model_type="extended")
+            extended_result = selected_result if model_type == "extended" else engine.calculate(model_type="extended")
 
-            term_analyzer = TermPremiumAnalyzer()
+            term_analyzer = TermPremiumAnalyzer(graph=graph)
             term_simple = term_analyzer.calculate_simple()
             term_model = term_analyzer.calculate_expectations()
             term_summary = term_analyzer.get_summary()
 
-            exp_analyzer = ExpectationDivergenceAnalyzer()
+            exp_analyzer = ExpectationDivergenceAnalyzer(graph=graph)
             divergence_df = exp_analyzer.calculate_divergence()
             surprise_df = exp_analyzer.get_surprise_events()
 
-        tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs(
-            ["Taylor Rule Analysis", "Financial Stability", "Term Premium", "Market Expectations", "Time Series", "Correlation"]
+        tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8 = st.tabs(
+            ["Taylor Rule Analysis", "Financial Stability", "Term Premium", "Market Expectations", "Time Series", "Correlation", "Sensitivity", "Scenarios"]
         )
 
         with tab1:
@@ -535,6 +619,74 @@ def render_taylor_view():
             else:
                 st.warning("\ub370\uc774\ud130\uac00 \ubd80\uc871\ud558\uc5ec \uc0c1\uad00\ubd84\uc11d\uc744 \uc218\ud589\ud560 \uc218 \uc5c6\uc2b5\ub2c8\ub2e4.")
 
+        with tab7:
+            st.markdown("""
+            두 파라미터를 격자로 동시에 변화시켰을 때 테일러 준칙 결과가 어떻게 달라지는지 보여줍니다.
+            나머지 파라미터는 현재 설정값으로 고정됩니다.
+            """)
+            col_x, col_y, col_metric = st.columns(3)
+            param_names = list(SWEEP_RANGES)
+            with col_x:
+                x_param = st.selectbox("X Parameter", param_names, index=0)
+            with col_y:
+                y_param = st.selectbox("Y Parameter", [p for p in param_names if p != x_param], index=0)
+            with col_metric:
+                metric = st.selectbox(
+                    "Metric",
+                    list(SWEEP_METRIC_LABELS),
+                    format_func=lambda name: SWEEP_METRIC_LABELS[name],
+                )
+
+            grid = {name: np.linspace(*SWEEP_RANGES[name], 21) for name in (x_param, y_param)}
+            sweep_result = TaylorRuleSweep(model_type=model_type, engine=engine).run(grid)
+            surface = sweep_result.surface(x_param, y_param, metric)
+            st.plotly_chart(create_sensitivity_heatmap(surface, x_param, y_param, metric), use_container_width=True)
+
+        with tab8:
+            st.markdown("""
+            인플레이션·GDP 갭·환율·신용 요인을 VAR(1)로 모형화하여 수만 개의 미래 경로를 시뮬레이션하고,
+            선택한 테일러 준칙과 금리 평활화(rho)를 적용한 적정 금리의 분포를 팬차트로 보여줍니다.
+            """)
+            col_h, col_n, col_m = st.columns(3)
+            with col_h:
+                horizon = st.slider("Horizon (months)", 6, 36, 24, 6)
+            with col_n:
+                n_paths = st.selectbox("Simulated Paths", [5000, 20000, 50000], index=1)
+            with col_m:
+                shock_method = st.radio("Shock Method", ["bootstrap", "var"], horizontal=True)
+
+            col_s1, col_s2, col_s3, col_s4 = st.columns(4)
+            with col_s1:
+                shock_inflation = st.number_input("Inflation Shock (%p)", -3.0, 3.0, 0.0, 0.25)
+            with col_s2:
+                shock_output = st.number_input("Output Gap Shock (%p)", -3.0, 3.0, 0.0, 0.25)
+            with col_s3:
+                shock_credit = st.number_input("Credit Shock", -1.0, 1.0, 0.0, 0.1)
+            with col_s4:
+                shock_fx = st.number_input("FX Shock", -1.0, 1.0, 0.0, 0.1)
+
+            scenario = TaylorScenarioEngine(engine=engine).simulate(
+                model_type=model_type,
+                horizon=horizon,
+                n_paths=n_paths,
+                method=shock_method,
+                shocks={"inflation": shock_inflation, "output_gap": shock_output, "credit": shock_credit, "fx": shock_fx},
+            )
+            st.plotly_chart(create_fan_chart(scenario), use_container_width=True)
+
+            end_band = scenario.quantiles.iloc[-1]
+            prob_above = float(scenario.probability_above(scenario.last_base_rate).iloc[-1])
+            st.markdown(
+                f"""
+                <div style="padding: 16px; background-color: #1a2332; border-radius: 10px; border-left: 4px solid #00E676; margin-top: 10px;">
+                    <p style="color: #E0E0E0; line-height: 1.8;">
+                        <b>{horizon}개월 후 중앙값:</b> {end_band['q50']:.2f}% (90% 구간 {end_band['q05']:.2f}% ~ {end_band['q95']:.2f}%)<br>
+                        <b>현재 기준금리({scenario.last_base_rate:.2f}%) 상회 확률:</b> {prob_above:.0%}
+                    </p>
+                </div>
+                """,
+                unsafe_allow_html=True,
+            )
 
     except Exception as exc:
         st.error(f"Failed to render Taylor view: {exc}")
@@ -0,0 +1,30 @@
+import math
+
+from src.models.backtest import WalkForwardBacktester
+
+
+def verify_walk_forward():
+    print("Verifying walk-forward backtest summary...")
+
+    result = WalkForwardBacktester().run_walk_forward(models=["standard", "extended"], n_jobs=1)
+    summary = result["summary"]
+    print(summary.to_string(index=False))
+
+    if summary.empty:
+        print("FAIL: Empty walk-forward summary.")
+        return False
+
+    ok = True
+    for _, row in summary.iterrows():
+        pvalue = row["granger_pvalue_lag2"]
+        if not math.isfinite(pvalue):
+            print(f"FAIL: granger_pvalue_lag2 is not finite for {row['model_type']}: {pvalue}")
+            ok = False
+
+    if ok:
+        print("SUCCESS: Aggregate Granger p-values are finite.")
+    return ok
+
+
+if __name__ == "__main__":
+    raise SystemExit(0 if verify_walk_forward() else 1)